@@ -326,6 +326,23 @@ class HistoricalBinanceClient:
 
     def __init__(self, frames: Dict[str, Dict[str, pd.DataFrame]]) -> None:
         self._frames = frames
+        # Replay reads the same frames on every step, so convert them to
+        # contiguous arrays once and serve slices instead of re-selecting
+        # columns through pandas each call.
+        self._timestamps: Dict[str, Dict[str, np.ndarray]] = {
+            symbol: {
+                interval: df["timestamp"].to_numpy(dtype=np.int64)
+                for interval, df in interval_frames.items()
+            }
+            for symbol, interval_frames in frames.items()
+        }
+        self._rows: Dict[str, Dict[str, np.ndarray]] = {
+            symbol: {
+                interval: np.ascontiguousarray(df[KLINE_COLUMNS].to_numpy())
+                for interval, df in interval_frames.items()
+            }
+            for symbol, interval_frames in frames.items()
+        }
         self._current_timestamp_ms: Optional[int] = None
         self._indices: Dict[str, Dict[str, Optional[int]]] = {
             symbol: {interval: None for interval in intervals}
@@ -334,9 +351,8 @@ class HistoricalBinanceClient:
 
     def set_current_timestamp(self, timestamp_ms: int) -> None:
         self._current_timestamp_ms = timestamp_ms
-        for symbol, interval_frames in self._frames.items():
-            for interval, df in interval_frames.items():
-                timestamps = df["timestamp"].to_numpy(dtype=np.int64)
+        for symbol, interval_timestamps in self._timestamps.items():
+            for interval, timestamps in interval_timestamps.items():
                 idx = np.searchsorted(timestamps, timestamp_ms, side="right") - 1
                 if 0 <= idx < len(timestamps):
                     self._indices[symbol][interval] = int(idx)
@@ -349,10 +365,8 @@ class HistoricalBinanceClient:
         idx = self._indices[symbol][interval]
         if idx is None:
             return []
-        df = self._frames[symbol][interval]
         start_idx = max(0, idx - max(0, limit - 1))
-        subset = df.iloc[start_idx : idx + 1]
-        return subset[KLINE_COLUMNS].values.tolist()
+        return self._rows[symbol][interval][start_idx : idx + 1].tolist()
 
     def futures_open_interest_hist(self, symbol: str, period: str, limit: int = 30) -> List[Dict[str, float]]:
         return []
@@ -586,7 +600,7 @@ def main() -> None:
         time_holder["value"] = int(timestamp_ms)
         historical_client.set_current_timestamp(int(timestamp_ms))
         bot.iteration_counter += 1
-        bot.current_iteration_messages = []
+        bot.clear_iteration_messages()
 
         bot.check_stop_loss_take_profit()
         prompt = bot.format_prompt_for_deepseek()
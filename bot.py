@@ -15,15 +15,19 @@ Refactored Architecture:
 """
 from __future__ import annotations
 
+import atexit
+import cProfile
+import queue
+import sys
 import threading
 import time
 import logging
+import logging.handlers
 import math
-from typing import Any, Dict, List, Optional
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import pandas as pd
-from colorama import Fore
-import requests
 
 # ───────────────────────── LOGGING SETUP ─────────────────────────
 logging.basicConfig(
@@ -36,11 +40,12 @@ import config.settings as _config_settings
 from config.settings import (
     LLM_API_KEY, LLM_MODEL_NAME, LLM_TEMPERATURE, LLM_MAX_TOKENS,
     LLM_THINKING_PARAM, LLM_API_BASE_URL, LLM_API_TYPE,
-    TRADING_RULES_PROMPT, TELEGRAM_BOT_TOKEN, TELEGRAM_CHAT_ID,
+    TRADING_RULES_PROMPT, TELEGRAM_BOT_TOKEN, TELEGRAM_CHAT_ID, TELEGRAM_SIGNALS_ENABLED,
     START_CAPITAL, CHECK_INTERVAL, INTERVAL, SYMBOLS,
     SYMBOL_TO_COIN, COIN_TO_SYMBOL, TAKER_FEE_RATE, MAKER_FEE_RATE,
     STATE_CSV, STATE_JSON, TRADES_CSV, DECISIONS_CSV,
     MESSAGES_CSV, MESSAGES_RECENT_CSV, MAX_RECENT_MESSAGES, STATE_COLUMNS,
+    EQUITY_HISTORY_MAX_POINTS, PROFILE_EVERY, PROFILE_DIR,
     log_system_prompt_info, BACKPACK_API_BASE_URL, MARKET_DATA_BACKEND,
     EMA_LEN, RSI_LEN, MACD_FAST, MACD_SLOW, MACD_SIGNAL,
     OPENROUTER_API_KEY, SYSTEM_PROMPT_SOURCE, describe_system_prompt_source,
@@ -50,6 +55,7 @@ from config.settings import (
     RISK_FREE_RATE,
     get_effective_tradebot_loop_enabled,
     BACKPACK_API_PUBLIC_KEY, BACKPACK_API_SECRET_SEED, BACKPACK_API_WINDOW_MS,
+    MARKET_DATA_WS_ENABLED,
 )
 from config import get_effective_coin_universe, resolve_symbol_for_coin
 
@@ -97,7 +103,7 @@ from core.state import (
     get_iteration_messages, get_equity_history, get_iteration_counter,
     increment_iteration_counter, clear_iteration_messages, reset_state,
     set_last_btc_price, get_last_btc_price, escape_markdown,
-    increment_invocation_count,
+    increment_invocation_count, trim_equity_history,
     load_state as _core_load_state,
     save_state as _core_save_state,
     risk_control_state as _risk_control_state,
@@ -124,18 +130,20 @@ _telegram_command_handler: Optional[TelegramCommandHandler] = None
 # ───────────────────────── STATE I/O ─────────────────────────
 from core.persistence import (
     load_state_from_json, save_state_to_json, init_csv_files_for_paths,
+    load_equity_history_from_csv,
 )
 
 # ───────────────────────── NOTIFICATIONS ─────────────────────────
 from notifications.logging import (
-    log_ai_message as _log_ai_message,
+    enqueue_ai_message as _enqueue_ai_message,
     notify_error as _notify_error,
 )
 from notifications.telegram import (
-    send_telegram_message as _send_telegram_message,
+    enqueue_telegram_message as _enqueue_telegram_message,
     create_daily_loss_limit_notify_callback,
 )
 from notifications.telegram_commands import (
+    TelegramCommand,
     TelegramCommandHandler,
     create_command_handler,
     process_telegram_commands,
@@ -172,12 +180,19 @@ from llm.prompt import (
     fetch_market_data as _fetch_market_data,
     format_prompt_for_deepseek as _format_prompt,
     collect_prompt_market_data as _collect_prompt_market_data,
+    prompt_fingerprint,
 )
-from llm.client import call_deepseek_api
+from llm.client import call_deepseek_api, get_llm_session
 from llm.parser import parse_llm_json_decisions, recover_partial_decisions
+from utils.json_codec import json_dumps, json_loads
 
 # For test compatibility - expose internal helpers
-from llm.client import _recover_partial_decisions, _log_llm_decisions
+from llm.client import (
+    _recover_partial_decisions,
+    _log_llm_decisions,
+    _build_request_headers,
+    _build_system_message,
+)
 
 
 def collect_prompt_market_data(symbol: str):
@@ -185,20 +200,7 @@ def collect_prompt_market_data(symbol: str):
     return _collect_prompt_market_data(symbol, get_market_data_client)
 
 # Interval mapping for test compatibility
-_INTERVAL_TO_SECONDS = {
-    "1m": 60,
-    "3m": 180,
-    "5m": 300,
-    "15m": 900,
-    "30m": 1800,
-    "1h": 3600,
-    "2h": 7200,
-    "4h": 14400,
-    "6h": 21600,
-    "8h": 28800,
-    "12h": 43200,
-    "1d": 86400,
-}
+from config.settings import _INTERVAL_TO_SECONDS
 
 # ───────────────────────── EXECUTION ─────────────────────────
 from execution.executor import TradeExecutor
@@ -206,6 +208,7 @@ from execution.routing import check_stop_loss_take_profit_for_positions, route_l
 from exchange.base import CloseResult, AccountSnapshot
 
 # ───────────────────────── DISPLAY ─────────────────────────
+from display.console import ITERATION_PREFIX, ITERATION_RULE
 from display.portfolio import (
     log_portfolio_state as _log_portfolio_state,
     display_portfolio_summary as _display_portfolio_summary,
@@ -214,8 +217,10 @@ from display.portfolio import (
 # ───────────────────────── TRADING LOOP (for test compatibility) ─────────────────────────
 from core.trading_loop import (
     log_trade, log_ai_decision, record_iteration_message, sleep_with_countdown,
+    sleep_until_next_check,
     execute_entry as _tl_execute_entry, execute_close as _tl_execute_close,
     check_stop_loss_take_profit as _tl_check_sltp,
+    fetch_position_prices,
 )
 
 
@@ -368,23 +373,54 @@ def _get_binance_futures_snapshot() -> Optional[Dict[str, Any]]:
         return None
 
 
+# After a failed Backpack snapshot, further attempts wait out a cooldown that
+# doubles per consecutive failure (capped), so /status and /balance do not hit
+# a degraded exchange on every command.
+BACKPACK_SNAPSHOT_MAX_BACKOFF = 60.0
+_backpack_snapshot_failures = 0
+_backpack_snapshot_retry_at = 0.0
+
+
+def _record_backpack_snapshot_result(ok: bool) -> None:
+    global _backpack_snapshot_failures, _backpack_snapshot_retry_at
+    if ok:
+        _backpack_snapshot_failures = 0
+        _backpack_snapshot_retry_at = 0.0
+        return
+    _backpack_snapshot_failures += 1
+    _backpack_snapshot_retry_at = time.monotonic() + min(
+        BACKPACK_SNAPSHOT_MAX_BACKOFF, 2.0 ** _backpack_snapshot_failures
+    )
+
+
 def _get_backpack_futures_snapshot() -> Optional[Dict[str, Any]]:
     """Get account snapshot from Backpack Futures API.
 
     Uses BackpackFuturesExchangeClient.get_account_snapshot() which calls:
     - collateralQuery: For netEquity, netEquityAvailable, netEquityLocked
     - positionQuery: For positions count
+
+    Returns None without a request while backing off from earlier failures.
     """
     client = _get_backpack_account_client()
     if client is None:
         return None
 
+    if time.monotonic() < _backpack_snapshot_retry_at:
+        logging.debug(
+            "Skipping Backpack account snapshot: backing off after %d failure(s)",
+            _backpack_snapshot_failures,
+        )
+        return None
+
     try:
         snapshot = client.get_account_snapshot()
     except Exception as exc:
         logging.warning("Failed to get Backpack account snapshot: %s", exc)
+        _record_backpack_snapshot_result(False)
         return None
 
+    _record_backpack_snapshot_result(snapshot is not None)
     if snapshot is None:
         return None
 
@@ -408,6 +444,8 @@ def get_telegram_command_handler() -> Optional[TelegramCommandHandler]:
     Returns:
         TelegramCommandHandler instance if Telegram is configured, None otherwise.
         The handler is created once and reused to preserve last_update_id state.
+        It long-polls getUpdates, so poll_commands() blocks until a command
+        arrives or TelegramCommandHandler.LONG_POLL_TIMEOUT elapses.
     """
     global _telegram_command_handler
     if _telegram_command_handler is not None:
@@ -416,10 +454,60 @@ def get_telegram_command_handler() -> Optional[TelegramCommandHandler]:
     _telegram_command_handler = create_command_handler(
         bot_token=TELEGRAM_BOT_TOKEN,
         chat_id=TELEGRAM_CHAT_ID,
+        timeout=TelegramCommandHandler.LONG_POLL_TIMEOUT,
     )
     return _telegram_command_handler
 
 
+def _build_telegram_command_handlers() -> Dict[str, Any]:
+    """Build the command handler table for a batch of received commands.
+
+    Only called when a poll returns commands, so idle polls allocate nothing.
+    It is rebuilt per batch rather than cached because it captures the
+    current risk_control_state object, which load_state() may replace.
+    """
+    return create_kill_resume_handlers(
+        state=_core_state.risk_control_state,
+        positions_count_fn=lambda: len(positions),
+        positions_snapshot_fn=lambda: positions,
+        record_event_fn=log_risk_control_event,
+        bot_token=TELEGRAM_BOT_TOKEN,
+        chat_id=TELEGRAM_CHAT_ID,
+        total_equity_fn=calculate_total_equity,
+        balance_fn=lambda: balance,
+        total_margin_fn=calculate_total_margin,
+        start_capital=START_CAPITAL,
+        sortino_ratio_fn=lambda: calculate_sortino_ratio(
+            equity_history,
+            get_effective_check_interval(),
+            RISK_FREE_RATE,
+        ),
+        risk_control_enabled=RISK_CONTROL_ENABLED,
+        daily_loss_limit_enabled=DAILY_LOSS_LIMIT_ENABLED,
+        daily_loss_limit_pct=DAILY_LOSS_LIMIT_PCT,
+        account_snapshot_fn=get_live_account_snapshot,
+        execute_close_fn=execute_telegram_close,
+        update_tpsl_fn=update_telegram_tpsl,
+        get_current_price_fn=get_current_price_for_coin,
+    )
+
+
+def _process_one_poll(handler: TelegramCommandHandler) -> List[TelegramCommand]:
+    """Poll once and dispatch any received commands.
+
+    Returns:
+        The commands that were received (empty if none).
+    """
+    commands = handler.poll_commands()
+    if commands:
+        logging.info(
+            "Telegram commands received: %d command(s)",
+            len(commands),
+        )
+        process_telegram_commands(commands, command_handlers=_build_telegram_command_handlers())
+    return commands
+
+
 def poll_telegram_commands() -> None:
     """Poll and process Telegram commands.
     
@@ -441,39 +529,7 @@ def poll_telegram_commands() -> None:
         return
     
     try:
-        commands = handler.poll_commands()
-        if commands:
-            logging.info(
-                "Telegram commands received: %d command(s)",
-                len(commands),
-            )
-            # Create command handlers for Telegram commands
-            command_handlers = create_kill_resume_handlers(
-                state=_core_state.risk_control_state,
-                positions_count_fn=lambda: len(positions),
-                positions_snapshot_fn=lambda: positions,
-                record_event_fn=log_risk_control_event,
-                bot_token=TELEGRAM_BOT_TOKEN,
-                chat_id=TELEGRAM_CHAT_ID,
-                total_equity_fn=calculate_total_equity,
-                balance_fn=lambda: balance,
-                total_margin_fn=calculate_total_margin,
-                start_capital=START_CAPITAL,
-                sortino_ratio_fn=lambda: calculate_sortino_ratio(
-                    equity_history,
-                    get_effective_check_interval(),
-                    RISK_FREE_RATE,
-                ),
-                risk_control_enabled=RISK_CONTROL_ENABLED,
-                daily_loss_limit_enabled=DAILY_LOSS_LIMIT_ENABLED,
-                daily_loss_limit_pct=DAILY_LOSS_LIMIT_PCT,
-                account_snapshot_fn=get_live_account_snapshot,
-                execute_close_fn=execute_telegram_close,
-                update_tpsl_fn=update_telegram_tpsl,
-                get_current_price_fn=get_current_price_for_coin,
-            )
-            # Process commands with handlers
-            process_telegram_commands(commands, command_handlers=command_handlers)
+        _process_one_poll(handler)
     except Exception as exc:
         # Defensive: ensure command polling never breaks the main loop
         logging.error(
@@ -483,18 +539,21 @@ def poll_telegram_commands() -> None:
 
 
 # ───────────────────────── TELEGRAM COMMAND THREAD ─────────────────────────
-# Polling interval for the dedicated Telegram command thread (in seconds).
-# This is independent of the main trading loop's CHECK_INTERVAL.
-TELEGRAM_COMMAND_POLL_INTERVAL = 3
+# The command thread long-polls getUpdates, so the request itself waits for
+# new commands and there is no sleep between successful polls. A poll that
+# comes back early with nothing (network error, API error) is followed by a
+# pause so a failing endpoint is not hammered.
+TELEGRAM_COMMAND_RETRY_DELAY = 3
 
 
 def _telegram_command_loop() -> None:
     """Background thread loop for polling Telegram commands.
     
-    This thread runs independently of the main trading loop, polling for
-    Telegram commands at a shorter interval (TELEGRAM_COMMAND_POLL_INTERVAL).
-    This allows commands like /status, /kill, /resume to be processed
-    within seconds, regardless of the main trading loop's CHECK_INTERVAL.
+    This thread runs independently of the main trading loop, long-polling
+    Telegram for commands. Each getUpdates call returns as soon as a command
+    arrives, so /status, /kill, /resume are processed within a second or so
+    regardless of the main trading loop's CHECK_INTERVAL, while an idle bot
+    issues roughly one request per TelegramCommandHandler.LONG_POLL_TIMEOUT.
     
     The thread shares state with the main loop (risk_control_state, positions,
     balance) since it runs in the same process. All state modifications are
@@ -505,51 +564,17 @@ def _telegram_command_loop() -> None:
         - Network/API errors are logged but the thread continues running
         - The thread is a daemon thread, so it will exit when the main process exits
     """
-    logging.info(
-        "Telegram command thread started (poll interval: %ds)",
-        TELEGRAM_COMMAND_POLL_INTERVAL,
-    )
-    
     handler = get_telegram_command_handler()
     if handler is None:
         logging.info("Telegram command thread exiting: not configured")
         return
     
     while True:
+        started = time.monotonic()
+        commands = []
         try:
-            commands = handler.poll_commands()
+            commands = _process_one_poll(handler)
             if commands:
-                logging.info(
-                    "Telegram commands received: %d command(s)",
-                    len(commands),
-                )
-                # Create command handlers with current state
-                command_handlers = create_kill_resume_handlers(
-                    state=_core_state.risk_control_state,
-                    positions_count_fn=lambda: len(positions),
-                    positions_snapshot_fn=lambda: positions,
-                    record_event_fn=log_risk_control_event,
-                    bot_token=TELEGRAM_BOT_TOKEN,
-                    chat_id=TELEGRAM_CHAT_ID,
-                    total_equity_fn=calculate_total_equity,
-                    balance_fn=lambda: balance,
-                    total_margin_fn=calculate_total_margin,
-                    start_capital=START_CAPITAL,
-                    sortino_ratio_fn=lambda: calculate_sortino_ratio(
-                        equity_history,
-                        get_effective_check_interval(),
-                        RISK_FREE_RATE,
-                    ),
-                    risk_control_enabled=RISK_CONTROL_ENABLED,
-                    daily_loss_limit_enabled=DAILY_LOSS_LIMIT_ENABLED,
-                    daily_loss_limit_pct=DAILY_LOSS_LIMIT_PCT,
-                    account_snapshot_fn=get_live_account_snapshot,
-                    execute_close_fn=execute_telegram_close,
-                    update_tpsl_fn=update_telegram_tpsl,
-                    get_current_price_fn=get_current_price_for_coin,
-                )
-                # Process commands with handlers
-                process_telegram_commands(commands, command_handlers=command_handlers)
                 # Save state after command processing to persist any changes
                 save_state()
         except Exception as exc:
@@ -559,13 +584,143 @@ def _telegram_command_loop() -> None:
                 exc,
             )
         
-        time.sleep(TELEGRAM_COMMAND_POLL_INTERVAL)
+        if not commands:
+            remaining = TELEGRAM_COMMAND_RETRY_DELAY - (time.monotonic() - started)
+            if remaining > 0:
+                time.sleep(remaining)
+
+
+# Snapshots fetched during the running iteration, keyed by (symbol, interval).
+# The cache only exists inside _run_iteration, and entries older than the TTL
+# are refetched so prices read after the LLM call are not the pre-call ones.
+MARKET_DATA_CACHE_TTL = 10.0
+_market_data_cache: Optional[Dict[Tuple[str, str], Tuple[float, Dict[str, Any]]]] = None
 
 
 def fetch_market_data(symbol: str) -> Optional[Dict[str, Any]]:
-    """Fetch current market data for a symbol."""
+    """Fetch current market data for a symbol.
+
+    Within an iteration, repeat lookups of the same symbol (equity, SL/TP
+    checks, the BTC benchmark) reuse the snapshot fetched moments earlier.
+    """
     interval = get_effective_interval()
-    return _fetch_market_data(symbol, get_market_data_client, interval)
+    cache = _market_data_cache
+    if cache is None:
+        return _fetch_market_data(symbol, get_market_data_client, interval)
+
+    key = (symbol, interval)
+    now = time.monotonic()
+    cached = cache.get(key)
+    if cached is not None and now - cached[0] < MARKET_DATA_CACHE_TTL:
+        return cached[1]
+    data = _fetch_market_data(symbol, get_market_data_client, interval)
+    if data is not None:
+        cache[key] = (now, data)
+    return data
+
+
+# Last prices from the market data client's batched ticker endpoint, keyed
+# by symbol as (monotonic fetch time, price). Pricing N coins then costs one
+# request instead of N kline snapshots; entries expire after
+# MARKET_DATA_CACHE_TTL like the snapshot cache.
+_ticker_price_cache: Dict[str, Tuple[float, float]] = {}
+
+
+def _fresh_ticker_price(symbol: str, now: float) -> Optional[float]:
+    cached = _ticker_price_cache.get(symbol)
+    if cached is not None and now - cached[0] < MARKET_DATA_CACHE_TTL:
+        return cached[1]
+    return None
+
+
+# Binance ThreadedWebsocketManager pushing mini-ticker prices into
+# _ticker_price_cache, started by start_price_stream().
+_price_stream: Optional[Any] = None
+
+
+def _on_price_stream_message(message: Any) -> None:
+    """Store the last price from a combined-stream mini-ticker message."""
+    data = message.get("data") if isinstance(message, dict) else None
+    if not isinstance(data, dict) or data.get("e") != "24hrMiniTicker":
+        if isinstance(message, dict) and message.get("e") == "error":
+            logging.debug("Price stream error: %s", message.get("m"))
+        return
+    try:
+        price = float(data["c"])
+    except (KeyError, TypeError, ValueError):
+        return
+    _ticker_price_cache[data.get("s")] = (time.monotonic(), price)
+
+
+def start_price_stream() -> bool:
+    """Subscribe to Binance mini-ticker prices for every configured symbol.
+
+    Each push refreshes ``_ticker_price_cache``, so fetch_coin_prices() is
+    served from memory while the stream is live. If the stream stalls, its
+    entries expire after MARKET_DATA_CACHE_TTL and prices come from REST
+    again; python-binance reconnects the socket on its own. The spot stream
+    is used on purpose: the REST fallback (BinanceMarketDataClient) prices
+    from spot klines and tickers, so both sources quote the same market.
+
+    Returns:
+        True if the stream is running.
+    """
+    global _price_stream
+    if _price_stream is not None:
+        return True
+    if not MARKET_DATA_WS_ENABLED or MARKET_DATA_BACKEND != "binance":
+        return False
+    streams = sorted({f"{symbol.lower()}@miniTicker" for symbol in COIN_TO_SYMBOL.values()})
+    if not streams:
+        return False
+    try:
+        from binance import ThreadedWebsocketManager
+
+        manager = ThreadedWebsocketManager()
+        manager.start()
+        manager.start_multiplex_socket(callback=_on_price_stream_message, streams=streams)
+    except Exception as exc:
+        logging.warning("Binance price stream unavailable; using REST prices: %s", exc)
+        return False
+    _price_stream = manager
+    atexit.register(manager.stop)
+    logging.info("Binance price stream started for %d symbols", len(streams))
+    return True
+
+
+def fetch_coin_prices(coins: Iterable[str]) -> Dict[str, float]:
+    """Return the latest price for each coin, in the order of ``coins``.
+
+    Prices come from one batched ticker request when the market data client
+    supports it. Coins the batch does not cover fall back to per-symbol
+    fetch_market_data() snapshots; unresolvable or unpriced coins are omitted.
+    """
+    symbols = {coin: resolve_symbol_for_coin(coin) for coin in coins}
+    symbols = {coin: symbol for coin, symbol in symbols.items() if symbol}
+    now = time.monotonic()
+    stale = [symbol for symbol in symbols.values() if _fresh_ticker_price(symbol, now) is None]
+    get_prices = getattr(get_market_data_client(), "get_prices", None) if stale else None
+    if get_prices is not None:
+        try:
+            batch = get_prices(stale)
+        except Exception as exc:
+            logging.debug("Batched ticker prices unavailable: %s", exc)
+            batch = {}
+        if isinstance(batch, dict):
+            for symbol, price in batch.items():
+                _ticker_price_cache[symbol] = (now, price)
+
+    prices: Dict[str, float] = {}
+    missing: List[str] = []
+    for coin, symbol in symbols.items():
+        price = _fresh_ticker_price(symbol, now)
+        if price is None:
+            missing.append(coin)
+        else:
+            prices[coin] = price
+    if missing:
+        prices.update(fetch_position_prices(missing, fetch_market_data))
+    return {coin: prices[coin] for coin in symbols if coin in prices}
 
 
 def load_state() -> None:
@@ -574,27 +729,25 @@ def load_state() -> None:
     Uses core.state.load_state() as the unified entry point to ensure
     all state (including risk_control) is loaded consistently.
     """
-    global balance, iteration_counter
+    global balance, positions, iteration_counter
     _core_load_state()
-    # Sync module-level references with core.state
+    # Sync module-level references with core.state; positions is shared,
+    # not copied, so both modules see the same dict
     balance = _core_state.balance
-    positions.clear()
-    positions.update(_core_state.positions)
+    positions = _core_state.positions
     iteration_counter = _core_state.iteration_counter
 
 
 def load_equity_history() -> None:
-    """Load equity history from CSV."""
-    equity_history.clear()
-    if not STATE_CSV.exists():
-        return
-    try:
-        df = pd.read_csv(STATE_CSV)
-        if "total_equity" in df.columns:
-            values = pd.to_numeric(df["total_equity"], errors="coerce").dropna().tolist()
-            equity_history.extend(values)
-    except Exception as e:
-        logging.warning("Failed to load equity history: %s", e)
+    """Load equity history from the total_equity column of the state CSV."""
+    load_equity_history_from_csv(STATE_CSV, equity_history, EQUITY_HISTORY_MAX_POINTS)
+
+
+def _sync_core_state() -> None:
+    """Copy module-level state to core.state before it is persisted."""
+    _core_state.balance = balance
+    _core_state.positions = positions
+    _core_state.iteration_counter = iteration_counter
 
 
 def save_state() -> None:
@@ -603,17 +756,24 @@ def save_state() -> None:
     Uses core.state.save_state() as the unified entry point to ensure
     all state (including risk_control) is saved consistently.
     """
-    # Sync module-level state to core.state before saving
-    _core_state.balance = balance
-    _core_state.positions.clear()
-    _core_state.positions.update(positions)
-    _core_state.iteration_counter = iteration_counter
+    _sync_core_state()
     _core_save_state()
 
 
+def save_state_if_changed() -> None:
+    """Persist state at the end of an iteration unless nothing changed.
+
+    The write itself goes through save_state(), so anything that replaces
+    save_state() (tests, tools) also covers the end-of-iteration save.
+    """
+    _sync_core_state()
+    if _core_state.state_needs_save():
+        save_state()
+
+
 def log_ai_message(direction: str, role: str, content: str, metadata: Optional[Dict] = None) -> None:
-    """Log AI messages."""
-    _log_ai_message(
+    """Log AI messages on the background writer, off the trading path."""
+    _enqueue_ai_message(
         messages_csv=MESSAGES_CSV,
         messages_recent_csv=MESSAGES_RECENT_CSV,
         max_recent_messages=MAX_RECENT_MESSAGES,
@@ -626,8 +786,8 @@ def log_ai_message(direction: str, role: str, content: str, metadata: Optional[D
 
 
 def send_telegram_message(text: str, chat_id: Optional[str] = None, parse_mode: Optional[str] = "Markdown") -> None:
-    """Send Telegram notification."""
-    _send_telegram_message(
+    """Send Telegram notification from the background sender, off the trading path."""
+    _enqueue_telegram_message(
         bot_token=TELEGRAM_BOT_TOKEN,
         default_chat_id=TELEGRAM_CHAT_ID,
         text=text,
@@ -671,15 +831,42 @@ def calculate_total_margin() -> float:
     return calculate_total_margin_for_positions(positions.values())
 
 
+# Last priced equity as (book key, monotonic time, total). Within
+# MARKET_DATA_CACHE_TTL, for the same iteration and an unchanged balance and
+# book, it is reused, so a burst of Telegram /status or risk queries does not
+# refetch every position's price. A new iteration (a new bar in backtests)
+# always reprices, and the iteration drops the entry after the LLM step so its
+# closing equity is never the pre-call value.
+_equity_cache: Optional[Tuple[Tuple[Any, ...], float, float]] = None
+
+
+def _equity_cache_key() -> Tuple[Any, ...]:
+    return (
+        iteration_counter,
+        balance,
+        tuple(
+            (coin, pos.get("side"), pos.get("quantity"), pos.get("entry_price"), pos.get("margin"))
+            for coin, pos in positions.items()
+        ),
+    )
+
+
 def calculate_total_equity() -> float:
     """Calculate total equity."""
+    global _equity_cache
+    if not positions:
+        return balance
+    key = _equity_cache_key()
+    now = time.monotonic()
+    if _equity_cache is not None:
+        cached_key, cached_at, cached_total = _equity_cache
+        if cached_key == key and now - cached_at < MARKET_DATA_CACHE_TTL:
+            return cached_total
+
     total = balance + calculate_total_margin()
-    for coin in positions:
-        symbol = resolve_symbol_for_coin(coin)
-        if symbol:
-            data = fetch_market_data(symbol)
-            if data:
-                total += calculate_unrealized_pnl(coin, data['price'])
+    for coin, price in fetch_coin_prices(positions).items():
+        total += calculate_unrealized_pnl(coin, price)
+    _equity_cache = (key, now, total)
     return total
 
 
@@ -687,6 +874,7 @@ def register_equity_snapshot(total_equity: float) -> None:
     """Append equity to history if finite."""
     if total_equity is not None and math.isfinite(total_equity):
         equity_history.append(total_equity)
+        trim_equity_history(equity_history, EQUITY_HISTORY_MAX_POINTS)
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -715,6 +903,7 @@ def _get_executor() -> TradeExecutor:
         binance_futures_live=BINANCE_FUTURES_LIVE,
         backpack_futures_live=BACKPACK_FUTURES_LIVE,
         is_kill_switch_active=lambda: _core_state.risk_control_state.kill_switch_active,
+        telegram_signals_enabled=TELEGRAM_SIGNALS_ENABLED,
     )
 
 
@@ -1071,6 +1260,7 @@ def _update_local_state_after_close(coin: str, closed_quantity: float, current_p
     if total_quantity <= 0:
         # Position already empty, just remove it
         del positions[coin]
+        _core_state.last_hold_figures.pop(coin, None)
         save_state()
         return
     
@@ -1124,6 +1314,7 @@ def _update_local_state_after_close(coin: str, closed_quantity: float, current_p
     if remaining_quantity <= 0.0001:  # Effectively zero (handle floating point)
         # Full close - remove position
         del positions[coin]
+        _core_state.last_hold_figures.pop(coin, None)
         logging.info("Telegram /close: position %s fully closed and removed", coin)
     else:
         # Partial close - update position
@@ -1162,7 +1353,7 @@ def process_ai_decisions(
     
     # Warn about positions outside current Universe (orphaned positions)
     # These will still be managed by SL/TP but won't receive LLM decisions
-    orphaned_coins = set(positions.keys()) - set(coin_universe)
+    orphaned_coins = positions.keys() - coin_universe
     if orphaned_coins:
         logging.warning(
             "Positions exist outside current Universe and will not receive LLM decisions: %s. "
@@ -1170,21 +1361,21 @@ def process_ai_decisions(
             sorted(orphaned_coins),
         )
     
-    for coin in coin_universe:
-        if coin not in decisions:
-            continue
+    # Price every decided coin up front (one batched ticker request where the
+    # market data client supports it) instead of a round-trip per coin
+    # inside the dispatch loop.
+    decided_coins = [coin for coin in coin_universe if coin in decisions]
+    prices = fetch_coin_prices(decided_coins)
+    
+    for coin in decided_coins:
         decision = decisions[coin]
         signal = decision.get("signal", "hold")
         log_ai_decision(coin, signal, decision.get("justification", ""), decision.get("confidence", 0))
         
-        symbol = resolve_symbol_for_coin(coin)
-        if not symbol:
-            continue
-        data = fetch_market_data(symbol)
-        if not data:
+        price = prices.get(coin)
+        if price is None:
             continue
         
-        price = data["price"]
         if signal == "entry":
             if allow_entry:
                 execute_entry(coin, decision, price)
@@ -1251,32 +1442,27 @@ def call_deepseek_api(prompt: str) -> Optional[Dict[str, Any]]:
             "temperature": temperature,
             "max_tokens": LLM_MAX_TOKENS,
         }
+        if LLM_THINKING_PARAM is not None:
+            metadata["thinking"] = LLM_THINKING_PARAM
         log_ai_message("sent", "system", TRADING_RULES_PROMPT, metadata)
         log_ai_message("sent", "user", prompt, metadata)
         
         payload = {
-            "model": LLM_MODEL_NAME,
+            **metadata,
             "messages": [
-                {"role": "system", "content": TRADING_RULES_PROMPT},
+                _build_system_message(TRADING_RULES_PROMPT, LLM_MODEL_NAME, LLM_API_TYPE),
                 {"role": "user", "content": prompt},
             ],
-            "temperature": temperature,
-            "max_tokens": LLM_MAX_TOKENS,
         }
-        if LLM_THINKING_PARAM is not None:
-            payload["thinking"] = LLM_THINKING_PARAM
-        
-        headers = {"Authorization": f"Bearer {LLM_API_KEY}", "Content-Type": "application/json"}
-        if (LLM_API_TYPE or "openrouter").lower() == "openrouter":
-            headers["HTTP-Referer"] = "https://github.com/crypto-trading-bot"
         
-        response = requests.post(LLM_API_BASE_URL, headers=headers, json=payload, timeout=90)
+        headers = _build_request_headers(LLM_API_KEY, LLM_API_TYPE)
+        response = get_llm_session().post(LLM_API_BASE_URL, headers=headers, data=json_dumps(payload), timeout=90)
         
         if response.status_code != 200:
             notify_error(f"LLM API error: {response.status_code}")
             return None
         
-        result = response.json()
+        result = json_loads(response.content)
         choices = result.get("choices", [])
         if not choices:
             notify_error("LLM API returned no choices")
@@ -1312,23 +1498,137 @@ def format_prompt_for_deepseek() -> str:
     )
 
 
+# (fingerprint, execution bar open time) of the last prompt the LLM answered.
+_last_prompt_key: Optional[Tuple[str, int]] = None
+
+# The LLM call runs on a worker thread; while it is in flight the main thread
+# re-checks SL/TP for open positions at this period, so a sharp move during a
+# long completion is not left unmanaged.
+LLM_WAIT_SLTP_INTERVAL = 15.0
+
+
+def _await_llm_decisions(prompt: str) -> Optional[Dict[str, Any]]:
+    """Call the LLM, running SL/TP checks while waiting for the answer.
+
+    The call runs on a daemon thread, so Ctrl+C or exit does not wait for an
+    in-flight request to reach its timeout.
+    """
+    future: Future = Future()
+
+    def _call() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(call_deepseek_api(prompt))
+        except BaseException as exc:
+            future.set_exception(exc)
+
+    threading.Thread(target=_call, name="llm-call", daemon=True).start()
+    while True:
+        try:
+            return future.result(timeout=LLM_WAIT_SLTP_INTERVAL)
+        except FutureTimeoutError:
+            if not positions:
+                continue
+            try:
+                check_stop_loss_take_profit()
+            except Exception as exc:
+                logging.error("SL/TP check during LLM call failed: %s", exc)
+
+
+def request_trading_decisions() -> Optional[Dict[str, Any]]:
+    """Build the prompt and ask the LLM for decisions unless nothing changed.
+
+    If the prompt's market and account content matches the last answered
+    prompt within the same execution bar (the check interval can be shorter
+    than the bar), the previous answer still stands, so the API call is
+    skipped and ``None`` is returned.
+    """
+    global _last_prompt_key
+    prompt = format_prompt_for_deepseek()
+    key = None
+    bar_seconds = _INTERVAL_TO_SECONDS.get(get_effective_interval())
+    if bar_seconds:
+        now_s = int(get_current_time().timestamp())
+        key = (prompt_fingerprint(prompt), now_s - now_s % bar_seconds)
+        if key == _last_prompt_key:
+            logging.info("Market and account state unchanged since the last decision; skipping LLM call.")
+            return None
+
+    decisions = _await_llm_decisions(prompt)
+    if decisions and key is not None:
+        _last_prompt_key = key
+    return decisions
+
+
 # ═══════════════════════════════════════════════════════════════════
 # MAIN LOOP
 # ═══════════════════════════════════════════════════════════════════
 
+def _buffer_stdout_when_redirected() -> None:
+    """Let stdout batch writes when it is not a terminal.
+
+    Under docker/systemd stdout is a pipe and ``PYTHONUNBUFFERED`` makes every
+    ``print`` its own write; the console output is instead flushed once per
+    iteration. Interactive terminals keep their line buffering.
+    """
+    stream = sys.stdout
+    try:
+        if stream.isatty():
+            return
+        stream.reconfigure(line_buffering=False, write_through=False)
+    except (AttributeError, ValueError, OSError) as exc:
+        logging.debug("Leaving stdout buffering unchanged: %s", exc)
+
+
+# Seconds before the same exception type gets its traceback logged again.
+_TRACEBACK_REPEAT_INTERVAL = 600
+_last_traceback_at: Dict[type, float] = {}
+
+
+def _should_log_traceback(exc: BaseException) -> bool:
+    """Return True for the first error of a type, then at most every 10 minutes.
+
+    A flapping exchange API fails the loop the same way every minute; the
+    one-line error is still logged each time, only the traceback is thinned.
+    """
+    now = time.monotonic()
+    last = _last_traceback_at.get(type(exc))
+    if last is not None and now - last < _TRACEBACK_REPEAT_INTERVAL:
+        return False
+    _last_traceback_at[type(exc)] = now
+    return True
+
+
+def _route_logging_through_queue() -> None:
+    """Hand log records to a background thread instead of writing inline.
+
+    The root handlers (stderr from ``basicConfig``) move behind a
+    ``QueueListener`` so the trading loop only pays for an in-memory put;
+    the listener is stopped, and its queue drained, at exit.
+    """
+    root = logging.getLogger()
+    handlers = root.handlers[:]
+    if not handlers or any(isinstance(h, logging.handlers.QueueHandler) for h in handlers):
+        return
+    log_queue: queue.Queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    for handler in handlers:
+        root.removeHandler(handler)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener.start()
+    atexit.register(listener.stop)
+
+
 def main() -> None:
     """Main trading loop."""
+    _buffer_stdout_when_redirected()
+    _route_logging_through_queue()
     logging.info("Initializing Trading Bot...")
     init_csv_files_for_paths(STATE_CSV, TRADES_CSV, DECISIONS_CSV, MESSAGES_CSV, MESSAGES_RECENT_CSV, STATE_COLUMNS)
     
     # Load equity history
-    if STATE_CSV.exists():
-        try:
-            df = pd.read_csv(STATE_CSV)
-            if "total_equity" in df.columns:
-                equity_history.extend(pd.to_numeric(df["total_equity"], errors="coerce").dropna().tolist())
-        except Exception:
-            pass
+    load_equity_history()
     
     load_state()
     
@@ -1336,9 +1636,9 @@ def main() -> None:
         logging.error("No LLM API key configured; expected LLM_API_KEY or OPENROUTER_API_KEY in environment.")
         return
     
-    logging.info(f"Starting capital: ${START_CAPITAL:.2f}")
+    logging.info("Starting capital: $%.2f", START_CAPITAL)
     monitoring_coins = get_effective_coin_universe()
-    logging.info(f"Monitoring: {', '.join(monitoring_coins)}")
+    logging.info("Monitoring: %s", ", ".join(monitoring_coins))
     
     # Log trading backend status
     if hyperliquid_trader.is_live:
@@ -1379,6 +1679,7 @@ def main() -> None:
     log_system_prompt_info("System prompt selected")
     logging.info("LLM model configured: %s", LLM_MODEL_NAME)
     logging.info("Market data backend: %s", MARKET_DATA_BACKEND)
+    start_price_stream()
     
     # Log risk control configuration and state
     logging.info(
@@ -1394,8 +1695,8 @@ def main() -> None:
     )
     
     # Start dedicated Telegram command polling thread
-    # This thread polls for commands every TELEGRAM_COMMAND_POLL_INTERVAL seconds,
-    # independent of the main trading loop's CHECK_INTERVAL.
+    # This thread long-polls for commands, independent of the main trading
+    # loop's CHECK_INTERVAL.
     if TELEGRAM_BOT_TOKEN and TELEGRAM_CHAT_ID:
         telegram_thread = threading.Thread(
             target=_telegram_command_loop,
@@ -1403,7 +1704,10 @@ def main() -> None:
             daemon=True,  # Thread will exit when main process exits
         )
         telegram_thread.start()
-        logging.info("Telegram command thread started (poll interval: %ds)", TELEGRAM_COMMAND_POLL_INTERVAL)
+        logging.info(
+            "Telegram command thread started (long-poll timeout: %ds)",
+            TelegramCommandHandler.LONG_POLL_TIMEOUT,
+        )
     
     while True:
         try:
@@ -1413,14 +1717,47 @@ def main() -> None:
             save_state()
             break
         except Exception as e:
-            logging.error(f"Error: {e}", exc_info=True)
+            sys.stdout.flush()
+            logging.error("Error: %s", e, exc_info=_should_log_traceback(e))
             save_state()
             time.sleep(60)
 
 
 def _run_iteration() -> None:
-    """Run single iteration."""
-    global iteration_counter
+    """Run single iteration with a fresh market-data cache."""
+    global _market_data_cache
+    _market_data_cache = {}
+    try:
+        upcoming = get_iteration_counter() + 1
+        if PROFILE_EVERY > 0 and upcoming % PROFILE_EVERY == 0:
+            _run_profiled_iteration(upcoming)
+        else:
+            _run_iteration_steps()
+    finally:
+        _market_data_cache = None
+
+
+def _run_profiled_iteration(iteration: int) -> None:
+    """Run the iteration steps under cProfile and dump the stats to PROFILE_DIR.
+
+    Only this thread is profiled: work on the price-fetch, snapshot and LLM
+    pools shows up as time spent waiting on their futures, and the closing
+    sleep as time.sleep.
+    """
+    profiler = cProfile.Profile()
+    try:
+        profiler.runcall(_run_iteration_steps)
+    finally:
+        try:
+            PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+            profiler.dump_stats(str(PROFILE_DIR / f"iteration-{iteration}.prof"))
+        except OSError as exc:
+            logging.warning("Unable to write iteration profile: %s", exc)
+
+
+def _run_iteration_steps() -> None:
+    """Run the steps of a single iteration."""
+    global iteration_counter, _equity_cache
     iteration = increment_iteration_counter()
     # Keep bot.iteration_counter in sync with core.state.iteration_counter
     iteration_counter = iteration
@@ -1433,7 +1770,7 @@ def _run_iteration() -> None:
             "TRADEBOT_LOOP_ENABLED is false; bot loop paused. Sleeping %ss before next check.",
             check_interval,
         )
-        sleep_with_countdown(check_interval)
+        sleep_until_next_check(check_interval)
         return
     
     # Capture current check interval for early retry logic (e.g., Binance client unavailable)
@@ -1448,12 +1785,12 @@ def _run_iteration() -> None:
             return
     
     # Header
-    print(f"\n{Fore.CYAN}{'='*20}")
-    print(f"{Fore.CYAN}Iteration {iteration} - {get_current_time().strftime('%Y-%m-%d %H:%M:%S')}")
-    print(f"{Fore.CYAN}{'='*20}\n")
+    print(f"\n{ITERATION_RULE}")
+    print(f"{ITERATION_PREFIX} {iteration} - {get_current_time().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"{ITERATION_RULE}\n")
     
     # Note: Telegram command polling is now handled by a dedicated background thread
-    # (_telegram_command_loop) which polls every TELEGRAM_COMMAND_POLL_INTERVAL seconds.
+    # (_telegram_command_loop) which long-polls getUpdates.
     # This allows commands to be processed within seconds, independent of CHECK_INTERVAL.
     
     # Risk control check (before market data and LLM calls)
@@ -1489,7 +1826,7 @@ def _run_iteration() -> None:
     
     # Get AI decisions
     logging.info("Requesting trading decisions...")
-    decisions = call_deepseek_api(format_prompt_for_deepseek())
+    decisions = request_trading_decisions()
     if decisions:
         process_ai_decisions(
             decisions,
@@ -1498,12 +1835,20 @@ def _run_iteration() -> None:
             kill_switch_reason=_core_state.risk_control_state.kill_switch_reason,
         )
     
+    # Price the book once for both the summary and the CSV row, so they agree
+    # and positions are not fetched twice. Prices may have moved during the LLM
+    # call, so the equity priced before it is not reused.
+    _equity_cache = None
+    closing_equity = calculate_total_equity()
+    closing_margin = calculate_total_margin_for_positions(positions.values())
+
     # Display summary (terminal only, no Telegram push)
     # Users can query status via /status command instead
     _display_portfolio_summary(
-        positions, balance, equity_history, calculate_total_equity,
-        lambda: calculate_total_margin_for_positions(positions.values()),
-        lambda eq: equity_history.append(eq) if eq and math.isfinite(eq) else None,
+        positions, balance, equity_history,
+        lambda: closing_equity,
+        lambda: closing_margin,
+        lambda eq: register_equity_snapshot(eq) if eq else None,
         lambda msg: None,  # Don't record for Telegram push
     )
     
@@ -1511,19 +1856,20 @@ def _run_iteration() -> None:
     _log_portfolio_state(
         positions,
         balance,
-        calculate_total_equity,
-        lambda: calculate_total_margin_for_positions(positions.values()),
-        lambda: fetch_market_data("BTCUSDT").get("price") if fetch_market_data("BTCUSDT") else None,
+        lambda: closing_equity,
+        lambda: closing_margin,
+        lambda: fetch_coin_prices(["BTC"]).get("BTC"),
         get_current_time,
     )
-    save_state()
+    save_state_if_changed()
     
     # Re-read effective check interval at the end of the iteration so that
     # any /config set TRADEBOT_INTERVAL changes applied during this iteration
     # are reflected immediately in the next sleep duration.
     check_interval = get_effective_check_interval()
-    logging.info(f"Waiting {check_interval}s...")
-    sleep_with_countdown(check_interval)
+    sys.stdout.flush()
+    logging.info("Waiting %ss...", check_interval)
+    sleep_until_next_check(check_interval)
 
 
 if __name__ == "__main__":
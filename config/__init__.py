@@ -34,6 +34,7 @@ from config.settings import (
     TELEGRAM_BOT_TOKEN,
     TELEGRAM_CHAT_ID,
     TELEGRAM_SIGNALS_CHAT_ID,
+    TELEGRAM_SIGNALS_ENABLED,
     HYPERLIQUID_WALLET_ADDRESS,
     HYPERLIQUID_PRIVATE_KEY,
     BACKPACK_API_PUBLIC_KEY,
@@ -94,6 +95,7 @@ from config.settings import (
     RISK_FREE_RATE,
     # CSV files
     STATE_CSV,
+    EQUITY_HISTORY_MAX_POINTS,
     STATE_JSON,
     TRADES_CSV,
     DECISIONS_CSV,
@@ -121,6 +123,7 @@ __all__ = [
     "TELEGRAM_BOT_TOKEN",
     "TELEGRAM_CHAT_ID",
     "TELEGRAM_SIGNALS_CHAT_ID",
+    "TELEGRAM_SIGNALS_ENABLED",
     "HYPERLIQUID_WALLET_ADDRESS",
     "HYPERLIQUID_PRIVATE_KEY",
     "BACKPACK_API_PUBLIC_KEY",
@@ -172,6 +175,7 @@ __all__ = [
     "TAKER_FEE_RATE",
     "RISK_FREE_RATE",
     "STATE_CSV",
+    "EQUITY_HISTORY_MAX_POINTS",
     "STATE_JSON",
     "TRADES_CSV",
     "DECISIONS_CSV",
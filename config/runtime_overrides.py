@@ -284,11 +284,8 @@ def validate_override_value(key: str, value: Any) -> tuple[bool, Optional[str]]:
 
 def _interval_sort_key(interval: str) -> int:
     """Sort key for intervals to order them by duration."""
-    _INTERVAL_TO_SECONDS = {
-        "1m": 60, "3m": 180, "5m": 300, "15m": 900, "30m": 1800,
-        "1h": 3600, "2h": 7200, "4h": 14400, "6h": 21600, "8h": 28800,
-        "12h": 43200, "1d": 86400,
-    }
+    from config.settings import _INTERVAL_TO_SECONDS
+
     return _INTERVAL_TO_SECONDS.get(interval, 0)
 
 
@@ -11,7 +11,8 @@ import os
 import logging
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 from dotenv import load_dotenv
 
@@ -360,6 +361,10 @@ OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY", "")
 TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN", "")
 TELEGRAM_CHAT_ID = os.getenv("TELEGRAM_CHAT_ID", "")
 TELEGRAM_SIGNALS_CHAT_ID = os.getenv("TELEGRAM_SIGNALS_CHAT_ID", "")
+# Signals fall back to the main chat; without a token and a chat they are dropped.
+TELEGRAM_SIGNALS_ENABLED = bool(
+    TELEGRAM_BOT_TOKEN and (TELEGRAM_SIGNALS_CHAT_ID or TELEGRAM_CHAT_ID).strip()
+)
 TELEGRAM_ADMIN_USER_ID = os.getenv("TELEGRAM_ADMIN_USER_ID", "")
 
 HYPERLIQUID_WALLET_ADDRESS = os.getenv("HYPERLIQUID_WALLET_ADDRESS", "")
@@ -372,6 +377,12 @@ BACKPACK_API_WINDOW_MS = _parse_int_env(
     os.getenv("BACKPACK_API_WINDOW_MS"),
     default=5000,
 )
+# Stream Binance mini-ticker prices over a WebSocket into the bot's ticker
+# price cache (MARKET_DATA_BACKEND=binance only); REST remains the fallback.
+MARKET_DATA_WS_ENABLED = _parse_bool_env(
+    os.getenv("MARKET_DATA_WS_ENABLED"),
+    default=False,
+)
 
 # ───────────────────────── TRADING CONFIG ─────────────────────────
 _TRADING_CFG: TradingConfig = load_trading_config_from_env()
@@ -538,7 +549,9 @@ TRADING_RULES_PROMPT = _load_system_prompt()
 
 # ───────────────────────── INTERVAL CONFIG ─────────────────────────
 DEFAULT_INTERVAL = "15m"
-_INTERVAL_TO_SECONDS = {
+# Read-only so the single shared mapping can be imported by other modules
+# (bot, market data clients, runtime overrides) instead of being re-declared.
+_INTERVAL_TO_SECONDS: Mapping[str, int] = MappingProxyType({
     "1m": 60,
     "3m": 180,
     "5m": 300,
@@ -551,7 +564,7 @@ _INTERVAL_TO_SECONDS = {
     "8h": 28800,
     "12h": 43200,
     "1d": 86400,
-}
+})
 
 
 def _load_trade_interval(default: str = DEFAULT_INTERVAL) -> str:
@@ -917,6 +930,17 @@ DECISIONS_CSV = DATA_DIR / "ai_decisions.csv"
 MESSAGES_CSV = DATA_DIR / "ai_messages.csv"
 MESSAGES_RECENT_CSV = DATA_DIR / "ai_messages_recent.csv"
 MAX_RECENT_MESSAGES = 100
+# Equity snapshots read back from STATE_CSV at startup (newest rows); <= 0 reads all.
+EQUITY_HISTORY_MAX_POINTS = _parse_int_env(
+    os.getenv("EQUITY_HISTORY_MAX_POINTS"),
+    default=20000,
+)
+# Profile every Nth iteration with cProfile into PROFILE_DIR; <= 0 disables it.
+PROFILE_EVERY = _parse_int_env(
+    os.getenv("TRADEBOT_PROFILE_EVERY"),
+    default=0,
+)
+PROFILE_DIR = DATA_DIR / "profiles"
 STATE_COLUMNS = [
     'timestamp',
     'total_balance',
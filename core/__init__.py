@@ -19,6 +19,7 @@ from core.state import (
     reset_state,
     load_equity_history,
     register_equity_snapshot,
+    trim_equity_history,
     update_balance,
     set_balance,
     get_balance,
@@ -77,6 +78,7 @@ __all__ = [
     "reset_state",
     "load_equity_history",
     "register_equity_snapshot",
+    "trim_equity_history",
     "update_balance",
     "set_balance",
     "get_balance",
@@ -6,7 +6,9 @@ such as Sortino ratio, PnL calculations, and position metrics.
 """
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, Optional
+import math
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import numpy as np
 
@@ -15,6 +17,99 @@ import numpy as np
 DEFAULT_RISK_FREE_RATE: float = 0.0
 
 
+class _ReturnMoments:
+    """Running sums of per-period returns for one growing equity list.
+
+    The equity history only ever grows by appends between reloads, so the
+    moments are extended with the new tail instead of being rebuilt from the
+    whole history every iteration. A different list, a shorter one (a
+    clear/reload or trim), a replaced first or last seen value, or a new
+    risk-free rate triggers a full rebuild. These checks are O(1) per update;
+    an in-place edit of a value in the middle of the seen history is not
+    detected, and nothing in the bot makes one.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._source_id: Optional[int] = None
+        self._per_period_rf = 0.0
+        self._seen = 0
+        self._first_seen: Any = None
+        self._last_seen: Any = None
+        self._base: Optional[float] = None
+        self.count = 0
+        self.sum_returns = 0.0
+        self.sum_downside_sq = 0.0
+
+    def update(self, equity_values: List[Any], per_period_rf: float) -> Tuple[int, float, float]:
+        """Bring the moments up to date with ``equity_values`` and return them."""
+        with self._lock:
+            seen = self._seen
+            if (
+                id(equity_values) != self._source_id
+                or per_period_rf != self._per_period_rf
+                or len(equity_values) < seen
+                or (seen and (
+                    equity_values[0] is not self._first_seen
+                    or equity_values[seen - 1] is not self._last_seen
+                ))
+            ):
+                self._rebuild(equity_values, per_period_rf)
+            elif len(equity_values) > seen:
+                self._extend(equity_values[seen:])
+                self._seen = len(equity_values)
+                self._last_seen = equity_values[-1]
+            return self.count, self.sum_returns, self.sum_downside_sq
+
+    def _rebuild(self, equity_values: List[Any], per_period_rf: float) -> None:
+        values = _finite_equity_array(equity_values)
+        self._source_id = id(equity_values)
+        self._per_period_rf = per_period_rf
+        self._seen = len(equity_values)
+        self._first_seen = equity_values[0] if equity_values else None
+        self._last_seen = equity_values[-1] if equity_values else None
+        self._base = float(values[-1]) if values.size else None
+        self.count, self.sum_returns, self.sum_downside_sq = _return_sums(values, per_period_rf)
+
+    def _extend(self, new_values: List[Any]) -> None:
+        for value in new_values:
+            if not isinstance(value, (int, float, np.floating)) or not math.isfinite(value):
+                continue
+            base = self._base
+            self._base = float(value)
+            if base is None or base == 0:
+                continue
+            ret = (value - base) / base
+            if not math.isfinite(ret):
+                continue
+            self.count += 1
+            self.sum_returns += ret
+            downside = min(ret - self._per_period_rf, 0.0)
+            self.sum_downside_sq += downside * downside
+
+
+_equity_return_moments = _ReturnMoments()
+
+
+def _finite_equity_array(equity_values: Iterable[float]) -> np.ndarray:
+    if isinstance(equity_values, np.ndarray) and equity_values.dtype == np.float64:
+        values = equity_values
+    else:
+        values = np.fromiter(
+            (v for v in equity_values if isinstance(v, (int, float, np.floating))),
+            dtype=np.float64,
+        )
+    return values[np.isfinite(values)]
+
+
+def _return_sums(values: np.ndarray, per_period_rf: float) -> Tuple[int, float, float]:
+    """Return the count, sum, and downside sum of squares of per-period returns."""
+    returns = np.diff(values) / values[:-1]
+    returns = returns[np.isfinite(returns)]
+    downside = np.minimum(returns - per_period_rf, 0.0)
+    return int(returns.size), float(returns.sum()), float((downside ** 2).sum())
+
+
 def calculate_sortino_ratio(
     equity_values: Iterable[float],
     period_seconds: float,
@@ -24,22 +119,13 @@ def calculate_sortino_ratio(
 
     Args:
         equity_values: Sequence of equity values in chronological order.
+            A float64 ndarray is used as-is without copying it into a list.
+            A list is treated as the live equity history: its return moments
+            are kept between calls and only the newly appended values are
+            folded in.
         period_seconds: Average period between snapshots (used to annualize).
         risk_free_rate: Annualized risk-free rate (decimal form).
     """
-    values = [
-        float(v)
-        for v in equity_values
-        if isinstance(v, (int, float, np.floating)) and np.isfinite(v)
-    ]
-    if len(values) < 2:
-        return None
-
-    returns = np.diff(values) / np.array(values[:-1], dtype=float)
-    returns = returns[np.isfinite(returns)]
-    if returns.size == 0:
-        return None
-
     # Require a valid positive period; callers (bot/backtest) already pass
     # meaningful intervals, so this primarily guards against bad inputs.
     if not period_seconds or period_seconds <= 0:
@@ -49,15 +135,24 @@ def calculate_sortino_ratio(
     periods_per_year = (365 * 24 * 60 * 60) / period_seconds
     if not np.isfinite(periods_per_year) or periods_per_year <= 0:
         return None
-
     per_period_rf = risk_free_rate / periods_per_year
-    excess_return = returns.mean() - per_period_rf
+
+    if isinstance(equity_values, list):
+        count, sum_returns, sum_downside_sq = _equity_return_moments.update(
+            equity_values, per_period_rf
+        )
+    else:
+        count, sum_returns, sum_downside_sq = _return_sums(
+            _finite_equity_array(equity_values), per_period_rf
+        )
+    if count == 0:
+        return None
+
+    excess_return = sum_returns / count - per_period_rf
     if not np.isfinite(excess_return):
         return None
 
-    downside_diff = np.minimum(returns - per_period_rf, 0.0)
-    downside_squared = downside_diff ** 2
-    downside_deviation = np.sqrt(np.mean(downside_squared))
+    downside_deviation = math.sqrt(sum_downside_sq / count)
     if downside_deviation <= 0 or not np.isfinite(downside_deviation):
         return None
 
@@ -7,27 +7,101 @@ including CSV and JSON file operations.
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import csv
 import json
 import logging
+import os
 import numpy as np
 import pandas as pd
 
 
-def load_equity_history_from_csv(state_csv: Path, equity_history: List[float]) -> None:
+def _read_csv_tail(path: Path, max_rows: int, block_size: int = 64 * 1024) -> Tuple[str, List[str]]:
+    """Return the header line and at most the last ``max_rows`` data lines.
+
+    The file is read backwards in blocks until enough line breaks have been
+    seen, so the cost depends on ``max_rows`` rather than the file size. Rows
+    must not contain embedded newlines, which holds for the portfolio state
+    CSV written by ``append_portfolio_state_row``.
+    """
+    with open(path, "rb") as f:
+        header = f.readline()
+        data_start = f.tell()
+        pos = f.seek(0, os.SEEK_END)
+        chunks: List[bytes] = []
+        newlines = 0
+        while pos > data_start and newlines <= max_rows:
+            size = min(block_size, pos - data_start)
+            pos -= size
+            f.seek(pos)
+            chunk = f.read(size)
+            chunks.append(chunk)
+            newlines += chunk.count(b"\n")
+    tail = b"".join(reversed(chunks))
+    if pos > data_start:
+        # Starts mid-row; drop it before decoding, since the block boundary
+        # may also split a multibyte character.
+        tail = tail[tail.find(b"\n") + 1:]
+    lines = tail.decode("utf-8").splitlines()
+    return header.decode("utf-8"), lines[-max_rows:]
+
+
+def _load_equity_tail(state_csv: Path, max_points: int) -> Optional[List[float]]:
+    header, lines = _read_csv_tail(state_csv, max_points)
+    columns = next(csv.reader([header]), [])
+    if "total_equity" not in columns:
+        return None
+    index = columns.index("total_equity")
+    values: List[float] = []
+    for row in csv.reader(lines):
+        try:
+            value = float(row[index])
+        except (IndexError, ValueError):
+            continue
+        if value == value:  # NaN rows are dropped, as with to_numeric + dropna.
+            values.append(value)
+    return values
+
+
+def load_equity_history_from_csv(
+    state_csv: Path,
+    equity_history: List[float],
+    max_points: Optional[int] = None,
+) -> None:
     """Populate the in-memory equity history list from a CSV file.
 
     This helper mirrors the behaviour of bot.load_equity_history but operates on
     an explicit CSV path and history list, so callers remain in control of
     global state.
+
+    Args:
+        state_csv: Portfolio state CSV with a ``total_equity`` column.
+        equity_history: List to clear and fill.
+        max_points: If positive, only the newest ``max_points`` rows are read,
+            from the end of the file, instead of parsing the whole history.
     """
     equity_history.clear()
     if not state_csv.exists():
         return
+    if max_points is not None and max_points > 0:
+        try:
+            values = _load_equity_tail(state_csv, max_points)
+        except Exception as exc:  # pragma: no cover - defensive logging only
+            logging.warning("Unable to load historical equity data: %s", exc)
+            return
+        if values is None:
+            logging.warning(
+                "%s missing 'total_equity' column; Sortino ratio unavailable until new data is logged.",
+                state_csv,
+            )
+            return
+        equity_history.extend(values)
+        return
+
     try:
-        df = pd.read_csv(state_csv, usecols=["total_equity"])
+        # Only the equity column is parsed; the file grows by a row per iteration.
+        df = pd.read_csv(state_csv, usecols=["total_equity"], engine="c")
     except ValueError:
         logging.warning(
             "%s missing 'total_equity' column; Sortino ratio unavailable until new data is logged.",
@@ -39,8 +113,16 @@ def load_equity_history_from_csv(state_csv: Path, equity_history: List[float]) -
         return
 
     values = pd.to_numeric(df["total_equity"], errors="coerce").dropna()
-    if not values.empty:
-        equity_history.extend(float(v) for v in values.tolist())
+    equity_history.extend(values.astype("float64").tolist())
+
+
+def _read_csv_header(path: Path) -> List[str]:
+    """Return the column names on the first line of ``path`` (empty if unreadable)."""
+    try:
+        with open(path, newline="", encoding="utf-8") as f:
+            return next(csv.reader(f), [])
+    except (OSError, UnicodeDecodeError, csv.Error):
+        return []
 
 
 def init_csv_files_for_paths(
@@ -64,7 +146,9 @@ def init_csv_files_for_paths(
         with open(state_csv, "w", newline="") as f:
             writer = csv.writer(f)
             writer.writerow(state_columns)
-    else:
+    elif _read_csv_header(state_csv) != state_columns:
+        # Only a schema mismatch needs the whole file; a matching header
+        # line is all the startup check has to parse.
         try:
             df = pd.read_csv(state_csv)
         except Exception as exc:  # pragma: no cover - defensive logging only
@@ -9,8 +9,9 @@ from __future__ import annotations
 import re
 import logging
 import json
+from collections import deque
 from datetime import datetime, timezone
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
 
 import numpy as np
 
@@ -18,6 +19,7 @@ from config.settings import (
     START_CAPITAL,
     STATE_JSON,
     STATE_CSV,
+    EQUITY_HISTORY_MAX_POINTS,
     TAKER_FEE_RATE,
 )
 from core.persistence import (
@@ -35,9 +37,23 @@ trade_history: List[Dict[str, Any]] = []
 invocation_count: int = 0
 iteration_counter: int = 0
 equity_history: List[float] = []
-current_iteration_messages: List[str] = []
+# Enough lines to fill one 4096-character Telegram message; older lines drop off.
+ITERATION_MESSAGE_LIMIT = 120
+current_iteration_messages: Deque[str] = deque(maxlen=ITERATION_MESSAGE_LIMIT)
 last_btc_price: Optional[float] = None
 risk_control_state: RiskControlState = RiskControlState()
+# Figure lines of the last HOLD block printed per coin, so an unchanged block
+# collapses to one line. Console-only: not persisted, dropped on close.
+last_hold_figures: Dict[str, Tuple[str, ...]] = {}
+
+# Iterations that may pass between saves that would only record a new
+# iteration count. Counted in iterations rather than seconds so it spans
+# several iterations whatever CHECK_INTERVAL is; a crash loses at most this
+# many counter steps, a clean exit none.
+STATE_SAVE_ITERATION_STRIDE = 10
+# What the last save_state() wrote, so unchanged state can skip the disk.
+_saved_fingerprint: Optional[str] = None
+_saved_iteration = 0
 
 ANSI_ESCAPE_RE = re.compile(r"\x1B\[[0-?]*[ -/]*[@-~]")
 
@@ -155,8 +171,18 @@ def load_state() -> None:
     )
 
 
+def _state_fingerprint() -> str:
+    """Serialize the persisted trading state, leaving out the counters and clock."""
+    return json.dumps(
+        [balance, positions, risk_control_state.to_dict()],
+        sort_keys=True,
+        default=str,
+    )
+
+
 def save_state() -> None:
     """Persist current balance, open positions, and iteration counter."""
+    global _saved_fingerprint, _saved_iteration
     payload = {
         "balance": balance,
         "positions": positions,
@@ -165,25 +191,68 @@ def save_state() -> None:
         "risk_control": risk_control_state.to_dict(),
     }
     _save_state_to_json(STATE_JSON, payload)
+    _saved_fingerprint = _state_fingerprint()
+    _saved_iteration = iteration_counter
+
+
+def state_needs_save(stride: Optional[int] = None) -> bool:
+    """Return True if the persisted state is out of date.
+
+    Balance, position, or risk-control changes always need a write. When
+    only the iteration counter has moved, a write is due once it is ``stride``
+    iterations (default ``STATE_SAVE_ITERATION_STRIDE``) past the saved one.
+    """
+    if stride is None:
+        stride = STATE_SAVE_ITERATION_STRIDE
+    if _state_fingerprint() != _saved_fingerprint:
+        return True
+    return abs(iteration_counter - _saved_iteration) >= stride
+
+
+def save_state_if_changed(stride: Optional[int] = None) -> bool:
+    """Persist state only when state_needs_save() reports it out of date.
+
+    Returns:
+        True if the state file was written.
+    """
+    if not state_needs_save(stride):
+        return False
+    save_state()
+    return True
 
 
 def reset_state(initial_balance: Optional[float] = None) -> None:
     """Reset in-memory trading state to start a fresh run."""
     global balance, positions, trade_history, iteration_counter
-    global equity_history, invocation_count, current_iteration_messages, BOT_START_TIME
+    global equity_history, invocation_count, BOT_START_TIME
     balance = float(initial_balance) if initial_balance is not None else START_CAPITAL
     positions = {}
     trade_history = []
     iteration_counter = 0
     invocation_count = 0
     equity_history.clear()
-    current_iteration_messages = []
+    current_iteration_messages.clear()
+    last_hold_figures.clear()
     BOT_START_TIME = get_current_time()
 
 
 def load_equity_history() -> None:
     """Populate the in-memory equity history for performance calculations."""
-    _load_equity_history_from_csv(STATE_CSV, equity_history)
+    _load_equity_history_from_csv(STATE_CSV, equity_history, EQUITY_HISTORY_MAX_POINTS)
+
+
+def trim_equity_history(history: List[float], max_points: int) -> None:
+    """Drop the oldest points once ``history`` outgrows ``max_points``.
+
+    Trimming waits for a quarter window of overflow, so the O(N) delete (and
+    the Sortino running-sum rebuild it causes) happens once per many appends.
+    The retained window matches what a restart loads from the state CSV.
+    ``max_points <= 0`` disables the cap.
+    """
+    if max_points <= 0:
+        return
+    if len(history) > max_points + max(1, max_points // 4):
+        del history[: len(history) - max_points]
 
 
 def register_equity_snapshot(total_equity: float) -> None:
@@ -192,6 +261,7 @@ def register_equity_snapshot(total_equity: float) -> None:
         return
     if isinstance(total_equity, (int, float, np.floating)) and np.isfinite(total_equity):
         equity_history.append(float(total_equity))
+        trim_equity_history(equity_history, EQUITY_HISTORY_MAX_POINTS)
 
 
 def update_balance(delta: float) -> None:
@@ -253,11 +323,10 @@ def get_iteration_counter() -> int:
 
 def clear_iteration_messages() -> None:
     """Clear the current iteration messages."""
-    global current_iteration_messages
-    current_iteration_messages = []
+    current_iteration_messages.clear()
 
 
-def get_iteration_messages() -> List[str]:
+def get_iteration_messages() -> Deque[str]:
     """Return the current iteration messages."""
     return current_iteration_messages
 
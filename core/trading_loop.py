@@ -7,13 +7,14 @@ and portfolio management functions.
 from __future__ import annotations
 
 import csv
+import math
+import sys
 import time
 import logging
 from typing import Any, Callable, Dict, Iterable, List, Optional
 
 import numpy as np
 import pandas as pd
-from colorama import Fore, Style
 
 from config.settings import (
     SYMBOLS,
@@ -47,6 +48,22 @@ from config.settings import (
     DECISIONS_CSV,
 )
 from config import get_effective_coin_universe, resolve_symbol_for_coin
+from display.console import (
+    GAIN,
+    HOLD_AT_STOP_FMT,
+    HOLD_AT_TARGET_FMT,
+    HOLD_HEADER_FMT,
+    HOLD_PNL_FMT,
+    HOLD_REASON_FMT,
+    HOLD_REWARD_RISK_FMT,
+    HOLD_SIZE_FMT,
+    HOLD_TARGETS_FMT,
+    HOLD_UNCHANGED_FMT,
+    LOSS,
+    RESET,
+    SUMMARY_RULE,
+    SUMMARY_TITLE,
+)
 from core.state import (
     get_balance,
     set_balance,
@@ -62,6 +79,7 @@ from core.state import (
     get_equity_history,
     save_state,
     escape_markdown,
+    last_hold_figures as _last_hold_figures,
 )
 from core.persistence import (
     append_portfolio_state_row as _append_portfolio_state_row,
@@ -89,6 +107,7 @@ from execution.routing import (
     check_stop_loss_take_profit_for_positions as _check_sltp_for_positions,
     compute_entry_plan as _compute_entry_plan,
     compute_close_plan as _compute_close_plan,
+    get_fetch_pool as _get_price_fetch_pool,
     route_live_entry as _route_live_entry,
     route_live_close as _route_live_close,
 )
@@ -181,19 +200,38 @@ def calculate_total_margin() -> float:
     return _metrics_total_margin_for_positions(positions.values())
 
 
+def fetch_position_prices(
+    coins: Iterable[str],
+    fetch_market_data_fn: Callable,
+) -> Dict[str, float]:
+    """Fetch the latest price for each coin, one request per symbol in parallel.
+
+    Coins whose symbol cannot be resolved or whose fetch returns no data are
+    omitted. The result preserves the order of ``coins``.
+    """
+    symbols = {coin: resolve_symbol_for_coin(coin) for coin in coins}
+    symbols = {coin: symbol for coin, symbol in symbols.items() if symbol}
+    if not symbols:
+        return {}
+    if len(symbols) == 1:
+        results = [fetch_market_data_fn(symbol) for symbol in symbols.values()]
+    else:
+        results = list(_get_price_fetch_pool().map(fetch_market_data_fn, symbols.values()))
+    return {
+        coin: data["price"]
+        for coin, data in zip(symbols, results)
+        if data
+    }
+
+
 def calculate_total_equity(fetch_market_data_fn: Callable) -> float:
     """Calculate total equity (balance + unrealized PnL)."""
     positions = get_positions()
     balance = get_balance()
     total = balance + calculate_total_margin()
 
-    for coin in positions:
-        symbol = resolve_symbol_for_coin(coin)
-        if not symbol:
-            continue
-        data = fetch_market_data_fn(symbol)
-        if data:
-            total += calculate_unrealized_pnl(coin, data['price'])
+    for coin, price in fetch_position_prices(positions, fetch_market_data_fn).items():
+        total += calculate_unrealized_pnl(coin, price)
 
     return total
 
@@ -322,13 +360,18 @@ def execute_entry(
     hyperliquid_trader: Any,
     get_binance_futures_exchange: Callable,
     send_telegram_message_fn: Callable,
+    telegram_signals_enabled: bool = True,
 ) -> None:
-    """Execute entry trade."""
+    """Execute entry trade.
+
+    The ENTRY signal is only formatted and handed to
+    ``send_telegram_message_fn`` when ``telegram_signals_enabled`` is true.
+    """
     positions = get_positions()
     balance = get_balance()
 
     if coin in positions:
-        logging.warning(f"{coin}: Already have position, skipping entry")
+        logging.warning("%s: Already have position, skipping entry", coin)
         return
 
     plan = _compute_entry_plan(
@@ -439,7 +482,6 @@ def execute_entry(
 
     reason_text = raw_reason or "No justification provided."
     reason_text = " ".join(reason_text.split())
-    reason_text_for_signal = escape_markdown(reason_text)
 
     emit_entry_console_log(
         coin=coin,
@@ -466,34 +508,36 @@ def execute_entry(
         record_fn=record_iteration_message,
     )
 
-    try:
-        send_entry_signal_to_telegram(
-            coin=coin,
-            side=side,
-            leverage_display=leverage_display,
-            entry_price=entry_price,
-            quantity=quantity,
-            margin_required=margin_required,
-            risk_usd=risk_usd,
-            profit_target_price=profit_target_price,
-            stop_loss_price=stop_loss_price,
-            gross_at_target=gross_at_target,
-            gross_at_stop=gross_at_stop,
-            rr_display=rr_display,
-            entry_fee=entry_fee,
-            confidence=decision.get('confidence', 0),
-            reason_text_for_signal=reason_text_for_signal,
-            liquidity=liquidity,
-            timestamp=get_current_time().strftime('%Y-%m-%d %H:%M:%S UTC'),
-            send_fn=lambda text, chat_id, parse_mode: send_telegram_message_fn(
-                text,
-                chat_id=chat_id,
-                parse_mode=parse_mode,
-            ),
-            signals_chat_id=TELEGRAM_SIGNALS_CHAT_ID,
-        )
-    except Exception as exc:
-        logging.debug("Failed to send ENTRY signal to Telegram (non-fatal): %s", exc)
+    if telegram_signals_enabled:
+        reason_text_for_signal = escape_markdown(reason_text)
+        try:
+            send_entry_signal_to_telegram(
+                coin=coin,
+                side=side,
+                leverage_display=leverage_display,
+                entry_price=entry_price,
+                quantity=quantity,
+                margin_required=margin_required,
+                risk_usd=risk_usd,
+                profit_target_price=profit_target_price,
+                stop_loss_price=stop_loss_price,
+                gross_at_target=gross_at_target,
+                gross_at_stop=gross_at_stop,
+                rr_display=rr_display,
+                entry_fee=entry_fee,
+                confidence=decision.get('confidence', 0),
+                reason_text_for_signal=reason_text_for_signal,
+                liquidity=liquidity,
+                timestamp=get_current_time().strftime('%Y-%m-%d %H:%M:%S UTC'),
+                send_fn=lambda text, chat_id, parse_mode: send_telegram_message_fn(
+                    text,
+                    chat_id=chat_id,
+                    parse_mode=parse_mode,
+                ),
+                signals_chat_id=TELEGRAM_SIGNALS_CHAT_ID,
+            )
+        except Exception as exc:
+            logging.debug("Failed to send ENTRY signal to Telegram (non-fatal): %s", exc)
 
     log_trade(coin, 'ENTRY', {
         'side': side,
@@ -516,12 +560,17 @@ def execute_close(
     hyperliquid_trader: Any,
     get_binance_futures_exchange: Callable,
     send_telegram_message_fn: Callable,
+    telegram_signals_enabled: bool = True,
 ) -> None:
-    """Execute close trade."""
+    """Execute close trade.
+
+    The CLOSE signal is only formatted and handed to
+    ``send_telegram_message_fn`` when ``telegram_signals_enabled`` is true.
+    """
     positions = get_positions()
 
     if coin not in positions:
-        logging.warning(f"{coin}: No position to close")
+        logging.warning("%s: No position to close", coin)
         return
 
     pos = positions[coin]
@@ -537,7 +586,6 @@ def execute_close(
     )
     raw_reason = close_plan.raw_reason
     reason_text = close_plan.reason_text
-    reason_text_for_signal = escape_markdown(reason_text)
     fee_rate = close_plan.fee_rate
     exit_fee = close_plan.exit_fee
     total_fees = close_plan.total_fees
@@ -603,31 +651,34 @@ def execute_close(
     })
 
     remove_position(coin)
+    _last_hold_figures.pop(coin, None)
     save_state()
 
-    try:
-        send_close_signal_to_telegram(
-            coin=coin,
-            side=pos['side'],
-            quantity=pos['quantity'],
-            entry_price=pos['entry_price'],
-            current_price=current_price,
-            pnl=pnl,
-            total_fees=total_fees,
-            net_pnl=net_pnl,
-            margin=pos['margin'],
-            balance=get_balance(),
-            reason_text_for_signal=reason_text_for_signal,
-            timestamp=get_current_time().strftime('%Y-%m-%d %H:%M:%S UTC'),
-            send_fn=lambda text, chat_id, parse_mode: send_telegram_message_fn(
-                text,
-                chat_id=chat_id,
-                parse_mode=parse_mode,
-            ),
-            signals_chat_id=TELEGRAM_SIGNALS_CHAT_ID,
-        )
-    except Exception as exc:
-        logging.debug("Failed to send CLOSE signal to Telegram (non-fatal): %s", exc)
+    if telegram_signals_enabled:
+        reason_text_for_signal = escape_markdown(reason_text)
+        try:
+            send_close_signal_to_telegram(
+                coin=coin,
+                side=pos['side'],
+                quantity=pos['quantity'],
+                entry_price=pos['entry_price'],
+                current_price=current_price,
+                pnl=pnl,
+                total_fees=total_fees,
+                net_pnl=net_pnl,
+                margin=pos['margin'],
+                balance=get_balance(),
+                reason_text_for_signal=reason_text_for_signal,
+                timestamp=get_current_time().strftime('%Y-%m-%d %H:%M:%S UTC'),
+                send_fn=lambda text, chat_id, parse_mode: send_telegram_message_fn(
+                    text,
+                    chat_id=chat_id,
+                    parse_mode=parse_mode,
+                ),
+                signals_chat_id=TELEGRAM_SIGNALS_CHAT_ID,
+            )
+        except Exception as exc:
+            logging.debug("Failed to send CLOSE signal to Telegram (non-fatal): %s", exc)
 
 
 def process_ai_decisions(
@@ -636,6 +687,7 @@ def process_ai_decisions(
     hyperliquid_trader: Any,
     get_binance_futures_exchange: Callable,
     send_telegram_message_fn: Callable,
+    telegram_signals_enabled: bool = True,
 ) -> None:
     """Handle AI decisions for each tracked coin."""
     positions = get_positions()
@@ -643,7 +695,7 @@ def process_ai_decisions(
 
     # Warn about positions outside current Universe (orphaned positions)
     # These will still be managed by SL/TP but won't receive LLM decisions
-    orphaned_coins = set(positions.keys()) - set(coin_universe)
+    orphaned_coins = positions.keys() - coin_universe
     if orphaned_coins:
         logging.warning(
             "Positions exist outside current Universe and will not receive LLM decisions: %s. "
@@ -651,10 +703,15 @@ def process_ai_decisions(
             sorted(orphaned_coins),
         )
 
-    for coin in coin_universe:
-        if coin not in decisions:
-            continue
+    # Price every mapped, decided coin up front, in parallel, instead of one
+    # round-trip per coin inside the dispatch loop.
+    decided_coins = [coin for coin in coin_universe if coin in decisions]
+    prices = fetch_position_prices(
+        [coin for coin in decided_coins if COIN_TO_SYMBOL.get(coin)],
+        fetch_market_data_fn,
+    )
 
+    for coin in decided_coins:
         decision = decisions[coin]
         signal = decision.get("signal", "hold")
 
@@ -665,28 +722,25 @@ def process_ai_decisions(
             decision.get("confidence", 0),
         )
 
-        symbol = COIN_TO_SYMBOL.get(coin)
-        if not symbol:
+        if not COIN_TO_SYMBOL.get(coin):
             logging.debug("No symbol mapping found for coin %s", coin)
             continue
 
-        data = fetch_market_data_fn(symbol)
-        if not data:
+        current_price = prices.get(coin)
+        if current_price is None:
             continue
 
-        current_price = data["price"]
-
         if signal == "entry":
             execute_entry(
                 coin, decision, current_price,
                 hyperliquid_trader, get_binance_futures_exchange,
-                send_telegram_message_fn,
+                send_telegram_message_fn, telegram_signals_enabled,
             )
         elif signal == "close":
             execute_close(
                 coin, decision, current_price,
                 hyperliquid_trader, get_binance_futures_exchange,
-                send_telegram_message_fn,
+                send_telegram_message_fn, telegram_signals_enabled,
             )
         elif signal == "hold":
             _process_hold_signal(coin, decision, current_price)
@@ -760,48 +814,30 @@ def _process_hold_signal(coin: str, decision: Dict[str, Any], current_price: flo
     else:
         rr_display = "n/a"
 
-    pnl_color = Fore.GREEN if net_unrealized >= 0 else Fore.RED
-    gross_color = Fore.GREEN if gross_unrealized >= 0 else Fore.RED
-    net_display = f"{net_unrealized:+.2f}"
-    gross_display = f"{gross_unrealized:+.2f}"
-    gross_target_display = f"{gross_at_target:+.2f}"
-    gross_stop_display = f"{gross_at_stop:+.2f}"
-    net_target_display = f"{net_at_target:+.2f}"
-    net_stop_display = f"{net_at_stop:+.2f}"
-
-    line = f"{Fore.BLUE}[HOLD] {coin} {pos['side'].upper()} {leverage_display}"
-    print(line)
-    record_iteration_message(line)
-    line = f"  ├─ Size: {quantity:.4f} {coin} | Margin: ${margin_value:.2f}"
-    print(line)
-    record_iteration_message(line)
-    line = f"  ├─ TP: ${target_price:.4f} | SL: ${stop_price:.4f}"
-    print(line)
-    record_iteration_message(line)
-    line = (
-        f"  ├─ PnL: {pnl_color}${net_display}{Style.RESET_ALL} "
-        f"(Gross: {gross_color}${gross_display}{Style.RESET_ALL}, Fees: ${total_fees_now:.2f})"
-    )
-    print(line)
-    record_iteration_message(line)
-    line = (
-        f"  ├─ PnL @ Target: ${gross_target_display} "
-        f"(Net: ${net_target_display})"
-    )
-    print(line)
-    record_iteration_message(line)
-    line = (
-        f"  ├─ PnL @ Stop: ${gross_stop_display} "
-        f"(Net: ${net_stop_display})"
-    )
-    print(line)
-    record_iteration_message(line)
-    line = f"  ├─ Reward/Risk: {rr_display}"
-    print(line)
-    record_iteration_message(line)
-    line = f"  └─ Reason: {reason_text}"
-    print(line)
-    record_iteration_message(line)
+    pnl_color = GAIN if net_unrealized >= 0 else LOSS
+    gross_color = GAIN if gross_unrealized >= 0 else LOSS
+
+    lines = [
+        HOLD_HEADER_FMT % (coin, pos['side'].upper(), leverage_display),
+        HOLD_SIZE_FMT % (quantity, coin, margin_value),
+        HOLD_TARGETS_FMT % (target_price, stop_price),
+        HOLD_PNL_FMT % (pnl_color, net_unrealized, gross_color, gross_unrealized, total_fees_now),
+        HOLD_AT_TARGET_FMT % (gross_at_target, net_at_target),
+        HOLD_AT_STOP_FMT % (gross_at_stop, net_at_stop),
+        HOLD_REWARD_RISK_FMT % (rr_display,),
+        HOLD_REASON_FMT % (reason_text,),
+    ]
+    # Figures identical to last iteration's block (the LLM's reason aside)
+    # collapse to a single line instead of reprinting the whole block.
+    figures = tuple(lines[:-1])
+    if _last_hold_figures.get(coin) == figures:
+        lines = [HOLD_UNCHANGED_FMT % (coin,)]
+    else:
+        _last_hold_figures[coin] = figures
+    # One write for the whole block instead of one print per line.
+    print("\n".join(lines))
+    for line in lines:
+        record_iteration_message(line)
 
 
 def check_stop_loss_take_profit(
@@ -820,77 +856,93 @@ def check_stop_loss_take_profit(
     )
 
 
+# Seconds between countdown redraws. The wait loop sleeps in chunks of this
+# size against a monotonic deadline instead of waking up once per second.
+COUNTDOWN_REFRESH_SECONDS = 5.0
+
+
 def sleep_with_countdown(total_seconds: int) -> None:
     """Sleep with a simple terminal countdown on a single line."""
     try:
         remaining = int(total_seconds)
         if remaining <= 0:
             return
+        deadline = time.monotonic() + remaining
         while remaining > 0:
             print(
-                f"\rWaiting for next check in {remaining} seconds... ",
+                f"\rWaiting for next check in {math.ceil(remaining)} seconds... ",
                 end="",
                 flush=True,
             )
-            time.sleep(1)
-            remaining -= 1
+            time.sleep(min(COUNTDOWN_REFRESH_SECONDS, remaining))
+            remaining = deadline - time.monotonic()
         print("\rWaiting for next check in 0 seconds...           ")
     except KeyboardInterrupt:
         print()
         raise
 
 
+def sleep_until_next_check(total_seconds: int) -> None:
+    """Sleep until the next iteration, showing the countdown only on a terminal.
+
+    When stdout is redirected (docker, systemd) nobody sees the countdown, so
+    sleep in one call instead of writing a status line every few seconds.
+    """
+    if sys.stdout.isatty():
+        sleep_with_countdown(total_seconds)
+    elif total_seconds > 0:
+        time.sleep(total_seconds)
+
+
+# Balance shown by the last full summary printed with no open positions.
+_last_idle_balance: Optional[float] = None
+
+
 def display_portfolio_summary(
     fetch_market_data_fn: Callable,
 ) -> None:
     """Display the portfolio summary at the end of an iteration."""
+    global _last_idle_balance
     positions = get_positions()
     balance = get_balance()
     total_equity = calculate_total_equity(fetch_market_data_fn)
     total_return = ((total_equity - START_CAPITAL) / START_CAPITAL) * 100
-    equity_color = Fore.GREEN if total_return >= 0 else Fore.RED
+    equity_color = GAIN if total_return >= 0 else LOSS
     total_margin = calculate_total_margin()
     net_unrealized_total = total_equity - balance - total_margin
-    net_color = Fore.GREEN if net_unrealized_total >= 0 else Fore.RED
+    net_color = GAIN if net_unrealized_total >= 0 else LOSS
     register_equity_snapshot(total_equity)
+    if not positions and balance == _last_idle_balance:
+        # Flat book, same balance: the full block would repeat itself.
+        line = f"Idle | Equity ${total_equity:.2f}"
+        print(line)
+        record_iteration_message(line)
+        return
+    _last_idle_balance = None if positions else balance
     sortino_ratio = calculate_sortino_ratio(
         get_equity_history(),
         CHECK_INTERVAL,
         RISK_FREE_RATE,
     )
 
-    line = f"\n{Fore.YELLOW}{'─'*20}"
-    print(line)
-    record_iteration_message(line)
-    line = f"{Fore.YELLOW}PORTFOLIO SUMMARY"
-    print(line)
-    record_iteration_message(line)
-    line = f"{Fore.YELLOW}{'─'*20}"
-    print(line)
-    record_iteration_message(line)
-    line = f"Available Balance: ${balance:.2f}"
-    print(line)
-    record_iteration_message(line)
+    lines = [
+        f"\n{SUMMARY_RULE}",
+        SUMMARY_TITLE,
+        SUMMARY_RULE,
+        f"Available Balance: ${balance:.2f}",
+    ]
     if total_margin > 0:
-        line = f"Margin Allocated: ${total_margin:.2f}"
-        print(line)
-        record_iteration_message(line)
-    line = f"Total Equity: {equity_color}${total_equity:.2f} ({total_return:+.2f}%){Style.RESET_ALL}"
-    print(line)
-    record_iteration_message(line)
-    line = f"Unrealized PnL: {net_color}${net_unrealized_total:.2f}{Style.RESET_ALL}"
-    print(line)
-    record_iteration_message(line)
+        lines.append(f"Margin Allocated: ${total_margin:.2f}")
+    lines.append(f"Total Equity: {equity_color}${total_equity:.2f} ({total_return:+.2f}%){RESET}")
+    lines.append(f"Unrealized PnL: {net_color}${net_unrealized_total:.2f}{RESET}")
     if sortino_ratio is not None:
-        sortino_color = Fore.GREEN if sortino_ratio >= 0 else Fore.RED
-        line = f"Sortino Ratio: {sortino_color}{sortino_ratio:+.2f}{Style.RESET_ALL}"
+        sortino_color = GAIN if sortino_ratio >= 0 else LOSS
+        lines.append(f"Sortino Ratio: {sortino_color}{sortino_ratio:+.2f}{RESET}")
     else:
-        line = "Sortino Ratio: N/A (need more data)"
-    print(line)
-    record_iteration_message(line)
-    line = f"Open Positions: {len(positions)}"
-    print(line)
-    record_iteration_message(line)
-    line = f"{Fore.YELLOW}{'─'*20}\n"
-    print(line)
-    record_iteration_message(line)
+        lines.append("Sortino Ratio: N/A (need more data)")
+    lines.append(f"Open Positions: {len(positions)}")
+    lines.append(f"{SUMMARY_RULE}\n")
+    # One write for the whole block instead of one print per line.
+    print("\n".join(lines))
+    for line in lines:
+        record_iteration_message(line)
@@ -0,0 +1,51 @@
+"""ANSI-coloured console fragments.
+
+The iteration header, HOLD block, and portfolio summary reuse the same
+coloured rules and prefixes every iteration, so they are rendered once here.
+The HOLD block's per-position lines are %-style templates, which skip the
+format-spec parsing an f-string repeats on every call.
+
+When stdout is not a terminal (docker logs, systemd journal, a redirected
+file) or ``NO_COLOR`` is set, the colour codes are empty strings, so no
+escape bytes reach the logs.
+"""
+from __future__ import annotations
+
+import os
+import sys
+
+from colorama import Fore, Style
+
+
+def _stdout_is_terminal() -> bool:
+    try:
+        return sys.stdout.isatty()
+    except (AttributeError, ValueError):
+        return False
+
+
+COLOR_ENABLED = _stdout_is_terminal() and not os.environ.get("NO_COLOR")
+
+
+def _color(code: str) -> str:
+    return code if COLOR_ENABLED else ""
+
+
+RESET = _color(Style.RESET_ALL)
+GAIN = _color(Fore.GREEN)
+LOSS = _color(Fore.RED)
+
+ITERATION_RULE = f"{_color(Fore.CYAN)}{'=' * 20}"
+ITERATION_PREFIX = f"{_color(Fore.CYAN)}Iteration"
+HOLD_PREFIX = f"{_color(Fore.BLUE)}[HOLD]"
+HOLD_HEADER_FMT = HOLD_PREFIX + " %s %s %s"
+HOLD_SIZE_FMT = "  ├─ Size: %.4f %s | Margin: $%.2f"
+HOLD_TARGETS_FMT = "  ├─ TP: $%.4f | SL: $%.4f"
+HOLD_PNL_FMT = f"  ├─ PnL: %s$%+.2f{RESET} (Gross: %s$%+.2f{RESET}, Fees: $%.2f)"
+HOLD_AT_TARGET_FMT = "  ├─ PnL @ Target: $%+.2f (Net: $%+.2f)"
+HOLD_AT_STOP_FMT = "  ├─ PnL @ Stop: $%+.2f (Net: $%+.2f)"
+HOLD_REWARD_RISK_FMT = "  ├─ Reward/Risk: %s"
+HOLD_REASON_FMT = "  └─ Reason: %s"
+HOLD_UNCHANGED_FMT = HOLD_PREFIX + " %s unchanged"
+SUMMARY_RULE = f"{_color(Fore.YELLOW)}{'─' * 20}"
+SUMMARY_TITLE = f"{_color(Fore.YELLOW)}PORTFOLIO SUMMARY"
@@ -8,8 +8,6 @@ from __future__ import annotations
 
 from typing import Any, Callable, Dict, List, Optional
 
-from colorama import Fore, Style
-
 from config.settings import (
     START_CAPITAL,
     STATE_CSV,
@@ -18,6 +16,7 @@ from config.settings import (
 )
 from core.metrics import calculate_sortino_ratio
 from core.persistence import append_portfolio_state_row as _append_portfolio_state_row
+from display.console import GAIN, LOSS, RESET, SUMMARY_RULE, SUMMARY_TITLE
 
 
 def log_portfolio_state(
@@ -57,6 +56,10 @@ def log_portfolio_state(
     )
 
 
+# Balance shown by the last full summary printed with no open positions.
+_last_idle_balance: Optional[float] = None
+
+
 def display_portfolio_summary(
     positions: Dict[str, Dict[str, Any]],
     balance: float,
@@ -67,51 +70,45 @@ def display_portfolio_summary(
     record_iteration_message: Callable[[str], None],
 ) -> None:
     """Display the portfolio summary at the end of an iteration."""
+    global _last_idle_balance
     total_equity = calculate_total_equity()
     total_return = ((total_equity - START_CAPITAL) / START_CAPITAL) * 100
-    equity_color = Fore.GREEN if total_return >= 0 else Fore.RED
+    equity_color = GAIN if total_return >= 0 else LOSS
     total_margin = calculate_total_margin()
     net_unrealized_total = total_equity - balance - total_margin
-    net_color = Fore.GREEN if net_unrealized_total >= 0 else Fore.RED
+    net_color = GAIN if net_unrealized_total >= 0 else LOSS
     register_equity_snapshot(total_equity)
+    if not positions and balance == _last_idle_balance:
+        # Flat book, same balance: the full block would repeat itself.
+        line = f"Idle | Equity ${total_equity:.2f}"
+        print(line)
+        record_iteration_message(line)
+        return
+    _last_idle_balance = None if positions else balance
     sortino_ratio = calculate_sortino_ratio(
         equity_history,
         CHECK_INTERVAL,
         RISK_FREE_RATE,
     )
 
-    line = f"\n{Fore.YELLOW}{'─'*20}"
-    print(line)
-    record_iteration_message(line)
-    line = f"{Fore.YELLOW}PORTFOLIO SUMMARY"
-    print(line)
-    record_iteration_message(line)
-    line = f"{Fore.YELLOW}{'─'*20}"
-    print(line)
-    record_iteration_message(line)
-    line = f"Available Balance: ${balance:.2f}"
-    print(line)
-    record_iteration_message(line)
+    lines = [
+        f"\n{SUMMARY_RULE}",
+        SUMMARY_TITLE,
+        SUMMARY_RULE,
+        f"Available Balance: ${balance:.2f}",
+    ]
     if total_margin > 0:
-        line = f"Margin Allocated: ${total_margin:.2f}"
-        print(line)
-        record_iteration_message(line)
-    line = f"Total Equity: {equity_color}${total_equity:.2f} ({total_return:+.2f}%){Style.RESET_ALL}"
-    print(line)
-    record_iteration_message(line)
-    line = f"Unrealized PnL: {net_color}${net_unrealized_total:.2f}{Style.RESET_ALL}"
-    print(line)
-    record_iteration_message(line)
+        lines.append(f"Margin Allocated: ${total_margin:.2f}")
+    lines.append(f"Total Equity: {equity_color}${total_equity:.2f} ({total_return:+.2f}%){RESET}")
+    lines.append(f"Unrealized PnL: {net_color}${net_unrealized_total:.2f}{RESET}")
     if sortino_ratio is not None:
-        sortino_color = Fore.GREEN if sortino_ratio >= 0 else Fore.RED
-        line = f"Sortino Ratio: {sortino_color}{sortino_ratio:+.2f}{Style.RESET_ALL}"
+        sortino_color = GAIN if sortino_ratio >= 0 else LOSS
+        lines.append(f"Sortino Ratio: {sortino_color}{sortino_ratio:+.2f}{RESET}")
     else:
-        line = "Sortino Ratio: N/A (need more data)"
-    print(line)
-    record_iteration_message(line)
-    line = f"Open Positions: {len(positions)}"
-    print(line)
-    record_iteration_message(line)
-    line = f"{Fore.YELLOW}{'─'*20}\n"
-    print(line)
-    record_iteration_message(line)
+        lines.append("Sortino Ratio: N/A (need more data)")
+    lines.append(f"Open Positions: {len(positions)}")
+    lines.append(f"{SUMMARY_RULE}\n")
+    # One write for the whole block instead of one print per line.
+    print("\n".join(lines))
+    for line in lines:
+        record_iteration_message(line)
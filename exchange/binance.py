@@ -317,52 +317,87 @@ class BinanceFuturesExchangeClient:
             logging.warning("Failed to cancel existing TP/SL orders for %s: %s", symbol, e)
             # Continue anyway - new orders might still work
         
+        def _tpsl_order_request(order_type: str, stop_price: float) -> Dict[str, Any]:
+            return {
+                "symbol": symbol,
+                "type": order_type,
+                "side": close_side,
+                "amount": quantity,
+                "params": {
+                    "stopPrice": stop_price,
+                    "positionSide": position_side,
+                },
+            }
+
         def _place_tpsl_order(
             order_type: str,
             stop_price: float,
             label: str,
         ) -> Optional[Any]:
             """Place TP/SL order helper."""
-            params = {
-                "stopPrice": stop_price,
-                "positionSide": position_side,
-            }
             try:
-                return self._exchange.create_order(
-                    symbol=symbol,
-                    type=order_type,
-                    side=close_side,
-                    amount=quantity,
-                    params=params,
-                )
+                return self._exchange.create_order(**_tpsl_order_request(order_type, stop_price))
             except Exception as exc:
                 error_msg = f"{label} order failed: {exc}"
                 errors.append(error_msg)
                 logging.error("Binance %s: %s", symbol, error_msg)
                 return None
-        
-        # Create Stop Loss order
+
+        wanted = []
         if new_sl is not None and new_sl > 0:
-            sl_order = _place_tpsl_order("STOP_MARKET", new_sl, "SL")
-            if sl_order is not None:
-                sl_order_id = self._extract_order_id(sl_order)
-                raw_results["sl_order"] = sl_order
-                logging.info(
-                    "Binance SL order created: %s %s @ %s, order_id=%s",
-                    symbol, close_side, new_sl, sl_order_id,
-                )
-        
-        # Create Take Profit order
+            wanted.append(("SL", "STOP_MARKET", new_sl))
         if new_tp is not None and new_tp > 0:
-            tp_order = _place_tpsl_order("TAKE_PROFIT_MARKET", new_tp, "TP")
-            if tp_order is not None:
-                tp_order_id = self._extract_order_id(tp_order)
-                raw_results["tp_order"] = tp_order
-                logging.info(
-                    "Binance TP order created: %s %s @ %s, order_id=%s",
-                    symbol, close_side, new_tp, tp_order_id,
+            wanted.append(("TP", "TAKE_PROFIT_MARKET", new_tp))
+
+        placed: Dict[str, Optional[Any]] = {}
+        if len(wanted) > 1 and self._supports_batch_orders():
+            # Both legs in one /fapi/v1/batchOrders round-trip; Binance
+            # reports per-order rejections inside the response list.
+            try:
+                batch = self._exchange.create_orders(
+                    [_tpsl_order_request(order_type, price) for _, order_type, price in wanted]
                 )
-        
+            except Exception as exc:
+                batch = None
+                for label, _, _ in wanted:
+                    error_msg = f"{label} order failed: {exc}"
+                    errors.append(error_msg)
+                    logging.error("Binance %s: %s", symbol, error_msg)
+            if batch is not None:
+                orders = list(batch)
+                for index, (label, _, _) in enumerate(wanted):
+                    order = orders[index] if index < len(orders) else None
+                    if self._extract_order_id(order) is None:
+                        reasons = self._collect_errors(order, f"{label} order failed")
+                        error_msg = "; ".join(reasons) or f"{label} order failed: no order id returned"
+                        errors.append(error_msg)
+                        logging.error("Binance %s: %s", symbol, error_msg)
+                        order = None
+                    placed[label] = order
+        else:
+            for label, order_type, price in wanted:
+                placed[label] = _place_tpsl_order(order_type, price, label)
+
+        # Record the Stop Loss order
+        sl_order = placed.get("SL")
+        if sl_order is not None:
+            sl_order_id = self._extract_order_id(sl_order)
+            raw_results["sl_order"] = sl_order
+            logging.info(
+                "Binance SL order created: %s %s @ %s, order_id=%s",
+                symbol, close_side, new_sl, sl_order_id,
+            )
+
+        # Record the Take Profit order
+        tp_order = placed.get("TP")
+        if tp_order is not None:
+            tp_order_id = self._extract_order_id(tp_order)
+            raw_results["tp_order"] = tp_order
+            logging.info(
+                "Binance TP order created: %s %s @ %s, order_id=%s",
+                symbol, close_side, new_tp, tp_order_id,
+            )
+
         # Success if at least one order was created without errors
         success = (
             (new_sl is None or sl_order_id is not None) and
@@ -378,6 +413,13 @@ class BinanceFuturesExchangeClient:
             raw=raw_results,
         )
 
+    def _supports_batch_orders(self) -> bool:
+        """Return True if the exchange can place several orders in one request."""
+        if not callable(getattr(self._exchange, "create_orders", None)):
+            return False
+        has = getattr(self._exchange, "has", None)
+        return not isinstance(has, dict) or bool(has.get("createOrders"))
+
     def _cancel_existing_tpsl_orders(self, symbol: str, position_side: str) -> None:
         """Cancel existing SL/TP orders for a position."""
         try:
@@ -6,10 +6,8 @@ for Binance, Backpack, and Hyperliquid.
 from __future__ import annotations
 
 import logging
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
-import ccxt
-from binance.client import Client
 from requests.exceptions import RequestException, Timeout
 
 from config.settings import (
@@ -30,6 +28,9 @@ from exchange.hyperliquid import HyperliquidExchangeClient
 from exchange.binance import BinanceFuturesExchangeClient
 from exchange.backpack import BackpackFuturesExchangeClient
 
+if TYPE_CHECKING:
+    from binance.client import Client
+
 
 # ───────────────────────── CACHED CLIENTS ─────────────────────────
 _binance_client: Optional[Client] = None
@@ -78,6 +79,9 @@ def get_binance_futures_exchange() -> Optional[Any]:
         logging.error("BINANCE_API_KEY and/or BINANCE_API_SECRET missing.")
         return None
 
+    # ccxt is heavy to import; only pay for it when the live backend is used.
+    import ccxt
+
     try:
         exchange = ccxt.binanceusdm({
             "apiKey": api_key,
@@ -102,6 +106,8 @@ def get_binance_client() -> Optional[Client]:
         logging.error("BN_API_KEY and/or BN_SECRET missing.")
         return None
 
+    from binance.client import Client
+
     try:
         logging.info("Attempting to initialize Binance client...")
         _binance_client = Client(API_KEY, API_SECRET, testnet=False)
@@ -8,28 +8,14 @@ from __future__ import annotations
 
 import logging
 import time
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 import requests
-from binance.client import Client
 
+from config.settings import _INTERVAL_TO_SECONDS
 
-# Local interval mapping for Backpack market data lookbacks. This mirrors
-# the mapping used in the main bot module so behaviour remains consistent.
-_INTERVAL_TO_SECONDS: Dict[str, int] = {
-    "1m": 60,
-    "3m": 180,
-    "5m": 300,
-    "15m": 900,
-    "30m": 1800,
-    "1h": 3600,
-    "2h": 7200,
-    "4h": 14400,
-    "6h": 21600,
-    "8h": 28800,
-    "12h": 43200,
-    "1d": 86400,
-}
+if TYPE_CHECKING:
+    from binance.client import Client
 
 
 class BinanceMarketDataClient:
@@ -57,6 +43,31 @@ class BinanceMarketDataClient:
                     continue
         return rates
 
+    def get_prices(self, symbols: List[str]) -> Dict[str, float]:
+        """Return the last price of each symbol from one all-tickers request.
+
+        Uses the same (spot) market as ``get_klines``. Symbols missing from
+        the response are omitted.
+        """
+        try:
+            tickers = self._client.get_all_tickers()
+        except Exception as exc:  # pragma: no cover - defensive logging
+            logging.debug("Ticker prices unavailable: %s", exc)
+            return {}
+        wanted = set(symbols)
+        prices: Dict[str, float] = {}
+        for entry in tickers or []:
+            if not isinstance(entry, dict):
+                continue
+            symbol = entry.get("symbol")
+            if symbol not in wanted:
+                continue
+            try:
+                prices[symbol] = float(entry.get("price"))
+            except (TypeError, ValueError):
+                continue
+        return prices
+
     def get_open_interest_history(self, symbol: str, limit: int) -> List[float]:
         try:
             hist = self._client.futures_open_interest_hist(symbol=symbol, period="5m", limit=limit)
@@ -232,6 +243,35 @@ class BackpackMarketDataClient:
             rows.append(row)
         return rows
 
+    def get_prices(self, symbols: List[str]) -> Dict[str, float]:
+        """Return the last price of each symbol from one tickers request.
+
+        Results are keyed by the symbols as passed in. Symbols missing from
+        the response are omitted.
+        """
+        wanted = {self._normalize_symbol(symbol): symbol for symbol in symbols}
+        url = f"{self._base_url}/api/v1/tickers"
+        try:
+            response = self._session.get(url, timeout=self._timeout)
+            data = response.json()
+        except Exception as exc:  # pragma: no cover - defensive logging
+            logging.debug("Backpack tickers request failed: %s", exc)
+            return {}
+        if response.status_code != 200 or not isinstance(data, list):
+            return {}
+        prices: Dict[str, float] = {}
+        for item in data:
+            if not isinstance(item, dict):
+                continue
+            symbol = wanted.get(item.get("symbol"))
+            if symbol is None:
+                continue
+            try:
+                prices[symbol] = float(item.get("lastPrice"))
+            except (TypeError, ValueError):
+                continue
+        return prices
+
     def get_funding_rate_history(self, symbol: str, limit: int) -> List[float]:
         entry = self._get_mark_price_entry(symbol)
         if not entry:
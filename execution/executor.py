@@ -8,8 +8,6 @@ from __future__ import annotations
 import logging
 from typing import Any, Callable, Dict, Optional
 
-from colorama import Fore, Style
-
 from config.settings import (
     SYMBOL_TO_COIN,
     COIN_TO_SYMBOL,
@@ -27,10 +25,24 @@ from config.settings import (
     RISK_CONTROL_ENABLED,
 )
 from config import get_effective_coin_universe, resolve_symbol_for_coin
+from display.console import (
+    GAIN,
+    HOLD_AT_STOP_FMT,
+    HOLD_AT_TARGET_FMT,
+    HOLD_HEADER_FMT,
+    HOLD_PNL_FMT,
+    HOLD_REASON_FMT,
+    HOLD_REWARD_RISK_FMT,
+    HOLD_SIZE_FMT,
+    HOLD_TARGETS_FMT,
+    HOLD_UNCHANGED_FMT,
+    LOSS,
+)
 from core.metrics import (
     calculate_pnl_for_price,
     format_leverage_display,
 )
+from core.state import last_hold_figures as _last_hold_figures
 from execution.routing import (
     check_stop_loss_take_profit_for_positions,
     compute_entry_plan,
@@ -80,6 +92,7 @@ class TradeExecutor:
         binance_futures_live: bool,
         backpack_futures_live: bool,
         is_kill_switch_active: Optional[Callable[[], bool]] = None,
+        telegram_signals_enabled: bool = True,
     ):
         """Initialize the trade executor with dependencies.
         
@@ -105,6 +118,9 @@ class TradeExecutor:
             is_kill_switch_active: Optional callback to check if Kill-Switch is active.
                 If provided and returns True, execute_entry will be blocked as a
                 final safety guard (defense-in-depth for risk control).
+            telegram_signals_enabled: Whether ENTRY/CLOSE signals are formatted
+                and passed to ``send_telegram_message``. When False the sender
+                is never called.
         """
         self.positions = positions
         self.get_balance = get_balance
@@ -125,6 +141,7 @@ class TradeExecutor:
         self.binance_futures_live = binance_futures_live
         self.backpack_futures_live = backpack_futures_live
         self.is_kill_switch_active = is_kill_switch_active
+        self.telegram_signals_enabled = telegram_signals_enabled
 
     def execute_entry(self, coin: str, decision: Dict[str, Any], current_price: float) -> None:
         """Execute entry trade.
@@ -151,7 +168,7 @@ class TradeExecutor:
                 return
 
         if coin in self.positions:
-            logging.warning(f"{coin}: Already have position, skipping entry")
+            logging.warning("%s: Already have position, skipping entry", coin)
             return
 
         balance = self.get_balance()
@@ -262,7 +279,6 @@ class TradeExecutor:
 
         reason_text = raw_reason or "No justification provided."
         reason_text = " ".join(reason_text.split())
-        reason_text_for_signal = self.escape_markdown(reason_text)
 
         emit_entry_console_log(
             coin=coin,
@@ -289,32 +305,34 @@ class TradeExecutor:
             record_fn=self.record_iteration_message,
         )
 
-        try:
-            send_entry_signal_to_telegram(
-                coin=coin,
-                side=side,
-                leverage_display=leverage_display,
-                entry_price=entry_price,
-                quantity=quantity,
-                margin_required=margin_required,
-                risk_usd=risk_usd,
-                profit_target_price=profit_target_price,
-                stop_loss_price=stop_loss_price,
-                gross_at_target=gross_at_target,
-                gross_at_stop=gross_at_stop,
-                rr_display=rr_display,
-                entry_fee=entry_fee,
-                confidence=decision.get('confidence', 0),
-                reason_text_for_signal=reason_text_for_signal,
-                liquidity=liquidity,
-                timestamp=self.get_current_time().strftime('%Y-%m-%d %H:%M:%S UTC'),
-                send_fn=lambda text, chat_id, parse_mode: self.send_telegram_message(
-                    text, chat_id=chat_id, parse_mode=parse_mode,
-                ),
-                signals_chat_id=TELEGRAM_SIGNALS_CHAT_ID,
-            )
-        except Exception as exc:
-            logging.debug("Failed to send ENTRY signal to Telegram (non-fatal): %s", exc)
+        if self.telegram_signals_enabled:
+            reason_text_for_signal = self.escape_markdown(reason_text)
+            try:
+                send_entry_signal_to_telegram(
+                    coin=coin,
+                    side=side,
+                    leverage_display=leverage_display,
+                    entry_price=entry_price,
+                    quantity=quantity,
+                    margin_required=margin_required,
+                    risk_usd=risk_usd,
+                    profit_target_price=profit_target_price,
+                    stop_loss_price=stop_loss_price,
+                    gross_at_target=gross_at_target,
+                    gross_at_stop=gross_at_stop,
+                    rr_display=rr_display,
+                    entry_fee=entry_fee,
+                    confidence=decision.get('confidence', 0),
+                    reason_text_for_signal=reason_text_for_signal,
+                    liquidity=liquidity,
+                    timestamp=self.get_current_time().strftime('%Y-%m-%d %H:%M:%S UTC'),
+                    send_fn=lambda text, chat_id, parse_mode: self.send_telegram_message(
+                        text, chat_id=chat_id, parse_mode=parse_mode,
+                    ),
+                    signals_chat_id=TELEGRAM_SIGNALS_CHAT_ID,
+                )
+            except Exception as exc:
+                logging.debug("Failed to send ENTRY signal to Telegram (non-fatal): %s", exc)
 
         self.log_trade(coin, 'ENTRY', {
             'side': side,
@@ -338,7 +356,7 @@ class TradeExecutor:
             current_price: Current market price.
         """
         if coin not in self.positions:
-            logging.warning(f"{coin}: No position to close")
+            logging.warning("%s: No position to close", coin)
             return
 
         pos = self.positions[coin]
@@ -354,7 +372,6 @@ class TradeExecutor:
         )
         raw_reason = close_plan.raw_reason
         reason_text = close_plan.reason_text
-        reason_text_for_signal = self.escape_markdown(reason_text)
         fee_rate = close_plan.fee_rate
         exit_fee = close_plan.exit_fee
         total_fees = close_plan.total_fees
@@ -422,29 +439,32 @@ class TradeExecutor:
         })
 
         del self.positions[coin]
+        _last_hold_figures.pop(coin, None)
         self.save_state()
 
-        try:
-            send_close_signal_to_telegram(
-                coin=coin,
-                side=pos['side'],
-                quantity=pos['quantity'],
-                entry_price=pos['entry_price'],
-                current_price=current_price,
-                pnl=pnl,
-                total_fees=total_fees,
-                net_pnl=net_pnl,
-                margin=pos['margin'],
-                balance=new_balance,
-                reason_text_for_signal=reason_text_for_signal,
-                timestamp=self.get_current_time().strftime('%Y-%m-%d %H:%M:%S UTC'),
-                send_fn=lambda text, chat_id, parse_mode: self.send_telegram_message(
-                    text, chat_id=chat_id, parse_mode=parse_mode,
-                ),
-                signals_chat_id=TELEGRAM_SIGNALS_CHAT_ID,
-            )
-        except Exception as exc:
-            logging.debug("Failed to send CLOSE signal to Telegram (non-fatal): %s", exc)
+        if self.telegram_signals_enabled:
+            reason_text_for_signal = self.escape_markdown(reason_text)
+            try:
+                send_close_signal_to_telegram(
+                    coin=coin,
+                    side=pos['side'],
+                    quantity=pos['quantity'],
+                    entry_price=pos['entry_price'],
+                    current_price=current_price,
+                    pnl=pnl,
+                    total_fees=total_fees,
+                    net_pnl=net_pnl,
+                    margin=pos['margin'],
+                    balance=new_balance,
+                    reason_text_for_signal=reason_text_for_signal,
+                    timestamp=self.get_current_time().strftime('%Y-%m-%d %H:%M:%S UTC'),
+                    send_fn=lambda text, chat_id, parse_mode: self.send_telegram_message(
+                        text, chat_id=chat_id, parse_mode=parse_mode,
+                    ),
+                    signals_chat_id=TELEGRAM_SIGNALS_CHAT_ID,
+                )
+            except Exception as exc:
+                logging.debug("Failed to send CLOSE signal to Telegram (non-fatal): %s", exc)
 
     def process_hold_signal(self, coin: str, decision: Dict[str, Any], current_price: float) -> None:
         """Process a hold signal for an existing position.
@@ -515,48 +535,30 @@ class TradeExecutor:
         else:
             rr_display = "n/a"
 
-        pnl_color = Fore.GREEN if net_unrealized >= 0 else Fore.RED
-        gross_color = Fore.GREEN if gross_unrealized >= 0 else Fore.RED
-        net_display = f"{net_unrealized:+.2f}"
-        gross_display = f"{gross_unrealized:+.2f}"
-        gross_target_display = f"{gross_at_target:+.2f}"
-        gross_stop_display = f"{gross_at_stop:+.2f}"
-        net_target_display = f"{net_at_target:+.2f}"
-        net_stop_display = f"{net_at_stop:+.2f}"
-
-        line = f"{Fore.BLUE}[HOLD] {coin} {pos['side'].upper()} {leverage_display}"
-        print(line)
-        self.record_iteration_message(line)
-        line = f"  ├─ Size: {quantity:.4f} {coin} | Margin: ${margin_value:.2f}"
-        print(line)
-        self.record_iteration_message(line)
-        line = f"  ├─ TP: ${target_price:.4f} | SL: ${stop_price:.4f}"
-        print(line)
-        self.record_iteration_message(line)
-        line = (
-            f"  ├─ PnL: {pnl_color}${net_display}{Style.RESET_ALL} "
-            f"(Gross: {gross_color}${gross_display}{Style.RESET_ALL}, Fees: ${total_fees_now:.2f})"
-        )
-        print(line)
-        self.record_iteration_message(line)
-        line = (
-            f"  ├─ PnL @ Target: ${gross_target_display} "
-            f"(Net: ${net_target_display})"
-        )
-        print(line)
-        self.record_iteration_message(line)
-        line = (
-            f"  ├─ PnL @ Stop: ${gross_stop_display} "
-            f"(Net: ${net_stop_display})"
-        )
-        print(line)
-        self.record_iteration_message(line)
-        line = f"  ├─ Reward/Risk: {rr_display}"
-        print(line)
-        self.record_iteration_message(line)
-        line = f"  └─ Reason: {reason_text}"
-        print(line)
-        self.record_iteration_message(line)
+        pnl_color = GAIN if net_unrealized >= 0 else LOSS
+        gross_color = GAIN if gross_unrealized >= 0 else LOSS
+
+        lines = [
+            HOLD_HEADER_FMT % (coin, pos['side'].upper(), leverage_display),
+            HOLD_SIZE_FMT % (quantity, coin, margin_value),
+            HOLD_TARGETS_FMT % (target_price, stop_price),
+            HOLD_PNL_FMT % (pnl_color, net_unrealized, gross_color, gross_unrealized, total_fees_now),
+            HOLD_AT_TARGET_FMT % (gross_at_target, net_at_target),
+            HOLD_AT_STOP_FMT % (gross_at_stop, net_at_stop),
+            HOLD_REWARD_RISK_FMT % (rr_display,),
+            HOLD_REASON_FMT % (reason_text,),
+        ]
+        # Figures identical to last iteration's block (the LLM's reason aside)
+        # collapse to a single line instead of reprinting the whole block.
+        figures = tuple(lines[:-1])
+        if _last_hold_figures.get(coin) == figures:
+            lines = [HOLD_UNCHANGED_FMT % (coin,)]
+        else:
+            _last_hold_figures[coin] = figures
+        # One write for the whole block instead of one print per line.
+        print("\n".join(lines))
+        for line in lines:
+            self.record_iteration_message(line)
 
     def process_ai_decisions(self, decisions: Dict[str, Any]) -> None:
         """Handle AI decisions for each tracked coin.
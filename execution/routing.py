@@ -5,10 +5,12 @@ routing live trades to the appropriate exchange backends.
 """
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import logging
+import threading
 
 from exchange.base import CloseResult, EntryResult
 from exchange.factory import get_exchange_client
@@ -22,6 +24,27 @@ from config import resolve_symbol_for_coin
 MIN_REWARD_FEE_RATIO = 3.0
 MIN_EXPECTED_REWARD_USD = 1.0
 
+# Market data for open positions (SL/TP checks, price refreshes for equity) is
+# fetched on this shared pool, one request per symbol in parallel, so worker
+# threads are not re-spawned per call and the last position is not a full
+# round-trip per position late.
+FETCH_POOL_WORKERS = 8
+_fetch_pool: Optional[ThreadPoolExecutor] = None
+_fetch_pool_lock = threading.Lock()
+
+
+def get_fetch_pool() -> ThreadPoolExecutor:
+    """Return the shared market data fetch pool, creating it on first use."""
+    global _fetch_pool
+    if _fetch_pool is None:
+        with _fetch_pool_lock:
+            if _fetch_pool is None:
+                _fetch_pool = ThreadPoolExecutor(
+                    max_workers=FETCH_POOL_WORKERS,
+                    thread_name_prefix="market-fetch",
+                )
+    return _fetch_pool
+
 
 @dataclass
 class EntryPlan:
@@ -528,19 +551,30 @@ def check_stop_loss_take_profit_for_positions(
     if hyperliquid_is_live:
         return
 
+    coin_to_symbol = {c: s for s, c in symbol_to_coin.items()}
+    targets: List[Tuple[str, str]] = []
     for coin in list(positions.keys()):
-        symbol = next((s for s, c in symbol_to_coin.items() if c == coin), None)
-        if not symbol:
-            symbol = resolve_symbol_for_coin(coin)
+        symbol = coin_to_symbol.get(coin) or resolve_symbol_for_coin(coin)
         if not symbol:
             logging.debug(
                 "No symbol mapping found for coin %s when checking stop loss / take profit",
                 coin,
             )
             continue
+        targets.append((coin, symbol))
+
+    if not targets:
+        return
+    if len(targets) == 1:
+        snapshots = [fetch_market_data(targets[0][1])]
+    else:
+        snapshots = list(
+            get_fetch_pool().map(fetch_market_data, [symbol for _, symbol in targets])
+        )
 
-        data = fetch_market_data(symbol)
-        if not data:
+    # Closes run sequentially on this thread once every candle is in hand.
+    for (coin, _), data in zip(targets, snapshots):
+        if not data or coin not in positions:
             continue
 
         pos = positions[coin]
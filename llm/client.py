@@ -7,9 +7,12 @@ prompt formatting, API calls, and response parsing.
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from config.settings import (
     LLM_API_KEY,
@@ -22,12 +25,100 @@ from config.settings import (
     TRADING_RULES_PROMPT,
     SYMBOL_TO_COIN,
 )
+from utils.json_codec import json_dumps, json_loads
 from llm.parser import (
     recover_partial_decisions as _strategy_recover_partial_decisions,
     parse_llm_json_decisions as _strategy_parse_llm_json_decisions,
 )
 
 
+# ───────────────────────── HTTP SESSION ─────────────────────────
+_llm_session: Optional[requests.Session] = None
+# One decision call per iteration; a small pool is enough to keep it warm.
+LLM_SESSION_POOL_SIZE = 4
+# Gateway errors mean the provider did not produce a completion, so the POST
+# is retried (with backoff) rather than losing the iteration's decisions.
+# Read timeouts are not retried: each attempt may already have waited 90 s.
+LLM_RETRY_STATUSES = (502, 503, 504)
+
+
+def get_llm_session() -> requests.Session:
+    """Return the shared HTTP session used for LLM API calls.
+
+    Reusing one session keeps the TLS connection to the provider alive
+    between iterations instead of paying a fresh handshake on every call.
+    """
+    global _llm_session
+    if _llm_session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=LLM_SESSION_POOL_SIZE,
+            pool_maxsize=LLM_SESSION_POOL_SIZE,
+            max_retries=Retry(
+                total=2,
+                read=0,
+                backoff_factor=0.3,
+                status_forcelist=LLM_RETRY_STATUSES,
+                allowed_methods=frozenset({"POST"}),
+                raise_on_status=False,
+            ),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _llm_session = session
+    return _llm_session
+
+
+@lru_cache(maxsize=8)
+def _build_request_headers(api_key: str, api_type: str) -> Dict[str, str]:
+    """Return the HTTP headers for an LLM request, built once per key/provider.
+
+    The returned dict is shared between calls and must not be mutated.
+    """
+    headers: Dict[str, str] = {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+    }
+    if (api_type or "openrouter").lower() == "openrouter":
+        headers["HTTP-Referer"] = "https://github.com/crypto-trading-bot"
+        headers["X-Title"] = "DeepSeek Trading Bot"
+    return headers
+
+
+# Model prefixes whose providers only reuse a prompt prefix when it is
+# explicitly marked with a cache breakpoint. DeepSeek/OpenAI-style providers
+# cache identical prefixes automatically and need no annotation.
+_EXPLICIT_PROMPT_CACHE_PREFIXES: Tuple[str, ...] = ("anthropic/", "claude")
+
+
+@lru_cache(maxsize=8)
+def _build_system_message(rules_prompt: str, model_name: str, api_type: str) -> Dict[str, Any]:
+    """Return the system message carrying the static trading rules.
+
+    The rules prompt is identical on every call, so it is sent first and, for
+    models routed through OpenRouter that require it, tagged with an
+    ephemeral ``cache_control`` breakpoint so the provider can serve the
+    prefix from its prompt cache instead of re-processing it each iteration.
+    The message is built once per rules/model/provider and shared between
+    calls, so it must not be mutated.
+    """
+    model = (model_name or "").lower()
+    if (api_type or "openrouter").lower() == "openrouter" and model.startswith(
+        _EXPLICIT_PROMPT_CACHE_PREFIXES
+    ):
+        return {
+            "role": "system",
+            "content": [
+                {
+                    "type": "text",
+                    "text": rules_prompt,
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ],
+        }
+    return {"role": "system", "content": rules_prompt}
+
+
 def _recover_partial_decisions(json_str: str) -> Optional[Tuple[Dict[str, Any], List[str]]]:
     """Attempt to salvage individual coin decisions from truncated JSON.
 
@@ -35,12 +126,15 @@ def _recover_partial_decisions(json_str: str) -> Optional[Tuple[Dict[str, Any],
     that the recovery algorithm lives in strategy_core while preserving this
     helper's name and signature for existing callers and tests.
     """
-    coins = list(SYMBOL_TO_COIN.values())
-    return _strategy_recover_partial_decisions(json_str, coins)
+    # Read at call time: the universe mapping can be swapped at runtime.
+    return _strategy_recover_partial_decisions(json_str, SYMBOL_TO_COIN.values())
 
 
 def _log_llm_decisions(decisions: Dict[str, Any]) -> None:
     """Log a compact, human-readable summary of LLM decisions for all coins."""
+    # The summary is built line by line, so skip it when INFO is filtered out.
+    if not logging.getLogger().isEnabledFor(logging.INFO):
+        return
     try:
         parts: List[str] = []
         summary_parts: List[str] = []
@@ -122,36 +216,20 @@ def call_deepseek_api(
         )
 
         request_payload: Dict[str, Any] = {
-            "model": LLM_MODEL_NAME,
+            **request_metadata,
             "messages": [
-                {
-                    "role": "system",
-                    "content": TRADING_RULES_PROMPT,
-                },
+                _build_system_message(TRADING_RULES_PROMPT, LLM_MODEL_NAME, LLM_API_TYPE),
                 {
                     "role": "user",
                     "content": prompt,
                 },
             ],
-            "temperature": LLM_TEMPERATURE,
-            "max_tokens": LLM_MAX_TOKENS,
-        }
-        if LLM_THINKING_PARAM is not None:
-            request_payload["thinking"] = LLM_THINKING_PARAM
-
-        headers: Dict[str, str] = {
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json",
         }
-        api_type = (LLM_API_TYPE or "openrouter").lower()
-        if api_type == "openrouter":
-            headers["HTTP-Referer"] = "https://github.com/crypto-trading-bot"
-            headers["X-Title"] = "DeepSeek Trading Bot"
 
-        response = requests.post(
+        response = get_llm_session().post(
             url=LLM_API_BASE_URL,
-            headers=headers,
-            json=request_payload,
+            headers=_build_request_headers(api_key, LLM_API_TYPE),
+            data=json_dumps(request_payload),
             timeout=90,
         )
 
@@ -165,7 +243,7 @@ def call_deepseek_api(
             )
             return None
 
-        result = response.json()
+        result = json_loads(response.content)
         choices = result.get("choices")
         if not choices:
             notify_error_fn(
@@ -7,8 +7,31 @@ from __future__ import annotations
 
 import json
 import logging
+import re
+from functools import lru_cache
 from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
+from utils.json_codec import json_loads
+
+# Tokens that matter when matching braces in (possibly truncated) JSON: whole
+# string literals, so braces inside strings are skipped in one C-level match,
+# and bare braces. A string cut off by truncation runs to the end of the input.
+_JSON_BRACE_TOKEN_RE = re.compile(r'"(?:[^"\\]|\\.)*(?:"|\\?\Z)|[{}]', re.DOTALL)
+
+
+def _find_object_end(json_str: str, obj_start: int) -> Optional[int]:
+    """Return the index of the brace closing the object opened at ``obj_start``."""
+    depth = 0
+    for match in _JSON_BRACE_TOKEN_RE.finditer(json_str, obj_start):
+        token = match.group()
+        if token == "{":
+            depth += 1
+        elif token == "}":
+            depth -= 1
+            if depth == 0:
+                return match.start()
+    return None
+
 
 def recover_partial_decisions(
     json_str: str,
@@ -42,39 +65,14 @@ def recover_partial_decisions(
             missing.append(coin)
             continue
 
-        depth = 0
-        in_string = False
-        escaped = False
-        end_idx: Optional[int] = None
-
-        for idx in range(obj_start, len(json_str)):
-            char = json_str[idx]
-            if in_string:
-                if escaped:
-                    escaped = False
-                elif char == "\\":
-                    escaped = True
-                elif char == '"':
-                    in_string = False
-                continue
-
-            if char == '"':
-                in_string = True
-            elif char == "{":
-                depth += 1
-            elif char == "}":
-                depth -= 1
-                if depth == 0:
-                    end_idx = idx
-                    break
-
+        end_idx = _find_object_end(json_str, obj_start)
         if end_idx is None:
             missing.append(coin)
             continue
 
         block = json_str[obj_start : end_idx + 1]
         try:
-            recovered[coin] = json.loads(block)
+            recovered[coin] = json_loads(block)
         except json.JSONDecodeError:
             missing.append(coin)
 
@@ -127,7 +125,7 @@ def parse_llm_json_decisions(
     if start != -1 and end > start:
         json_str = content[start:end]
         try:
-            decisions = json.loads(json_str)
+            decisions = json_loads(json_str)
             log_llm_decisions(decisions)
             return decisions
         except json.JSONDecodeError as decode_err:
@@ -191,32 +189,34 @@ def parse_llm_json_decisions(
     return None
 
 
+@lru_cache(maxsize=None)
+def _text_signal_patterns(coin_lower: str) -> Tuple[re.Pattern, ...]:
+    """Return the compiled plain-text signal patterns for a lowercase coin."""
+    coin_re = re.escape(coin_lower)
+    # Pattern: "COIN: signal" or "COIN - signal" or "COIN signal"
+    return (
+        re.compile(rf'\b{coin_re}\s*[:\-]\s*(hold|entry|close|long|short|buy|sell)\b'),
+        re.compile(rf'\b{coin_re}\s+(hold|entry|close|long|short|buy|sell)\b'),
+        re.compile(rf'(hold|entry|close|long|short|buy|sell)\s+{coin_re}\b'),
+    )
+
+
 def _extract_signals_from_text(content: str) -> Optional[Dict[str, Any]]:
     """Try to extract trading signals from plain text response.
     
     This handles cases where the LLM returns analysis text instead of JSON.
     Looks for patterns like "BTC: hold", "ETH: entry long", etc.
     """
-    import re
     from config.settings import SYMBOL_TO_COIN
     
-    coins = list(SYMBOL_TO_COIN.values())
     decisions: Dict[str, Any] = {}
     content_lower = content.lower()
     
-    for coin in coins:
-        coin_lower = coin.lower()
-        
-        # Look for explicit signal patterns
-        # Pattern: "COIN: signal" or "COIN - signal" or "COIN signal"
-        patterns = [
-            rf'\b{coin_lower}\s*[:\-]\s*(hold|entry|close|long|short|buy|sell)\b',
-            rf'\b{coin_lower}\s+(hold|entry|close|long|short|buy|sell)\b',
-            rf'(hold|entry|close|long|short|buy|sell)\s+{coin_lower}\b',
-        ]
+    for coin in SYMBOL_TO_COIN.values():
+        patterns = _text_signal_patterns(coin.lower())
         
         for pattern in patterns:
-            match = re.search(pattern, content_lower)
+            match = pattern.search(content_lower)
             if match:
                 signal_word = match.group(1) if match.lastindex else match.group(0)
                 signal_word = signal_word.strip().lower()
@@ -5,14 +5,18 @@ to the LLM for trading decision generation.
 """
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
-from typing import Any, Callable, Dict, List, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 
 from config.settings import (
+    _INTERVAL_TO_SECONDS,
     INTERVAL,
     START_CAPITAL,
     EMA_LEN,
@@ -24,9 +28,12 @@ from config.settings import (
 from config import get_effective_symbol_universe, resolve_coin_for_symbol
 from strategy.snapshot import build_market_snapshot as _strategy_build_market_snapshot
 from strategy.indicators import (
-    add_indicator_columns,
+    attach_columns,
+    calculate_indicator_columns,
     calculate_atr_series,
     calculate_indicators,
+    calculate_sma_series,
+    calculate_swing_levels,
 )
 
 
@@ -303,6 +310,114 @@ IMPORTANT:
     return "\n".join(prompt_lines)
 
 
+# Positions 1-5 of every kline row hold OHLCV (Binance layout, mirrored by
+# BackpackMarketDataClient.get_klines). The remaining columns are unused here.
+_KLINE_OHLCV_COLUMNS = ["open", "high", "low", "close", "volume"]
+
+
+def _klines_to_ohlcv_frame(klines: List[List[Any]]) -> pd.DataFrame:
+    """Build a float64 OHLCV DataFrame from raw kline rows.
+
+    The numeric fields are parsed in a single NumPy conversion instead of
+    materialising all twelve object-dtype columns and casting them afterwards.
+    """
+    values = np.asarray([row[1:6] for row in klines], dtype=np.float64)
+    return pd.DataFrame(
+        values.reshape(-1, len(_KLINE_OHLCV_COLUMNS)),
+        columns=_KLINE_OHLCV_COLUMNS,
+    )
+
+
+# Upper bound on concurrent per-symbol snapshot fetches; stays below the
+# default urllib3 pool size (10) of the market data clients' sessions.
+SNAPSHOT_FETCH_MAX_WORKERS = 8
+
+
+# ───────────────────────── HIGHER-TIMEFRAME KLINE CACHE ─────────────────────────
+# (symbol, interval) -> (monotonic expiry, market client, closed raw klines)
+_KLINE_CACHE: Dict[Tuple[str, str], Tuple[float, Any, List[List[Any]]]] = {}
+
+# Klines fetched on a cache hit to refresh the still-forming bar. Two, so the
+# first one overlaps the cached closed bars and a gap is detected.
+_LIVE_KLINE_LIMIT = 2
+
+
+def _seconds_until_next_bar(interval: str) -> float:
+    """Return seconds until the current ``interval`` bar closes (0 if unknown)."""
+    bar_seconds = _INTERVAL_TO_SECONDS.get(interval)
+    if not bar_seconds:
+        return 0.0
+    return bar_seconds - (time.time() % bar_seconds)
+
+
+def _cached_indicator_frame(
+    market_client: Any,
+    symbol: str,
+    interval: str,
+    limit: int,
+    enrich: Callable[[pd.DataFrame], pd.DataFrame],
+) -> pd.DataFrame:
+    """Return enriched klines for a higher timeframe, refetching only the live bar.
+
+    1h/4h bars close far less often than the bot iterates, so the closed bars
+    are kept until the next bar boundary and each call fetches just the last
+    couple of klines. The still-forming bar, and so the indicators on the last
+    row, stay current. If the fresh klines do not overlap the cached ones (a
+    bar closed early, or the client's clock moved, as in backtests) the full
+    history is fetched again. Entries are tied to the client that produced
+    them, so switching the market data backend (or a test stub) never serves
+    another client's data. Empty fetches are not cached.
+    """
+    key = (symbol, interval)
+    cached = _KLINE_CACHE.get(key)
+    now = time.monotonic()
+    klines: List[List[Any]] = []
+    if cached is not None and cached[1] is market_client and now < cached[0]:
+        closed = cached[2]
+        live = market_client.get_klines(symbol=symbol, interval=interval, limit=_LIVE_KLINE_LIMIT)
+        if live and closed and live[0][0] <= closed[-1][0]:
+            first_open = live[0][0]
+            klines = [row for row in closed if row[0] < first_open] + list(live)
+            klines = klines[-limit:]
+
+    if not klines:
+        klines = market_client.get_klines(symbol=symbol, interval=interval, limit=limit)
+        if not klines:
+            _KLINE_CACHE.pop(key, None)
+            return _klines_to_ohlcv_frame(klines)
+        _KLINE_CACHE[key] = (
+            now + _seconds_until_next_bar(interval),
+            market_client,
+            list(klines[:-1]),
+        )
+
+    return enrich(_klines_to_ohlcv_frame(klines))
+
+
+def _enrich_structure_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Add the 1h structure indicators used by the market snapshot."""
+    columns = calculate_indicator_columns(df, ema_lengths=(20, 50))
+    swing_high, swing_low = calculate_swing_levels(df, 5)
+    volume_sma = calculate_sma_series(df["volume"], 20).to_numpy()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        volume_ratio = df["volume"].to_numpy(dtype=np.float64) / np.where(
+            volume_sma == 0, np.nan, volume_sma
+        )
+    columns["swing_high"] = swing_high.to_numpy()
+    columns["swing_low"] = swing_low.to_numpy()
+    columns["volume_sma"] = volume_sma
+    columns["volume_ratio"] = volume_ratio
+    return attach_columns(df, columns)
+
+
+def _enrich_trend_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Add the 4h trend indicators used by the market snapshot."""
+    columns = calculate_indicator_columns(df, ema_lengths=(20, 50, 200))
+    columns["macd_histogram"] = columns["macd"] - columns["macd_signal"]
+    columns["atr"] = calculate_atr_series(df, 14).to_numpy()
+    return attach_columns(df, columns)
+
+
 def fetch_market_data(
     symbol: str,
     get_market_data_client: Callable[[], Any],
@@ -320,17 +435,7 @@ def fetch_market_data(
             logging.warning("Skipping market data fetch for %s: no klines returned.", symbol)
             return None
 
-        df = pd.DataFrame(
-            klines,
-            columns=[
-                "timestamp", "open", "high", "low", "close", "volume",
-                "close_time", "quote_volume", "trades", "taker_base", "taker_quote", "ignore",
-            ],
-        )
-        df["close"] = df["close"].astype(float)
-        df["high"] = df["high"].astype(float)
-        df["low"] = df["low"].astype(float)
-        df["open"] = df["open"].astype(float)
+        df = _klines_to_ohlcv_frame(klines)
 
         last = calculate_indicators(df, EMA_LEN, RSI_LEN, MACD_FAST, MACD_SLOW, MACD_SIGNAL)
         latest_bar = df.iloc[-1]
@@ -350,7 +455,7 @@ def fetch_market_data(
             "funding_rate": funding_rate,
         }
     except Exception as e:
-        logging.error(f"Error fetching data for {symbol}: {e}")
+        logging.error("Error fetching data for %s: %s", symbol, e)
         return None
 
 
@@ -366,52 +471,30 @@ def collect_prompt_market_data(
 
     try:
         execution_klines = market_client.get_klines(symbol=symbol, interval=interval, limit=200)
-        df_execution = pd.DataFrame(
-            execution_klines,
-            columns=[
-                "timestamp", "open", "high", "low", "close", "volume",
-                "close_time", "quote_volume", "trades", "taker_base", "taker_quote", "ignore",
-            ],
-        )
+        df_execution = _klines_to_ohlcv_frame(execution_klines)
         if df_execution.empty:
             return None
 
-        numeric_cols = ["open", "high", "low", "close", "volume"]
-        df_execution[numeric_cols] = df_execution[numeric_cols].astype(float)
-        df_execution["mid_price"] = (df_execution["high"] + df_execution["low"]) / 2
-        df_execution = add_indicator_columns(df_execution)
+        columns = {
+            "mid_price": (
+                df_execution["high"].to_numpy(dtype=np.float64)
+                + df_execution["low"].to_numpy(dtype=np.float64)
+            ) / 2,
+        }
+        columns.update(calculate_indicator_columns(df_execution))
+        df_execution = attach_columns(df_execution, columns)
 
-        structure_klines = market_client.get_klines(symbol=symbol, interval="1h", limit=100)
-        df_structure = pd.DataFrame(
-            structure_klines,
-            columns=[
-                "timestamp", "open", "high", "low", "close", "volume",
-                "close_time", "quote_volume", "trades", "taker_base", "taker_quote", "ignore",
-            ],
+        df_structure = _cached_indicator_frame(
+            market_client, symbol, "1h", 100, _enrich_structure_frame
         )
         if df_structure.empty:
             return None
-        df_structure[numeric_cols] = df_structure[numeric_cols].astype(float)
-        df_structure = add_indicator_columns(df_structure, ema_lengths=(20, 50))
-        df_structure["swing_high"] = df_structure["high"].rolling(window=5, center=True).max()
-        df_structure["swing_low"] = df_structure["low"].rolling(window=5, center=True).min()
-        df_structure["volume_sma"] = df_structure["volume"].rolling(window=20).mean()
-        df_structure["volume_ratio"] = df_structure["volume"] / df_structure["volume_sma"].replace(0, np.nan)
-
-        trend_klines = market_client.get_klines(symbol=symbol, interval="4h", limit=100)
-        df_trend = pd.DataFrame(
-            trend_klines,
-            columns=[
-                "timestamp", "open", "high", "low", "close", "volume",
-                "close_time", "quote_volume", "trades", "taker_base", "taker_quote", "ignore",
-            ],
+
+        df_trend = _cached_indicator_frame(
+            market_client, symbol, "4h", 100, _enrich_trend_frame
         )
         if df_trend.empty:
             return None
-        df_trend[numeric_cols] = df_trend[numeric_cols].astype(float)
-        df_trend = add_indicator_columns(df_trend, ema_lengths=(20, 50, 200))
-        df_trend["macd_histogram"] = df_trend["macd"] - df_trend["macd_signal"]
-        df_trend["atr"] = calculate_atr_series(df_trend, 14)
 
         open_interest_values = market_client.get_open_interest_history(symbol=symbol, limit=30)
         funding_rates = market_client.get_funding_rate_history(symbol=symbol, limit=30)
@@ -441,24 +524,27 @@ def build_position_payloads(
     """Build position payloads for the prompt context."""
     position_payloads = []
     for coin, pos in positions.items():
-        current_price = market_snapshots.get(coin, {}).get("price", pos["entry_price"])
+        entry_price = pos["entry_price"]
+        side = pos["side"]
+        raw_leverage = pos.get("leverage", 1)
+        snapshot = market_snapshots.get(coin)
+        current_price = snapshot.get("price", entry_price) if snapshot else entry_price
         quantity = pos["quantity"]
         gross_unrealized = calculate_unrealized_pnl(coin, current_price)
-        leverage = pos.get("leverage", 1) or 1
-        if pos["side"] == "long":
-            liquidation_price = pos["entry_price"] * max(0.0, 1 - 1 / leverage)
+        inverse_leverage = 1 / (raw_leverage or 1)
+        if side == "long":
+            liquidation_price = entry_price * max(0.0, 1 - inverse_leverage)
         else:
-            liquidation_price = pos["entry_price"] * (1 + 1 / leverage)
-        notional_value = quantity * current_price
+            liquidation_price = entry_price * (1 + inverse_leverage)
         position_payloads.append({
             "symbol": coin,
-            "side": pos["side"],
+            "side": side,
             "quantity": quantity,
-            "entry_price": pos["entry_price"],
+            "entry_price": entry_price,
             "current_price": current_price,
             "liquidation_price": liquidation_price,
             "unrealized_pnl": gross_unrealized,
-            "leverage": pos.get("leverage", 1),
+            "leverage": raw_leverage,
             "exit_plan": {
                 "profit_target": pos.get("profit_target"),
                 "stop_loss": pos.get("stop_loss"),
@@ -471,7 +557,7 @@ def build_position_payloads(
             "wait_for_fill": pos.get("wait_for_fill", False),
             "entry_oid": pos.get("entry_oid", -1),
             "live_backend": pos.get("live_backend"),
-            "notional_usd": notional_value,
+            "notional_usd": quantity * current_price,
         })
     return position_payloads
 
@@ -498,9 +584,23 @@ def format_prompt_for_deepseek(
     symbol_universe = get_effective_symbol_universe()
     logging.info("Collecting market data for %d symbols...", len(symbol_universe))
     market_snapshots: Dict[str, Dict[str, Any]] = {}
-    for symbol in symbol_universe:
+    # Resolve the client once so worker threads never race its lazy init.
+    market_client = get_market_data_client()
+
+    def _collect(symbol: str) -> Optional[Dict[str, Any]]:
         logging.debug("Fetching market snapshot for %s...", symbol)
-        snapshot = collect_prompt_market_data(symbol, get_market_data_client, interval)
+        return collect_prompt_market_data(symbol, lambda: market_client, interval)
+
+    if len(symbol_universe) > 1:
+        # Snapshots are independent and dominated by HTTP latency, so fetch
+        # them concurrently; map() keeps the universe order for the prompt.
+        workers = min(SNAPSHOT_FETCH_MAX_WORKERS, len(symbol_universe))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="snapshot") as pool:
+            snapshots = list(pool.map(_collect, symbol_universe))
+    else:
+        snapshots = [_collect(symbol) for symbol in symbol_universe]
+
+    for snapshot in snapshots:
         if snapshot:
             market_snapshots[snapshot["coin"]] = snapshot
             logging.debug("Got snapshot for %s: price=%.4f", snapshot["coin"], snapshot.get("price", 0))
@@ -510,19 +610,20 @@ def format_prompt_for_deepseek(
         len(symbol_universe),
     )
 
+    position_payloads = build_position_payloads(
+        positions, market_snapshots, calculate_unrealized_pnl
+    )
+
+    # Equity reuses the payloads' mark prices and PnL rather than looking
+    # each position's snapshot up and pricing it a second time.
     total_margin = calculate_total_margin()
     total_equity = balance + total_margin
-    for coin, pos in positions.items():
-        current_price = market_snapshots.get(coin, {}).get("price", pos["entry_price"])
-        total_equity += calculate_unrealized_pnl(coin, current_price)
+    for payload in position_payloads:
+        total_equity += payload["unrealized_pnl"]
 
     total_return = ((total_equity - START_CAPITAL) / START_CAPITAL) * 100 if START_CAPITAL else 0.0
     net_unrealized_total = total_equity - balance - total_margin
 
-    position_payloads = build_position_payloads(
-        positions, market_snapshots, calculate_unrealized_pnl
-    )
-
     context = {
         "minutes_running": minutes_running,
         "now_iso": now.isoformat(),
@@ -540,3 +641,14 @@ def format_prompt_for_deepseek(
     }
 
     return build_trading_prompt(context)
+
+
+def prompt_fingerprint(prompt: str) -> str:
+    """Return a digest of the prompt's market and account content.
+
+    The first line only carries the clock, uptime, and invocation counter,
+    which change on every call, so it is excluded: two prompts with the same
+    fingerprint describe the same market data, account, and positions.
+    """
+    _, _, body = prompt.partition("\n")
+    return hashlib.blake2b(body.encode("utf-8"), digest_size=16).hexdigest()
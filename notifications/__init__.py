@@ -1,6 +1,8 @@
 """Notifications module for LLM-trader."""
 from notifications.telegram import (
     send_telegram_message,
+    enqueue_telegram_message,
+    flush_telegram_messages,
     send_entry_signal_to_telegram,
     send_close_signal_to_telegram,
     strip_ansi_codes,
@@ -8,6 +10,8 @@ from notifications.telegram import (
 )
 from notifications.logging import (
     log_ai_message,
+    enqueue_ai_message,
+    flush_ai_message_log,
     record_iteration_message,
     notify_error,
     emit_entry_console_log,
@@ -23,6 +27,8 @@ from notifications.telegram_commands import (
 __all__ = [
     # Telegram notifications
     "send_telegram_message",
+    "enqueue_telegram_message",
+    "flush_telegram_messages",
     "send_entry_signal_to_telegram",
     "send_close_signal_to_telegram",
     "strip_ansi_codes",
@@ -34,6 +40,8 @@ __all__ = [
     "process_telegram_commands",
     # Logging
     "log_ai_message",
+    "enqueue_ai_message",
+    "flush_ai_message_log",
     "record_iteration_message",
     "notify_error",
     "emit_entry_console_log",
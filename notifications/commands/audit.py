@@ -12,8 +12,6 @@ from datetime import datetime, timezone
 from decimal import Decimal
 from typing import Any, Dict, Optional, Union
 
-import ccxt
-
 from config.settings import get_effective_trading_backend
 from exchange.base import AuditData, AuditProvider
 from notifications.commands.base import TelegramCommand, CommandResult, escape_markdown
@@ -109,6 +107,8 @@ def _get_audit_provider(exchange: str) -> AuditProvider:
         )
 
     if exchange_lower == "binance":
+        import ccxt
+
         from exchange.binance import BinanceFuturesExchangeClient
 
         api_key = os.getenv("BN_API_KEY", "").strip()
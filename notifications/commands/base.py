@@ -13,6 +13,8 @@ from typing import Any, Callable, Dict, List, Optional, TYPE_CHECKING
 
 import requests
 
+from notifications.telegram import get_telegram_session
+
 if TYPE_CHECKING:
     from core.risk_control import RiskControlState
 
@@ -74,8 +76,11 @@ class TelegramCommandHandler:
             print(f"Received command: /{cmd.command} {cmd.args}")
     """
     
-    # API timeout for getUpdates (short polling, not long polling)
+    # getUpdates long-poll timeout: Telegram holds the request open this long
+    # when there are no updates (the HTTP timeout adds 5 s on top)
     DEFAULT_TIMEOUT = 5
+    # Long-poll timeout for a dedicated polling thread (Telegram allows up to 50 s)
+    LONG_POLL_TIMEOUT = 45
     # Maximum number of updates to fetch per poll
     DEFAULT_LIMIT = 10
     
@@ -94,7 +99,8 @@ class TelegramCommandHandler:
             bot_token: Telegram Bot API token.
             allowed_chat_id: Only commands from this chat ID will be returned.
             last_update_id: Initial offset for getUpdates (0 = start from oldest).
-            timeout: HTTP timeout for getUpdates request in seconds.
+            timeout: getUpdates long-poll timeout in seconds; the HTTP
+                timeout is this plus 5 s.
             limit: Maximum number of updates to fetch per poll.
         """
         self._bot_token = bot_token
@@ -175,7 +181,7 @@ class TelegramCommandHandler:
             params["offset"] = self._last_update_id + 1
         
         try:
-            response = requests.get(url, params=params, timeout=self._timeout + 5)
+            response = get_telegram_session().get(url, params=params, timeout=self._timeout + 5)
             
             if response.status_code != 200:
                 logging.warning(
@@ -312,6 +318,8 @@ def create_command_handler(
     bot_token: str,
     chat_id: str,
     last_update_id: int = 0,
+    *,
+    timeout: int = TelegramCommandHandler.DEFAULT_TIMEOUT,
 ) -> Optional[TelegramCommandHandler]:
     """Factory function to create a TelegramCommandHandler if configured.
     
@@ -319,6 +327,7 @@ def create_command_handler(
         bot_token: Telegram Bot API token.
         chat_id: Allowed chat ID for command filtering.
         last_update_id: Initial offset for getUpdates.
+        timeout: getUpdates long-poll timeout in seconds.
     
     Returns:
         TelegramCommandHandler instance if both bot_token and chat_id are set,
@@ -330,6 +339,7 @@ def create_command_handler(
         bot_token=bot_token,
         allowed_chat_id=chat_id,
         last_update_id=last_update_id,
+        timeout=timeout,
     )
 
 
@@ -462,7 +472,7 @@ def register_telegram_commands(bot_token: str) -> None:
         ],
     }
     try:
-        response = requests.post(url, json=payload, timeout=10)
+        response = get_telegram_session().post(url, json=payload, timeout=10)
         if response.status_code != 200:
             logging.warning(
                 "Failed to set Telegram bot commands: HTTP %d | response=%s",
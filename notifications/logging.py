@@ -6,14 +6,16 @@ and error notifications.
 """
 from __future__ import annotations
 
+import atexit
 import csv
 import json
 import logging
+import queue
+import threading
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
-
-from colorama import Fore, Style
+from typing import Any, Callable, Dict, List, MutableSequence, Optional, Tuple
 
+from display.console import GAIN, LOSS
 from notifications.telegram import strip_ansi_codes
 
 
@@ -53,7 +55,7 @@ def emit_entry_console_log(
     bot.execute_entry but delegates printing and iteration recording to the
     provided callables.
     """
-    line = f"{Fore.GREEN}[ENTRY] {coin} {side.upper()} {leverage_display} @ ${entry_price:.4f}"
+    line = f"{GAIN}[ENTRY] {coin} {side.upper()} {leverage_display} @ ${entry_price:.4f}"
     _emit_line(line, print_fn, record_fn)
 
     line = f"  ├─ Size: {quantity:.4f} {coin} | Margin: ${margin_required:.2f}"
@@ -124,7 +126,7 @@ def emit_close_console_log(
 
     Mirrors the formatting previously implemented inline in bot.execute_close.
     """
-    color = Fore.GREEN if net_pnl >= 0 else Fore.RED
+    color = GAIN if net_pnl >= 0 else LOSS
     line = f"{color}[CLOSE] {coin} {pos['side'].upper()} {pos['quantity']:.4f} @ ${current_price:.4f}"
     _emit_line(line, print_fn, record_fn)
 
@@ -149,18 +151,18 @@ def emit_close_console_log(
     _emit_line(line, print_fn, record_fn)
 
 
-def record_iteration_message(messages: Optional[List[str]], text: str) -> None:
+def record_iteration_message(messages: Optional[MutableSequence[str]], text: str) -> None:
     """Record console output for this iteration to share via Telegram."""
     if messages is None:
         return
     messages.append(strip_ansi_codes(text).rstrip())
 
 
-def _append_recent_ai_message(
+def _append_recent_ai_messages(
     *,
     messages_recent_csv: Path,
     max_recent_messages: int,
-    row: List[str],
+    new_rows: List[List[str]],
 ) -> None:
     rows: List[List[str]] = []
     header = ["timestamp", "direction", "role", "content", "metadata"]
@@ -175,7 +177,7 @@ def _append_recent_ai_message(
                 header = existing_header
             for existing_row in reader:
                 rows.append(existing_row)
-    rows.append(row)
+    rows.extend(new_rows)
     if len(rows) > max_recent_messages:
         rows = rows[-max_recent_messages:]
     with open(messages_recent_csv, "w", newline="") as f:
@@ -184,38 +186,130 @@ def _append_recent_ai_message(
         writer.writerows(rows)
 
 
-def log_ai_message(
-    *,
-    messages_csv: Path,
-    messages_recent_csv: Path,
-    max_recent_messages: int,
+def _build_ai_message_row(
     now_iso: str,
     direction: str,
     role: str,
     content: str,
-    metadata: Optional[Dict[str, Any]] = None,
-) -> None:
-    """Log raw messages exchanged with the AI provider."""
-    row = [
+    metadata: Optional[Dict[str, Any]],
+) -> List[str]:
+    return [
         now_iso,
         direction,
         role,
         content,
         json.dumps(metadata) if metadata else "",
     ]
+
+
+def _write_ai_message_rows(
+    messages_csv: Path,
+    messages_recent_csv: Path,
+    max_recent_messages: int,
+    rows: List[List[str]],
+) -> None:
     with open(messages_csv, "a", newline="") as f:
         writer = csv.writer(f)
-        writer.writerow(row)
+        writer.writerows(rows)
     try:
-        _append_recent_ai_message(
+        _append_recent_ai_messages(
             messages_recent_csv=messages_recent_csv,
             max_recent_messages=max_recent_messages,
-            row=row,
+            new_rows=rows,
         )
     except Exception as exc:  # pragma: no cover - defensive logging only
         logging.debug("Failed to update recent AI messages CSV: %s", exc)
 
 
+def log_ai_message(
+    *,
+    messages_csv: Path,
+    messages_recent_csv: Path,
+    max_recent_messages: int,
+    now_iso: str,
+    direction: str,
+    role: str,
+    content: str,
+    metadata: Optional[Dict[str, Any]] = None,
+) -> None:
+    """Log raw messages exchanged with the AI provider."""
+    row = _build_ai_message_row(now_iso, direction, role, content, metadata)
+    _write_ai_message_rows(messages_csv, messages_recent_csv, max_recent_messages, [row])
+
+
+# ───────────────────────── BACKGROUND AI MESSAGE WRITER ─────────────────────────
+# (messages_csv, messages_recent_csv, max_recent_messages) -> rows to append
+_AiMessageTarget = Tuple[Path, Path, int]
+_ai_message_queue: "queue.Queue[Tuple[_AiMessageTarget, List[str]]]" = queue.Queue()
+_ai_message_writer: Optional[threading.Thread] = None
+_ai_message_writer_lock = threading.Lock()
+
+
+def _drain_ai_message_queue() -> None:
+    """Write queued AI messages forever, one file pass per target per batch."""
+    while True:
+        batch = [_ai_message_queue.get()]
+        while True:
+            try:
+                batch.append(_ai_message_queue.get_nowait())
+            except queue.Empty:
+                break
+
+        grouped: Dict[_AiMessageTarget, List[List[str]]] = {}
+        for target, row in batch:
+            grouped.setdefault(target, []).append(row)
+        for (messages_csv, messages_recent_csv, max_recent), rows in grouped.items():
+            try:
+                _write_ai_message_rows(messages_csv, messages_recent_csv, max_recent, rows)
+            except Exception as exc:
+                logging.error("Failed to write %d AI message(s) to %s: %s", len(rows), messages_csv, exc)
+        for _ in batch:
+            _ai_message_queue.task_done()
+
+
+def _ensure_ai_message_writer() -> None:
+    global _ai_message_writer
+    if _ai_message_writer is not None:
+        return
+    with _ai_message_writer_lock:
+        if _ai_message_writer is None:
+            _ai_message_writer = threading.Thread(
+                target=_drain_ai_message_queue,
+                name="ai-message-writer",
+                daemon=True,
+            )
+            _ai_message_writer.start()
+            atexit.register(flush_ai_message_log)
+
+
+def enqueue_ai_message(
+    *,
+    messages_csv: Path,
+    messages_recent_csv: Path,
+    max_recent_messages: int,
+    now_iso: str,
+    direction: str,
+    role: str,
+    content: str,
+    metadata: Optional[Dict[str, Any]] = None,
+) -> None:
+    """Queue an AI message for ``log_ai_message``-style logging off the caller's thread.
+
+    The row is built immediately, so later changes to ``metadata`` are not
+    reflected; the CSV writes happen on a background thread that batches
+    whatever has queued up, rewriting the recent-messages file once per batch.
+    """
+    row = _build_ai_message_row(now_iso, direction, role, content, metadata)
+    _ensure_ai_message_writer()
+    _ai_message_queue.put(((messages_csv, messages_recent_csv, max_recent_messages), row))
+
+
+def flush_ai_message_log() -> None:
+    """Block until every queued AI message has been written."""
+    if _ai_message_writer is not None:
+        _ai_message_queue.join()
+
+
 def notify_error(
     *,
     message: str,
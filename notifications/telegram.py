@@ -6,11 +6,17 @@ trade signals and error messages.
 """
 from __future__ import annotations
 
+import atexit
 import logging
+import queue
 import re
+import threading
+import time
 from typing import Any, Callable, Dict, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from display.formatters import (
     build_entry_signal_message as _build_entry_signal_message,
@@ -18,6 +24,37 @@ from display.formatters import (
 )
 
 
+# ───────────────────────── HTTP SESSION ─────────────────────────
+# Notifications, command polling and setMyCommands all talk to
+# api.telegram.org, so one keep-alive session serves every Telegram call.
+# Only connection failures are retried; read timeouts and HTTP errors are
+# left to the callers, which log them.
+TELEGRAM_SESSION_POOL_SIZE = 4
+
+
+def _build_telegram_session() -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=TELEGRAM_SESSION_POOL_SIZE,
+        max_retries=Retry(total=2, read=0, status=0, backoff_factor=0.2),
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+_telegram_session = _build_telegram_session()
+
+
+def get_telegram_session() -> requests.Session:
+    """Return the shared HTTP session used for Telegram Bot API calls.
+
+    Reusing one session keeps the TLS connection to api.telegram.org alive
+    instead of paying a fresh handshake for every message and poll.
+    """
+    return _telegram_session
+
+
 ANSI_ESCAPE_RE = re.compile(r"\x1B\[[0-?]*[ -/]*[@-~]")
 
 
@@ -59,7 +96,7 @@ def send_telegram_message(
         if parse_mode:
             payload["parse_mode"] = parse_mode
 
-        response = requests.post(
+        response = _telegram_session.post(
             f"https://api.telegram.org/bot{bot_token}/sendMessage",
             json=payload,
             timeout=10,
@@ -83,7 +120,7 @@ def send_telegram_message(
                 "text": strip_ansi_codes(text),
             }
             try:
-                fallback_response = requests.post(
+                fallback_response = _telegram_session.post(
                     f"https://api.telegram.org/bot{bot_token}/sendMessage",
                     json=fallback_payload,
                     timeout=10,
@@ -100,6 +137,107 @@ def send_telegram_message(
         logging.error("Error sending Telegram message: %s", exc)
 
 
+# Pending notifications for the background sender; the oldest is dropped when full.
+TELEGRAM_QUEUE_SIZE = 32
+# Total seconds the exit flush waits for pending notifications, so a Telegram
+# outage cannot hold up shutdown.
+TELEGRAM_FLUSH_TIMEOUT = 15.0
+_telegram_queue: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=TELEGRAM_QUEUE_SIZE)
+_telegram_sender: Optional[threading.Thread] = None
+_telegram_sender_lock = threading.Lock()
+
+
+def _drain_telegram_queue() -> None:
+    """Send queued notifications forever, in the order they were queued."""
+    while True:
+        message = _telegram_queue.get()
+        try:
+            send_telegram_message(**message)
+        except Exception as exc:  # pragma: no cover - defensive logging only
+            logging.error("Error sending queued Telegram message: %s", exc)
+        finally:
+            _telegram_queue.task_done()
+
+
+def _ensure_telegram_sender() -> None:
+    global _telegram_sender
+    if _telegram_sender is not None:
+        return
+    with _telegram_sender_lock:
+        if _telegram_sender is None:
+            _telegram_sender = threading.Thread(
+                target=_drain_telegram_queue,
+                name="telegram-sender",
+                daemon=True,
+            )
+            _telegram_sender.start()
+            atexit.register(flush_telegram_messages)
+
+
+def enqueue_telegram_message(
+    *,
+    bot_token: str,
+    default_chat_id: str,
+    text: str,
+    chat_id: Optional[str] = None,
+    parse_mode: Optional[str] = "Markdown",
+) -> None:
+    """Queue a notification for ``send_telegram_message`` on a background thread.
+
+    The caller never waits on the Telegram API. If the API is down long enough
+    for ``TELEGRAM_QUEUE_SIZE`` messages to pile up, the oldest is dropped to
+    make room.
+    """
+    if not bot_token or not (chat_id or default_chat_id or "").strip():
+        return
+    message: Dict[str, Any] = {
+        "bot_token": bot_token,
+        "default_chat_id": default_chat_id,
+        "text": text,
+        "chat_id": chat_id,
+        "parse_mode": parse_mode,
+    }
+    _ensure_telegram_sender()
+    while True:
+        try:
+            _telegram_queue.put_nowait(message)
+            return
+        except queue.Full:
+            try:
+                _telegram_queue.get_nowait()
+            except queue.Empty:
+                continue
+            _telegram_queue.task_done()
+            logging.warning("Telegram queue full; dropped the oldest pending notification.")
+
+
+def flush_telegram_messages(timeout: Optional[float] = None) -> bool:
+    """Wait until every queued Telegram notification has been sent.
+
+    Args:
+        timeout: Total seconds to wait; defaults to TELEGRAM_FLUSH_TIMEOUT.
+
+    Returns:
+        True if the queue drained, False if the deadline passed first.
+    """
+    if _telegram_sender is None:
+        return True
+    if timeout is None:
+        timeout = TELEGRAM_FLUSH_TIMEOUT
+    deadline = time.monotonic() + timeout
+    with _telegram_queue.all_tasks_done:
+        while _telegram_queue.unfinished_tasks:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logging.warning(
+                    "Gave up waiting for %d pending Telegram notification(s).",
+                    _telegram_queue.unfinished_tasks,
+                )
+                return False
+            _telegram_queue.all_tasks_done.wait(remaining)
+    return True
+
+
 def send_entry_signal_to_telegram(
     *,
     coin: str,
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Summarise iteration profiles written with TRADEBOT_PROFILE_EVERY.
+
+Merges every ``iteration-*.prof`` file in the profile directory (default:
+``$TRADEBOT_DATA_DIR/profiles`` or ``data/profiles``) and prints the
+functions with the highest cumulative time.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import pstats
+import sys
+from pathlib import Path
+from typing import List
+
+
+def _default_profile_dir() -> Path:
+    data_dir = os.getenv("TRADEBOT_DATA_DIR")
+    if data_dir:
+        return Path(data_dir).expanduser() / "profiles"
+    return Path(__file__).resolve().parent.parent / "data" / "profiles"
+
+
+def _profile_files(profile_dir: Path) -> List[Path]:
+    return sorted(profile_dir.glob("iteration-*.prof"))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "profile_dir",
+        nargs="?",
+        type=Path,
+        default=_default_profile_dir(),
+        help="Directory holding iteration-*.prof files.",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=20,
+        help="Number of functions to print (default: 20).",
+    )
+    parser.add_argument(
+        "--sort",
+        default="cumulative",
+        help="pstats sort key, e.g. cumulative or tottime (default: cumulative).",
+    )
+    args = parser.parse_args()
+
+    files = _profile_files(args.profile_dir)
+    if not files:
+        print(f"No iteration profiles found in {args.profile_dir}", file=sys.stderr)
+        return 1
+
+    stats = pstats.Stats(str(files[0]))
+    for path in files[1:]:
+        stats.add(str(path))
+    print(f"Merged {len(files)} profile(s) from {args.profile_dir}")
+    stats.strip_dirs().sort_stats(args.sort).print_stats(args.top)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,11 +5,100 @@ used in trading strategies, including RSI, EMA, MACD, and ATR.
 """
 from __future__ import annotations
 
-from typing import Any, Iterable, List
+from typing import Any, Dict, Iterable, List, Tuple
 
 import numpy as np
 import pandas as pd
 
+from utils.jit import NUMBA_AVAILABLE, njit
+
+
+@njit
+def _ema_kernel(values: np.ndarray, alpha: float) -> np.ndarray:
+    """Indexed EMA recurrence over a non-empty, finite float64 array.
+
+    Compiled by numba when it is installed; ``_ema`` only calls it then,
+    since the interpreted version is slower than its list-based loop.
+    """
+    decay = 1.0 - alpha
+    out = np.empty(values.shape[0], dtype=np.float64)
+    prev = values[0]
+    out[0] = prev
+    for i in range(1, values.shape[0]):
+        prev = alpha * values[i] + decay * prev
+        out[i] = prev
+    return out
+
+
+def _ema(values: np.ndarray, alpha: float) -> np.ndarray:
+    """Return the ``adjust=False`` exponential moving average of a float array.
+
+    Evaluates the recurrence ``y[i] = alpha * x[i] + (1 - alpha) * y[i - 1]``
+    directly, which avoids pandas' ewm dispatch overhead on the short kline
+    windows used here. Inputs containing NaN/inf defer to pandas so its
+    missing-value weighting is preserved. With numba installed the
+    recurrence runs in the compiled ``_ema_kernel``.
+    """
+    if values.size == 0:
+        return values.astype(np.float64)
+    if not np.isfinite(values).all():
+        return pd.Series(values).ewm(alpha=alpha, adjust=False).mean().to_numpy()
+    if NUMBA_AVAILABLE:
+        return _ema_kernel(values.astype(np.float64, copy=False), alpha)
+
+    decay = 1.0 - alpha
+    out = np.empty(values.shape[0], dtype=np.float64)
+    prev = float(values[0])
+    out[0] = prev
+    for i, value in enumerate(values[1:].tolist(), 1):
+        prev = alpha * value + decay * prev
+        out[i] = prev
+    return out
+
+
+def _rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """Return the trailing ``window`` mean, NaN until the window is full.
+
+    Uses a single cumulative sum (O(N)) instead of pandas' rolling machinery.
+    Inputs containing NaN/inf defer to pandas, whose window counts skip them.
+    """
+    n = values.shape[0]
+    out = np.full(n, np.nan, dtype=np.float64)
+    if window <= 0 or n < window:
+        return out
+    if not np.isfinite(values).all():
+        return pd.Series(values).rolling(window=window).mean().to_numpy()
+
+    csum = np.cumsum(values, dtype=np.float64)
+    out[window - 1] = csum[window - 1]
+    out[window:] = csum[window:] - csum[:-window]
+    out[window - 1:] /= window
+    return out
+
+
+def _span_to_alpha(span: int) -> float:
+    """Convert an EMA span into its smoothing factor."""
+    return 2.0 / (span + 1.0)
+
+
+def _gains_and_losses(prices: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Split bar-to-bar price changes into non-negative gains and losses."""
+    delta = np.diff(prices, prepend=np.nan)
+    with np.errstate(invalid="ignore"):
+        gain = np.where(delta > 0, delta, 0.0)
+        loss = np.where(delta < 0, -delta, 0.0)
+    return gain, loss
+
+
+def _rsi(gain: np.ndarray, loss: np.ndarray, period: int) -> np.ndarray:
+    """Return Wilder RSI values from precomputed gains and losses."""
+    alpha = 1 / period
+    avg_gain = _ema(gain, alpha)
+    avg_loss = _ema(loss, alpha)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rs = avg_gain / np.where(avg_loss == 0, np.nan, avg_loss)
+        return 100 - 100 / (1 + rs)
+
 
 def calculate_rsi_series(close: pd.Series, period: int) -> pd.Series:
     """Return RSI series for specified period using Wilder's smoothing.
@@ -21,23 +110,21 @@ def calculate_rsi_series(close: pd.Series, period: int) -> pd.Series:
     Returns:
         Series of RSI values.
     """
-    delta = close.astype(float).diff()
-    gain = delta.where(delta > 0, 0.0)
-    loss = -delta.where(delta < 0, 0.0)
-    alpha = 1 / period
-    avg_gain = gain.ewm(alpha=alpha, adjust=False).mean()
-    avg_loss = loss.ewm(alpha=alpha, adjust=False).mean()
-    rs = avg_gain / avg_loss.replace(0, np.nan)
-    return 100 - 100 / (1 + rs)
+    gain, loss = _gains_and_losses(close.to_numpy(dtype=np.float64))
+    return pd.Series(_rsi(gain, loss, period), index=close.index)
 
 
-def add_indicator_columns(
+def calculate_indicator_columns(
     df: pd.DataFrame,
     ema_lengths: Iterable[int] = (20,),
     rsi_periods: Iterable[int] = (14,),
     macd_params: Iterable[int] = (12, 26, 9),
-) -> pd.DataFrame:
-    """Return copy of df with EMA, RSI, and MACD columns added.
+) -> Dict[str, np.ndarray]:
+    """Return EMA, RSI, and MACD arrays keyed by their column names.
+    
+    ``close`` is converted to an array once; EMAs shared between
+    ``ema_lengths`` and the MACD legs and the gain/loss split shared by all
+    RSI periods are computed once.
     
     Args:
         df: DataFrame with 'close' column.
@@ -46,28 +133,75 @@ def add_indicator_columns(
         macd_params: Tuple of (fast, slow, signal) periods for MACD.
         
     Returns:
-        DataFrame with indicator columns added.
+        Dict mapping column name to an array aligned with ``df``.
     """
     ema_lengths = tuple(dict.fromkeys(ema_lengths))
     rsi_periods = tuple(dict.fromkeys(rsi_periods))
     fast, slow, signal = macd_params
 
-    result = df.copy()
-    close = result["close"]
+    prices = df["close"].to_numpy(dtype=np.float64)
+    emas: Dict[int, np.ndarray] = {}
+
+    def ema_for(span: int) -> np.ndarray:
+        if span not in emas:
+            emas[span] = _ema(prices, _span_to_alpha(span))
+        return emas[span]
 
+    columns: Dict[str, np.ndarray] = {}
     for span in ema_lengths:
-        result[f"ema{span}"] = close.ewm(span=span, adjust=False).mean()
+        columns[f"ema{span}"] = ema_for(span)
+
+    if rsi_periods:
+        gain, loss = _gains_and_losses(prices)
+        for period in rsi_periods:
+            columns[f"rsi{period}"] = _rsi(gain, loss, period)
+
+    macd_line = ema_for(fast) - ema_for(slow)
+    columns["macd"] = macd_line
+    columns["macd_signal"] = _ema(macd_line, _span_to_alpha(signal))
+    return columns
+
 
-    for period in rsi_periods:
-        result[f"rsi{period}"] = calculate_rsi_series(close, period)
+def attach_columns(df: pd.DataFrame, columns: Dict[str, Any]) -> pd.DataFrame:
+    """Return a copy of df with ``columns`` attached in a single concat.
+    
+    Args:
+        df: DataFrame to extend.
+        columns: Mapping of column name to values aligned with ``df``.
+        
+    Returns:
+        DataFrame with the new columns appended, or overwritten in place of
+        existing columns of the same name.
+    """
+    if df.columns.isin(list(columns)).any():
+        # Re-enriching a frame: overwrite existing columns in place.
+        result = df.copy()
+        for name, values in columns.items():
+            result[name] = values
+        return result
+    return pd.concat([df, pd.DataFrame(columns, index=df.index)], axis=1)
 
-    ema_fast = close.ewm(span=fast, adjust=False).mean()
-    ema_slow = close.ewm(span=slow, adjust=False).mean()
-    macd_line = ema_fast - ema_slow
-    result["macd"] = macd_line
-    result["macd_signal"] = macd_line.ewm(span=signal, adjust=False).mean()
 
-    return result
+def add_indicator_columns(
+    df: pd.DataFrame,
+    ema_lengths: Iterable[int] = (20,),
+    rsi_periods: Iterable[int] = (14,),
+    macd_params: Iterable[int] = (12, 26, 9),
+) -> pd.DataFrame:
+    """Return copy of df with EMA, RSI, and MACD columns added.
+    
+    Args:
+        df: DataFrame with 'close' column.
+        ema_lengths: EMA periods to calculate.
+        rsi_periods: RSI periods to calculate.
+        macd_params: Tuple of (fast, slow, signal) periods for MACD.
+        
+    Returns:
+        DataFrame with indicator columns added.
+    """
+    return attach_columns(
+        df, calculate_indicator_columns(df, ema_lengths, rsi_periods, macd_params)
+    )
 
 
 def calculate_atr_series(df: pd.DataFrame, period: int) -> pd.Series:
@@ -80,22 +214,62 @@ def calculate_atr_series(df: pd.DataFrame, period: int) -> pd.Series:
     Returns:
         Series of ATR values.
     """
-    high = df["high"]
-    low = df["low"]
-    close = df["close"]
-    prev_close = close.shift(1)
-
-    tr_components = pd.concat(
-        [
-            high - low,
-            (high - prev_close).abs(),
-            (low - prev_close).abs(),
-        ],
-        axis=1,
+    high = df["high"].to_numpy(dtype=np.float64)
+    low = df["low"].to_numpy(dtype=np.float64)
+    close = df["close"].to_numpy(dtype=np.float64)
+    prev_close = np.concatenate(([np.nan], close[:-1])) if close.size else close
+
+    # fmax skips NaN like DataFrame.max(axis=1), so the first bar uses high-low.
+    true_range = np.fmax(
+        high - low,
+        np.fmax(np.abs(high - prev_close), np.abs(low - prev_close)),
     )
-    true_range = tr_components.max(axis=1)
     alpha = 1 / period
-    return true_range.ewm(alpha=alpha, adjust=False).mean()
+    return pd.Series(_ema(true_range, alpha), index=df.index)
+
+
+def calculate_sma_series(values: pd.Series, window: int) -> pd.Series:
+    """Return the simple moving average of ``values`` over ``window`` bars.
+    
+    Args:
+        values: Series of numeric values.
+        window: Number of trailing bars to average.
+        
+    Returns:
+        Series of SMA values, NaN until the window is full.
+    """
+    return pd.Series(
+        _rolling_mean(values.to_numpy(dtype=np.float64), window),
+        index=values.index,
+    )
+
+
+def calculate_swing_levels(df: pd.DataFrame, window: int = 5) -> Tuple[pd.Series, pd.Series]:
+    """Return centred rolling swing highs and lows.
+    
+    Equivalent to ``rolling(window, center=True).max()/.min()`` on the
+    ``high``/``low`` columns, computed for both sides from one strided view
+    per column rather than two pandas rolling objects.
+    
+    Args:
+        df: DataFrame with 'high' and 'low' columns.
+        window: Number of bars in each centred window.
+        
+    Returns:
+        Tuple of (swing_high, swing_low) Series, NaN where the window is incomplete.
+    """
+    high = df["high"].to_numpy(dtype=np.float64)
+    low = df["low"].to_numpy(dtype=np.float64)
+    swing_high = np.full(high.shape[0], np.nan, dtype=np.float64)
+    swing_low = np.full(low.shape[0], np.nan, dtype=np.float64)
+    if 0 < window <= high.shape[0]:
+        # Window k covers bars [k, k + window) and is labelled at its centre.
+        offset = window // 2
+        stop = offset + high.shape[0] - window + 1
+        with np.errstate(invalid="ignore"):
+            swing_high[offset:stop] = np.lib.stride_tricks.sliding_window_view(high, window).max(axis=1)
+            swing_low[offset:stop] = np.lib.stride_tricks.sliding_window_view(low, window).min(axis=1)
+    return pd.Series(swing_high, index=df.index), pd.Series(swing_low, index=df.index)
 
 
 def calculate_indicators(
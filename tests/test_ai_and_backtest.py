@@ -92,6 +92,21 @@ class ProcessAiDecisionsTests(unittest.TestCase):
             "ETH", decisions["ETH"], 200.0
         )
 
+    def test_prices_each_decided_coin_and_skips_coins_without_data(self) -> None:
+        decisions = {
+            "ETH": {"signal": "close", "justification": "Exit", "confidence": 0.5},
+            "BTC": {"signal": "close", "justification": "Exit", "confidence": 0.5},
+        }
+        prices = {"ETHUSDT": {"price": 200.0}, "BTCUSDT": None}
+        self.mock_fetch_market_data.side_effect = lambda symbol: prices.get(symbol)
+
+        bot.process_ai_decisions(decisions)
+
+        fetched = sorted(call.args[0] for call in self.mock_fetch_market_data.call_args_list)
+        self.assertEqual(fetched, ["BTCUSDT", "ETHUSDT"])
+        self.mock_execute_close.assert_called_once_with("ETH", decisions["ETH"], 200.0)
+        self.mock_log_ai_decision.assert_any_call("BTC", "close", "Exit", 0.5)
+
     def test_hold_updates_last_justification_when_provided(self) -> None:
         bot.positions = {
             "ETH": {
@@ -72,6 +72,44 @@ class TestCalculateSortinoRatio:
             # If calculation returns None due to no downside, that's acceptable
             assert result_no_rf is None or result_with_rf is None
 
+    def test_accepts_float64_ndarray(self):
+        """Should give the same result for an ndarray as for the equivalent list."""
+        equity = [1000, 1010, 1005, 1020, 1015, 1030, 1025, 1040, np.nan]
+        from_list = calculate_sortino_ratio(equity, period_seconds=3600)
+        from_array = calculate_sortino_ratio(np.array(equity, dtype=np.float64), period_seconds=3600)
+        assert from_list is not None
+        assert from_array == pytest.approx(from_list)
+
+    def test_growing_list_matches_full_recompute(self):
+        """Should match a from-scratch result as the same list grows by appends."""
+        history = [1000.0, 1010.0, 1005.0]
+        calculate_sortino_ratio(history, period_seconds=3600, risk_free_rate=0.05)
+        for value in [1020.0, float("nan"), 1015.0, 1030.0, 990.0]:
+            history.append(value)
+            incremental = calculate_sortino_ratio(history, period_seconds=3600, risk_free_rate=0.05)
+            full = calculate_sortino_ratio(
+                np.array(history, dtype=np.float64), period_seconds=3600, risk_free_rate=0.05
+            )
+            assert incremental == pytest.approx(full)
+
+    def test_rebuilds_after_list_is_reloaded(self):
+        """Should not reuse moments once the list is cleared and refilled."""
+        history = [1000.0, 1010.0, 1005.0, 1020.0]
+        calculate_sortino_ratio(history, period_seconds=3600)
+        history.clear()
+        history.extend([2000.0, 1900.0, 1950.0, 1800.0, 1850.0])
+        expected = calculate_sortino_ratio(np.array(history), period_seconds=3600)
+        assert calculate_sortino_ratio(history, period_seconds=3600) == pytest.approx(expected)
+
+    def test_rebuilds_after_last_value_is_replaced(self):
+        """Should not extend from a last seen value that was since overwritten."""
+        history = [1000.0, 1010.0, 1005.0, 1020.0, 1015.0]
+        calculate_sortino_ratio(history, period_seconds=3600)
+        history[-1] = 950.0
+        history.append(980.0)
+        expected = calculate_sortino_ratio(np.array(history), period_seconds=3600)
+        assert calculate_sortino_ratio(history, period_seconds=3600) == pytest.approx(expected)
+
 
 class TestCalculatePnlForPrice:
     """Tests for calculate_pnl_for_price function."""
@@ -8,6 +8,7 @@ import pandas as pd
 import pytest
 
 from core.persistence import (
+    _read_csv_tail,
     load_equity_history_from_csv,
     init_csv_files_for_paths,
     save_state_to_json,
@@ -69,6 +70,59 @@ class TestLoadEquityHistoryFromCsv:
         
         assert equity_history == [1000.0, 1020.0]
 
+    def test_max_points_keeps_newest_rows(self, tmp_path):
+        """Should read only the newest rows when max_points is set."""
+        csv_path = tmp_path / "state.csv"
+        rows = "".join(f"2024-01-{i:02d},BTC:long,{1000 + i}\n" for i in range(1, 21))
+        csv_path.write_text("timestamp,position_details,total_equity\n" + rows)
+
+        equity_history = [1.0]
+        load_equity_history_from_csv(csv_path, equity_history, max_points=3)
+
+        assert equity_history == [1018.0, 1019.0, 1020.0]
+
+    def test_max_points_handles_missing_column(self, tmp_path):
+        """Should leave history empty when the tail path finds no total_equity column."""
+        csv_path = tmp_path / "state.csv"
+        csv_path.write_text("timestamp,balance\n2024-01-01,1000\n")
+
+        equity_history = [5.0]
+        load_equity_history_from_csv(csv_path, equity_history, max_points=10)
+
+        assert equity_history == []
+
+
+class TestReadCsvTail:
+    """Tests for _read_csv_tail function."""
+
+    def test_drops_partial_first_line_across_blocks(self, tmp_path):
+        """Should return whole rows even when blocks split a line."""
+        csv_path = tmp_path / "state.csv"
+        csv_path.write_text("a,b\n" + "".join(f"{i},{i * 10}\n" for i in range(50)))
+
+        header, lines = _read_csv_tail(csv_path, 4, block_size=7)
+
+        assert header.strip() == "a,b"
+        assert lines == ["46,460", "47,470", "48,480", "49,490"]
+
+    def test_block_boundary_inside_multibyte_character(self, tmp_path):
+        """Should not fail when a block starts in the middle of a UTF-8 character."""
+        csv_path = tmp_path / "state.csv"
+        csv_path.write_text("a,b\nxé,1\n2,3\n", encoding="utf-8")
+
+        # The last 8 bytes start on the second byte of "é".
+        header, lines = _read_csv_tail(csv_path, 1, block_size=8)
+
+        assert header.strip() == "a,b"
+        assert lines == ["2,3"]
+
+    def test_short_file_returns_all_rows(self, tmp_path):
+        """Should return every data row when the file has fewer than requested."""
+        csv_path = tmp_path / "state.csv"
+        csv_path.write_text("a,b\n1,2\n3,4\n")
+
+        assert _read_csv_tail(csv_path, 10)[1] == ["1,2", "3,4"]
+
 
 class TestInitCsvFilesForPaths:
     """Tests for init_csv_files_for_paths function."""
@@ -147,6 +201,33 @@ class TestInitCsvFilesForPaths:
         df = pd.read_csv(trades_csv)
         assert len(df) == 1
 
+    def test_matching_state_header_skips_full_parse(self, tmp_path):
+        """Should leave a state CSV with the expected header untouched without parsing it."""
+        state_csv = tmp_path / "state.csv"
+        state_csv.write_text("timestamp,balance,equity\n2024-01-01,100,110\n")
+        paths = [tmp_path / name for name in ("t.csv", "d.csv", "m.csv", "mr.csv")]
+
+        with pytest.MonkeyPatch.context() as mp:
+            def fail(*args, **kwargs):
+                raise AssertionError("unexpected full parse")
+
+            mp.setattr("core.persistence.pd.read_csv", fail)
+            init_csv_files_for_paths(state_csv, *paths, ["timestamp", "balance", "equity"])
+
+        assert state_csv.read_text() == "timestamp,balance,equity\n2024-01-01,100,110\n"
+
+    def test_migrates_state_csv_with_missing_column(self, tmp_path):
+        """Should add missing columns when the state CSV header differs."""
+        state_csv = tmp_path / "state.csv"
+        state_csv.write_text("timestamp,balance\n2024-01-01,100\n")
+        paths = [tmp_path / name for name in ("t.csv", "d.csv", "m.csv", "mr.csv")]
+
+        init_csv_files_for_paths(state_csv, *paths, ["timestamp", "balance", "equity"])
+
+        df = pd.read_csv(state_csv)
+        assert list(df.columns) == ["timestamp", "balance", "equity"]
+        assert df["balance"].tolist() == [100]
+
 
 class TestSaveStateToJson:
     """Tests for save_state_to_json function."""
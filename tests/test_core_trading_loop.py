@@ -0,0 +1,206 @@
+"""Tests for core/trading_loop.py module."""
+from unittest.mock import MagicMock, patch
+
+from core import state, trading_loop
+
+
+class _FakeClock:
+    """Monotonic clock that advances only when sleep() is called."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestSleepWithCountdown:
+    """Tests for sleep_with_countdown function."""
+
+    def test_sleeps_in_refresh_sized_chunks(self, capsys):
+        """Should wake up once per refresh interval instead of every second."""
+        clock = _FakeClock()
+        with patch.object(trading_loop.time, "monotonic", clock.monotonic), \
+             patch.object(trading_loop.time, "sleep", clock.sleep):
+            trading_loop.sleep_with_countdown(12)
+
+        assert clock.sleeps == [5.0, 5.0, 2.0]
+        assert sum(clock.sleeps) == 12
+        output = capsys.readouterr().out
+        assert "in 12 seconds" in output
+        assert "in 0 seconds" in output
+
+    def test_non_positive_duration_returns_immediately(self, capsys):
+        """Should not sleep or print for zero/negative durations."""
+        clock = _FakeClock()
+        with patch.object(trading_loop.time, "monotonic", clock.monotonic), \
+             patch.object(trading_loop.time, "sleep", clock.sleep):
+            trading_loop.sleep_with_countdown(0)
+            trading_loop.sleep_with_countdown(-5)
+
+        assert clock.sleeps == []
+        assert capsys.readouterr().out == ""
+
+
+class TestSleepUntilNextCheck:
+    """Tests for sleep_until_next_check function."""
+
+    def test_single_sleep_without_terminal(self, capsys):
+        """Should sleep once and print nothing when stdout is not a TTY."""
+        clock = _FakeClock()
+        with patch.object(trading_loop.sys.stdout, "isatty", return_value=False), \
+             patch.object(trading_loop.time, "monotonic", clock.monotonic), \
+             patch.object(trading_loop.time, "sleep", clock.sleep):
+            trading_loop.sleep_until_next_check(12)
+
+        assert clock.sleeps == [12]
+        assert capsys.readouterr().out == ""
+
+    def test_countdown_on_terminal(self):
+        """Should delegate to the countdown when stdout is a TTY."""
+        with patch.object(trading_loop.sys.stdout, "isatty", return_value=True), \
+             patch.object(trading_loop, "sleep_with_countdown") as countdown:
+            trading_loop.sleep_until_next_check(12)
+
+        countdown.assert_called_once_with(12)
+
+
+class TestRecordIterationMessage:
+    """Tests for record_iteration_message function."""
+
+    def test_keeps_only_latest_lines(self):
+        """Should drop the oldest lines once the iteration buffer is full."""
+        state.clear_iteration_messages()
+        try:
+            for i in range(state.ITERATION_MESSAGE_LIMIT + 5):
+                trading_loop.record_iteration_message(f"line {i}")
+
+            messages = state.get_iteration_messages()
+            assert len(messages) == state.ITERATION_MESSAGE_LIMIT
+            assert messages[0] == "line 5"
+            assert messages[-1] == f"line {state.ITERATION_MESSAGE_LIMIT + 4}"
+        finally:
+            state.clear_iteration_messages()
+
+
+class TestProcessHoldSignal:
+    """Tests for _process_hold_signal function."""
+
+    def test_repeated_block_collapses_to_one_line(self, capsys):
+        """Should print the full block once, then one line while figures are unchanged."""
+        positions = {
+            "BTC": {
+                "side": "long",
+                "quantity": 0.1,
+                "entry_price": 50000.0,
+                "profit_target": 55000.0,
+                "stop_loss": 48000.0,
+                "leverage": 5,
+                "margin": 1000.0,
+                "fees_paid": 2.0,
+            }
+        }
+        with patch.object(trading_loop, "get_positions", return_value=positions), \
+             patch.dict(trading_loop._last_hold_figures, clear=True):
+            trading_loop._process_hold_signal("BTC", {"justification": "trend intact"}, 51000.0)
+            first = capsys.readouterr().out
+            trading_loop._process_hold_signal("BTC", {"justification": "still intact"}, 51000.0)
+            second = capsys.readouterr().out
+            trading_loop._process_hold_signal("BTC", {"justification": "still intact"}, 51500.0)
+            third = capsys.readouterr().out
+
+        assert "Size: 0.1000 BTC" in first
+        assert second.strip().endswith("BTC unchanged")
+        assert len(second.strip().splitlines()) == 1
+        assert "PnL @ Target" in third
+
+
+class TestFetchPositionPrices:
+    """Tests for fetch_position_prices function."""
+
+    def test_fetches_every_position_and_keeps_order(self):
+        """Should return prices keyed by coin in the positions' order."""
+        prices = {"BTCUSDT": 50000.0, "ETHUSDT": 3000.0, "SOLUSDT": 150.0}
+        fetched = []
+
+        def fake_fetch(symbol):
+            fetched.append(symbol)
+            return {"price": prices[symbol]}
+
+        result = trading_loop.fetch_position_prices(["SOL", "BTC", "ETH"], fake_fetch)
+
+        assert list(result.items()) == [("SOL", 150.0), ("BTC", 50000.0), ("ETH", 3000.0)]
+        assert sorted(fetched) == ["BTCUSDT", "ETHUSDT", "SOLUSDT"]
+
+    def test_skips_missing_market_data(self):
+        """Should omit coins whose market data fetch returns nothing."""
+        result = trading_loop.fetch_position_prices(
+            ["BTC", "ETH"],
+            lambda symbol: {"price": 1.0} if symbol == "BTCUSDT" else None,
+        )
+
+        assert result == {"BTC": 1.0}
+
+    def test_reuses_one_worker_pool(self):
+        """Should fan out on the same pool across calls instead of a new one each time."""
+        pool = trading_loop._get_price_fetch_pool()
+        trading_loop.fetch_position_prices(["BTC", "ETH"], lambda symbol: {"price": 1.0})
+
+        assert trading_loop._get_price_fetch_pool() is pool
+
+    def test_no_positions_makes_no_requests(self):
+        """Should not call the fetcher when there are no positions."""
+        def fail(symbol):
+            raise AssertionError("unexpected fetch")
+
+        assert trading_loop.fetch_position_prices([], fail) == {}
+
+
+class TestExecuteCloseSignals:
+    """Tests for the Telegram CLOSE signal in execute_close."""
+
+    def _close_btc(self, telegram_signals_enabled):
+        positions = {
+            "BTC": {
+                "side": "long",
+                "quantity": 1.0,
+                "entry_price": 100.0,
+                "margin": 50.0,
+                "fees_paid": 1.0,
+                "fee_rate": 0.001,
+                "leverage": 2.0,
+            }
+        }
+        send = MagicMock()
+        with patch.object(trading_loop, "TRADING_BACKEND", "paper"), \
+             patch.object(trading_loop, "get_positions", return_value=positions), \
+             patch.object(trading_loop, "update_balance"), \
+             patch.object(trading_loop, "get_balance", return_value=1000.0), \
+             patch.object(trading_loop, "log_trade"), \
+             patch.object(trading_loop, "remove_position"), \
+             patch.object(trading_loop, "save_state"), \
+             patch.object(trading_loop, "record_iteration_message"):
+            trading_loop.execute_close(
+                "BTC", {"justification": "AI close"}, 105.0,
+                MagicMock(is_live=False), MagicMock(), send,
+                telegram_signals_enabled,
+            )
+        return send
+
+    def test_sends_signal_when_enabled(self, capsys):
+        """Should hand the CLOSE signal to the injected sender."""
+        send = self._close_btc(True)
+
+        send.assert_called_once()
+        assert "CLOSE" in send.call_args.args[0]
+
+    def test_skips_sender_when_disabled(self, capsys):
+        """Should not call the injected sender at all."""
+        send = self._close_btc(False)
+
+        send.assert_not_called()
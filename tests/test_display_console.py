@@ -0,0 +1,45 @@
+"""Tests for display/console.py module."""
+import importlib
+import sys
+from unittest.mock import patch
+
+from colorama import Fore, Style
+
+from display import console
+
+
+class TestColorCodes:
+    """Tests for the terminal-dependent colour constants."""
+
+    def teardown_method(self):
+        importlib.reload(console)
+
+    def test_colors_on_terminal(self, monkeypatch):
+        """Should keep the ANSI codes when stdout is a TTY."""
+        monkeypatch.delenv("NO_COLOR", raising=False)
+        with patch.object(sys.stdout, "isatty", return_value=True):
+            importlib.reload(console)
+
+        assert console.COLOR_ENABLED is True
+        assert console.GAIN == Fore.GREEN
+        assert console.RESET == Style.RESET_ALL
+        assert console.HOLD_PREFIX == f"{Fore.BLUE}[HOLD]"
+
+    def test_plain_text_without_terminal(self):
+        """Should render without escape codes when stdout is redirected."""
+        with patch.object(sys.stdout, "isatty", return_value=False):
+            importlib.reload(console)
+
+        assert console.COLOR_ENABLED is False
+        assert console.GAIN == console.LOSS == console.RESET == ""
+        assert console.HOLD_PREFIX == "[HOLD]"
+        assert "\x1b" not in console.HOLD_PNL_FMT
+
+    def test_no_color_env_disables_colors(self, monkeypatch):
+        """Should honour NO_COLOR even on a terminal."""
+        monkeypatch.setenv("NO_COLOR", "1")
+        with patch.object(sys.stdout, "isatty", return_value=True):
+            importlib.reload(console)
+
+        assert console.COLOR_ENABLED is False
+        assert console.SUMMARY_TITLE == "PORTFOLIO SUMMARY"
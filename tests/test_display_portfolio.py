@@ -3,6 +3,7 @@ from unittest.mock import MagicMock, patch
 from datetime import datetime
 import pytest
 
+from display import portfolio as portfolio_module
 from display.portfolio import log_portfolio_state, display_portfolio_summary
 
 
@@ -103,6 +104,9 @@ class TestLogPortfolioState:
 class TestDisplayPortfolioSummary:
     """Tests for display_portfolio_summary function."""
 
+    def setup_method(self):
+        portfolio_module._last_idle_balance = None
+
     @patch("display.portfolio.calculate_sortino_ratio")
     @patch("builtins.print")
     def test_displays_summary(self, mock_print, mock_sortino):
@@ -224,3 +228,49 @@ class TestDisplayPortfolioSummary:
         
         position_found = any("Open Positions" in msg and "2" in msg for msg in messages)
         assert position_found
+
+    @patch("display.portfolio.calculate_sortino_ratio")
+    @patch("builtins.print")
+    def test_prints_summary_in_one_write(self, mock_print, mock_sortino):
+        """Should emit the whole summary with a single print of the recorded lines."""
+        mock_sortino.return_value = None
+        messages = []
+
+        display_portfolio_summary(
+            positions={},
+            balance=10000.0,
+            equity_history=[],
+            calculate_total_equity=lambda: 10000.0,
+            calculate_total_margin=lambda: 0.0,
+            register_equity_snapshot=lambda x: None,
+            record_iteration_message=lambda x: messages.append(x),
+        )
+
+        mock_print.assert_called_once_with("\n".join(messages))
+        assert any("PORTFOLIO SUMMARY" in msg for msg in messages)
+
+    @patch("display.portfolio.calculate_sortino_ratio")
+    @patch("builtins.print")
+    def test_repeated_idle_summary_collapses_to_one_line(self, mock_print, mock_sortino):
+        """Should print one line while flat with an unchanged balance."""
+        mock_sortino.return_value = None
+        registered = []
+        kwargs = dict(
+            positions={},
+            balance=10000.0,
+            equity_history=[],
+            calculate_total_equity=lambda: 10000.0,
+            calculate_total_margin=lambda: 0.0,
+            register_equity_snapshot=lambda x: registered.append(x),
+        )
+
+        first, second, third = [], [], []
+        display_portfolio_summary(record_iteration_message=first.append, **kwargs)
+        display_portfolio_summary(record_iteration_message=second.append, **kwargs)
+        kwargs["balance"] = 9990.0
+        display_portfolio_summary(record_iteration_message=third.append, **kwargs)
+
+        assert any("PORTFOLIO SUMMARY" in msg for msg in first)
+        assert second == ["Idle | Equity $10000.00"]
+        assert any("PORTFOLIO SUMMARY" in msg for msg in third)
+        assert registered == [10000.0, 10000.0, 10000.0]
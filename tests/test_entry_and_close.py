@@ -3,6 +3,7 @@ import unittest
 from unittest import mock
 
 import bot
+import core.state as core_state
 
 
 class EntryAndCloseTests(unittest.TestCase):
@@ -169,6 +170,54 @@ class EntryAndCloseTests(unittest.TestCase):
 
         self.assertAlmostEqual(bot.balance, expected_balance, places=6)
 
+    def test_execute_close_forgets_last_hold_block(self) -> None:
+        bot.balance = 1000.0
+        bot.positions = {
+            "BTC": {
+                "side": "long",
+                "quantity": 1.0,
+                "entry_price": 100.0,
+                "margin": 50.0,
+                "fees_paid": 1.0,
+                "fee_rate": 0.001,
+                "leverage": 2.0,
+            }
+        }
+
+        with mock.patch.dict(core_state.last_hold_figures, {"BTC": ("figures",)}, clear=True):
+            bot.execute_close("BTC", {"justification": "AI close"}, current_price=120.0)
+
+            self.assertNotIn("BTC", core_state.last_hold_figures)
+
+    def _open_and_close_btc(self) -> None:
+        bot.balance = 1000.0
+        bot.positions = {}
+        decision = {
+            "side": "long",
+            "stop_loss": 90.0,
+            "profit_target": 110.0,
+            "risk_usd": 20.0,
+        }
+        bot.execute_entry("BTC", decision, current_price=100.0)
+        bot.execute_close("BTC", {"justification": "AI close"}, current_price=105.0)
+
+    def test_entry_and_close_signals_sent_when_signals_enabled(self) -> None:
+        with mock.patch.object(bot, "TELEGRAM_SIGNALS_ENABLED", True), \
+             mock.patch.object(bot, "send_telegram_message") as send:
+            self._open_and_close_btc()
+
+        self.assertEqual(send.call_count, 2)
+        self.assertIn("ENTRY", send.call_args_list[0].args[0])
+        self.assertIn("CLOSE", send.call_args_list[1].args[0])
+
+    def test_entry_and_close_signals_skipped_when_signals_disabled(self) -> None:
+        with mock.patch.object(bot, "TELEGRAM_SIGNALS_ENABLED", False), \
+             mock.patch.object(bot, "send_telegram_message") as send:
+            self._open_and_close_btc()
+
+        self.assertNotIn("BTC", bot.positions)
+        send.assert_not_called()
+
 
 if __name__ == "__main__":  # pragma: no cover
     unittest.main()
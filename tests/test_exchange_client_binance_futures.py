@@ -26,6 +26,20 @@ class _StubBinanceExchange:
         return self._order_response
 
 
+class _StubBatchBinanceExchange(_StubBinanceExchange):
+    def __init__(self, *, order_response, batch_response):
+        super().__init__(order_response=order_response)
+        self._batch_response = batch_response
+        self.create_orders_calls = []
+
+    def fetch_open_orders(self, symbol):  # noqa: D401
+        return []
+
+    def create_orders(self, orders):  # noqa: D401
+        self.create_orders_calls.append(orders)
+        return self._batch_response
+
+
 class BinanceFuturesExchangeClientTests(unittest.TestCase):
     def test_place_entry_success_maps_oid_and_has_no_errors(self) -> None:
         raw_order = {
@@ -132,6 +146,53 @@ class BinanceFuturesExchangeClientTests(unittest.TestCase):
         joined = " ".join(result.errors).lower()
         self.assertIn("timestamp for this request is outside of the recvwindow", joined)
 
+    def test_update_tpsl_places_both_legs_in_one_batch(self) -> None:
+        stub = _StubBatchBinanceExchange(
+            order_response={"id": "single"},
+            batch_response=[{"id": "sl-1"}, {"id": "tp-1"}],
+        )
+        client = BinanceFuturesExchangeClient(exchange=stub)
+
+        result = client.update_tpsl(coin="BTC", side="long", quantity=0.5, new_sl=90.0, new_tp=120.0)
+
+        self.assertTrue(result.success)
+        self.assertEqual(result.sl_order_id, "sl-1")
+        self.assertEqual(result.tp_order_id, "tp-1")
+        self.assertEqual(stub.create_order_calls, [])
+        self.assertEqual(len(stub.create_orders_calls), 1)
+        orders = stub.create_orders_calls[0]
+        self.assertEqual([o["type"] for o in orders], ["STOP_MARKET", "TAKE_PROFIT_MARKET"])
+        self.assertEqual([o["params"]["stopPrice"] for o in orders], [90.0, 120.0])
+        self.assertTrue(all(o["side"] == "sell" and o["amount"] == 0.5 for o in orders))
+
+    def test_update_tpsl_reports_rejected_batch_leg(self) -> None:
+        stub = _StubBatchBinanceExchange(
+            order_response={"id": "single"},
+            batch_response=[
+                {"id": "sl-1"},
+                {"id": None, "info": {"code": -2021, "msg": "Order would immediately trigger."}},
+            ],
+        )
+        client = BinanceFuturesExchangeClient(exchange=stub)
+
+        result = client.update_tpsl(coin="BTC", side="short", quantity=1.0, new_sl=110.0, new_tp=80.0)
+
+        self.assertFalse(result.success)
+        self.assertEqual(result.sl_order_id, "sl-1")
+        self.assertIsNone(result.tp_order_id)
+        self.assertIn("TP order failed: -2021 Order would immediately trigger.", result.errors)
+
+    def test_update_tpsl_single_leg_uses_create_order(self) -> None:
+        stub = _StubBatchBinanceExchange(order_response={"id": "sl-2"}, batch_response=[])
+        client = BinanceFuturesExchangeClient(exchange=stub)
+
+        result = client.update_tpsl(coin="ETH", side="long", quantity=2.0, new_sl=90.0)
+
+        self.assertTrue(result.success)
+        self.assertEqual(result.sl_order_id, "sl-2")
+        self.assertEqual(stub.create_orders_calls, [])
+        self.assertEqual(stub.create_order_calls[0]["type"], "STOP_MARKET")
+
 
 if __name__ == "__main__":  # pragma: no cover
     unittest.main()
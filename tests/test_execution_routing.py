@@ -6,6 +6,7 @@ from execution.routing import (
     ClosePlan,
     compute_entry_plan,
     compute_close_plan,
+    check_stop_loss_take_profit_for_positions,
 )
 
 
@@ -258,3 +259,66 @@ class TestComputeClosePlan:
         result = compute_close_plan(**base_params)
         assert "  " not in result.reason_text
         assert "\n" not in result.reason_text
+
+
+class TestCheckStopLossTakeProfitForPositions:
+    """Tests for check_stop_loss_take_profit_for_positions function."""
+
+    @staticmethod
+    def _position(side, stop_loss, profit_target):
+        return {
+            "side": side,
+            "entry_price": 100.0,
+            "stop_loss": stop_loss,
+            "profit_target": profit_target,
+        }
+
+    def test_fetches_all_candles_before_closing(self):
+        """Should fetch every position's candle and close only the ones that hit."""
+        positions = {
+            "BTC": self._position("long", 90.0, 120.0),
+            "ETH": self._position("short", 110.0, 80.0),
+            "SOL": self._position("long", 90.0, 120.0),
+        }
+        candles = {
+            "BTCUSDT": {"price": 95.0, "high": 100.0, "low": 89.0},
+            "ETHUSDT": {"price": 85.0, "high": 90.0, "low": 79.0},
+            "SOLUSDT": {"price": 100.0, "high": 105.0, "low": 95.0},
+        }
+        fetched = []
+        closes = []
+
+        def fetch(symbol):
+            fetched.append(symbol)
+            return candles[symbol]
+
+        def close(coin, decision, price):
+            # Every candle is in hand before the first close runs.
+            assert len(fetched) == 3
+            closes.append((coin, decision["justification"], price))
+
+        check_stop_loss_take_profit_for_positions(
+            positions,
+            {"BTCUSDT": "BTC", "ETHUSDT": "ETH", "SOLUSDT": "SOL"},
+            fetch,
+            close,
+            False,
+        )
+
+        assert closes == [
+            ("BTC", "Stop loss hit", 90.0),
+            ("ETH", "Take profit hit", 80.0),
+        ]
+
+    def test_skips_when_hyperliquid_is_live(self):
+        """Should not fetch anything when Hyperliquid manages exits."""
+        def fail(symbol):
+            raise AssertionError("unexpected fetch")
+
+        check_stop_loss_take_profit_for_positions(
+            {"BTC": self._position("long", 90.0, 120.0)},
+            {"BTCUSDT": "BTC"},
+            fail,
+            fail,
+            True,
+        )
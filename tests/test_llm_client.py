@@ -1,11 +1,15 @@
 """Tests for llm/client.py module."""
+import json
 from unittest.mock import MagicMock, patch
 import pytest
 
 from llm.client import (
     _recover_partial_decisions,
     _log_llm_decisions,
+    _build_request_headers,
+    _build_system_message,
     call_deepseek_api,
+    get_llm_session,
 )
 
 
@@ -105,6 +109,83 @@ class TestLogLlmDecisions:
         # Should not raise
         _log_llm_decisions(decisions)
 
+    @patch("llm.client.logging")
+    def test_skips_summary_when_info_disabled(self, mock_logging):
+        """Should not build or log the summary when INFO is filtered out."""
+        mock_logging.getLogger.return_value.isEnabledFor.return_value = False
+
+        _log_llm_decisions({"BTC": {"signal": "hold", "justification": "wait"}})
+
+        mock_logging.info.assert_not_called()
+
+
+class TestBuildSystemMessage:
+    """Tests for _build_system_message function."""
+
+    def test_plain_content_for_auto_caching_models(self):
+        """Should send the rules as a plain string for DeepSeek-style models."""
+        message = _build_system_message("rules", "deepseek/deepseek-chat-v3.1", "openrouter")
+
+        assert message == {"role": "system", "content": "rules"}
+
+    def test_marks_cache_breakpoint_for_anthropic_models(self):
+        """Should tag the rules with an ephemeral cache_control block."""
+        message = _build_system_message("rules", "anthropic/claude-sonnet-4", "openrouter")
+
+        assert message["role"] == "system"
+        assert message["content"] == [
+            {"type": "text", "text": "rules", "cache_control": {"type": "ephemeral"}}
+        ]
+
+    def test_plain_content_for_custom_endpoints(self):
+        """Should not emit provider-specific fields for custom API types."""
+        message = _build_system_message("rules", "anthropic/claude-sonnet-4", "custom")
+
+        assert message == {"role": "system", "content": "rules"}
+
+    def test_reuses_message_for_same_inputs(self):
+        """Should hand back the same message object instead of rebuilding it per call."""
+        first = _build_system_message("rules", "deepseek/deepseek-chat-v3.1", "openrouter")
+
+        assert _build_system_message("rules", "deepseek/deepseek-chat-v3.1", "openrouter") is first
+        assert _build_system_message("other", "deepseek/deepseek-chat-v3.1", "openrouter") is not first
+
+
+class TestBuildRequestHeaders:
+    """Tests for _build_request_headers function."""
+
+    def test_openrouter_headers_are_built_once(self):
+        """Should add attribution headers for OpenRouter and reuse the result."""
+        headers = _build_request_headers("key-1", "OpenRouter")
+
+        assert headers["Authorization"] == "Bearer key-1"
+        assert headers["X-Title"] == "DeepSeek Trading Bot"
+        assert _build_request_headers("key-1", "OpenRouter") is headers
+
+    def test_custom_endpoint_headers(self):
+        """Should only send auth and content type to custom endpoints."""
+        assert _build_request_headers("key-2", "custom") == {
+            "Authorization": "Bearer key-2",
+            "Content-Type": "application/json",
+        }
+
+
+class TestGetLlmSession:
+    """Tests for get_llm_session function."""
+
+    @patch("llm.client._llm_session", None)
+    def test_reuses_one_pooled_session(self):
+        """Should build the session once with a sized connection pool."""
+        session = get_llm_session()
+
+        assert get_llm_session() is session
+        adapter = session.get_adapter("https://openrouter.ai/api/v1/chat/completions")
+        assert adapter._pool_maxsize == 4
+        assert adapter.max_retries.total == 2
+        assert adapter.max_retries.read == 0
+        assert adapter.max_retries.is_retry("POST", 503)
+        assert not adapter.max_retries.is_retry("POST", 500)
+
 
 class TestCallDeepseekApi:
     """Tests for call_deepseek_api function."""
@@ -120,16 +201,17 @@ class TestCallDeepseekApi:
         
         assert result is None
 
-    @patch("llm.client.requests.post")
+    @patch("llm.client.get_llm_session")
     @patch("llm.client.LLM_API_KEY", "test_key")
     @patch("llm.client.LLM_API_BASE_URL", "https://api.test.com")
     @patch("llm.client.LLM_MODEL_NAME", "test-model")
     @patch("llm.client.TRADING_RULES_PROMPT", "You are a trading bot.")
-    def test_calls_api(self, mock_post):
+    def test_calls_api(self, mock_get_session):
         """Should call the LLM API."""
+        mock_post = mock_get_session.return_value.post
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "id": "test-123",
             "choices": [
                 {
@@ -138,7 +220,7 @@ class TestCallDeepseekApi:
                 }
             ],
             "usage": {"total_tokens": 100},
-        }
+        }).encode()
         mock_post.return_value = mock_response
         
         log_fn = MagicMock()
@@ -154,13 +236,14 @@ class TestCallDeepseekApi:
         assert result is not None
         assert "BTC" in result
 
-    @patch("llm.client.requests.post")
+    @patch("llm.client.get_llm_session")
     @patch("llm.client.LLM_API_KEY", "test_key")
     @patch("llm.client.LLM_API_BASE_URL", "https://api.test.com")
     @patch("llm.client.LLM_MODEL_NAME", "test-model")
     @patch("llm.client.TRADING_RULES_PROMPT", "You are a trading bot.")
-    def test_handles_api_error(self, mock_post):
+    def test_handles_api_error(self, mock_get_session):
         """Should handle API error response."""
+        mock_post = mock_get_session.return_value.post
         mock_response = MagicMock()
         mock_response.status_code = 500
         mock_response.text = "Internal Server Error"
@@ -177,16 +260,17 @@ class TestCallDeepseekApi:
         assert result is None
         notify_fn.assert_called()
 
-    @patch("llm.client.requests.post")
+    @patch("llm.client.get_llm_session")
     @patch("llm.client.LLM_API_KEY", "test_key")
     @patch("llm.client.LLM_API_BASE_URL", "https://api.test.com")
     @patch("llm.client.LLM_MODEL_NAME", "test-model")
     @patch("llm.client.TRADING_RULES_PROMPT", "You are a trading bot.")
-    def test_handles_no_choices(self, mock_post):
+    def test_handles_no_choices(self, mock_get_session):
         """Should handle response with no choices."""
+        mock_post = mock_get_session.return_value.post
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"id": "test", "choices": []}
+        mock_response.content = json.dumps({"id": "test", "choices": []}).encode()
         mock_response.text = "{}"
         mock_post.return_value = mock_response
         
@@ -201,16 +285,17 @@ class TestCallDeepseekApi:
         assert result is None
         notify_fn.assert_called()
 
-    @patch("llm.client.requests.post")
+    @patch("llm.client.get_llm_session")
     @patch("llm.client.LLM_API_KEY", "test_key")
     @patch("llm.client.LLM_API_BASE_URL", "https://api.test.com")
     @patch("llm.client.LLM_MODEL_NAME", "test-model")
     @patch("llm.client.TRADING_RULES_PROMPT", "You are a trading bot.")
-    def test_logs_messages(self, mock_post):
+    def test_logs_messages(self, mock_get_session):
         """Should log sent and received messages."""
+        mock_post = mock_get_session.return_value.post
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "id": "test-123",
             "choices": [
                 {
@@ -218,7 +303,7 @@ class TestCallDeepseekApi:
                     "finish_reason": "stop",
                 }
             ],
-        }
+        }).encode()
         mock_post.return_value = mock_response
         
         log_fn = MagicMock()
@@ -232,13 +317,14 @@ class TestCallDeepseekApi:
         # Should log system message, user message, and assistant response
         assert log_fn.call_count >= 3
 
-    @patch("llm.client.requests.post")
+    @patch("llm.client.get_llm_session")
     @patch("llm.client.LLM_API_KEY", "test_key")
     @patch("llm.client.LLM_API_BASE_URL", "https://api.test.com")
     @patch("llm.client.LLM_MODEL_NAME", "test-model")
     @patch("llm.client.TRADING_RULES_PROMPT", "You are a trading bot.")
-    def test_handles_exception(self, mock_post):
+    def test_handles_exception(self, mock_get_session):
         """Should handle exceptions during API call."""
+        mock_post = mock_get_session.return_value.post
         mock_post.side_effect = Exception("Network error")
         
         notify_fn = MagicMock()
@@ -74,6 +74,27 @@ class TestRecoverPartialDecisions:
         decisions, _ = result
         assert "broke out" in decisions["BTC"]["justification"]
 
+    def test_ignores_braces_inside_strings(self):
+        """Should not let braces inside justification text end the object early."""
+        json_str = '{"BTC": {"signal": "hold", "justification": "range {low} to }high"}, "ETH": {"signal": "entry"}'
+        result = recover_partial_decisions(json_str, ["BTC", "ETH"])
+
+        assert result is not None
+        decisions, missing = result
+        assert decisions["BTC"]["justification"] == "range {low} to }high"
+        assert decisions["ETH"]["signal"] == "entry"
+        assert missing == []
+
+    def test_truncated_inside_string_is_missing(self):
+        """Should treat an object cut off mid-string as missing even if the tail has braces."""
+        json_str = '{"BTC": {"signal": "entry"}, "ETH": {"signal": "hold", "justification": "wait }'
+        result = recover_partial_decisions(json_str, ["BTC", "ETH"])
+
+        assert result is not None
+        decisions, missing = result
+        assert decisions["BTC"]["signal"] == "entry"
+        assert missing == ["ETH"]
+
     def test_default_hold_has_zero_confidence(self):
         """Default hold decisions should have zero confidence."""
         json_str = '{"BTC": {"signal": "entry"}}'
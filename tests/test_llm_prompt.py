@@ -1,7 +1,14 @@
 """Tests for llm/prompt.py module."""
+import numpy as np
 import pytest
 
-from llm.prompt import build_trading_prompt
+from llm import prompt as prompt_module
+from llm.prompt import (
+    build_trading_prompt,
+    collect_prompt_market_data,
+    prompt_fingerprint,
+    _klines_to_ohlcv_frame,
+)
 
 
 class TestBuildTradingPrompt:
@@ -209,3 +216,245 @@ class TestBuildTradingPrompt:
         assert isinstance(result, str)
         # Should show N/A or similar for None values
         assert "N/A" in result or result  # At least should not crash
+
+
+class TestKlinesToOhlcvFrame:
+    """Tests for _klines_to_ohlcv_frame helper."""
+
+    def test_parses_string_ohlcv_into_float64_columns(self):
+        """Should keep only OHLCV columns and parse them as float64."""
+        klines = [
+            [1000, "1.0", "2.0", "0.5", "1.5", "10.0", 2000, "20.0", 5, None, None, None],
+            [1001, "1.5", "2.5", "1.0", "2.0", "12.0", 2001, "24.0", 6, None, None, None],
+        ]
+        df = _klines_to_ohlcv_frame(klines)
+
+        assert list(df.columns) == ["open", "high", "low", "close", "volume"]
+        assert all(dtype == np.float64 for dtype in df.dtypes)
+        assert df["close"].tolist() == [1.5, 2.0]
+        assert df["volume"].tolist() == [10.0, 12.0]
+
+    def test_missing_values_become_nan(self):
+        """Should map None fields (e.g. Backpack volume gaps) to NaN."""
+        df = _klines_to_ohlcv_frame([["2024-01-01", "1", "2", "0.5", "1.5", None]])
+        assert np.isnan(df["volume"].iloc[0])
+
+    def test_empty_klines_produce_empty_frame(self):
+        """Should return an empty frame with OHLCV columns."""
+        df = _klines_to_ohlcv_frame([])
+        assert df.empty
+        assert list(df.columns) == ["open", "high", "low", "close", "volume"]
+
+
+class TestCollectPromptMarketData:
+    """Tests for collect_prompt_market_data function."""
+
+    class _StubClient:
+        """Market data client returning Binance-style string klines."""
+
+        def __init__(self):
+            self.calls = []
+            self.live_close = 159.0
+
+        def get_klines(self, symbol, interval, limit):
+            self.calls.append((interval, limit))
+            rows = []
+            for i in range(60):
+                close = self.live_close if i == 59 else 100.0 + i
+                rows.append([
+                    i, str(close - 0.5), str(close + 1.0), str(close - 1.0), str(close),
+                    str(10.0 + i), i + 1, "0", 0, "0", "0", "0",
+                ])
+            return rows[-limit:]
+
+        def full_fetches(self, interval):
+            return sum(1 for called, limit in self.calls if called == interval and limit > 2)
+
+        def get_open_interest_history(self, symbol, limit):
+            return [1.0, 2.0]
+
+        def get_funding_rate_history(self, symbol, limit):
+            return [0.0001]
+
+    @pytest.fixture(autouse=True)
+    def _clear_kline_cache(self):
+        prompt_module._KLINE_CACHE.clear()
+        yield
+        prompt_module._KLINE_CACHE.clear()
+
+    def test_builds_snapshot_from_string_klines(self):
+        """Should parse string klines and expose the latest close as price."""
+        snapshot = collect_prompt_market_data(
+            "BTCUSDT",
+            get_market_data_client=lambda: self._StubClient(),
+            interval="15m",
+        )
+
+        assert snapshot is not None
+        assert snapshot["price"] == 159.0
+        assert snapshot["trend"]["current_volume"] == 69.0
+
+    def test_reuses_higher_timeframe_klines_within_bar(self):
+        """Should refetch only the live 1h/4h klines while their bars are still open."""
+        client = self._StubClient()
+        for _ in range(3):
+            assert collect_prompt_market_data("BTCUSDT", lambda: client, interval="15m")
+
+        assert client.full_fetches("15m") == 3
+        assert client.full_fetches("1h") == 1
+        assert client.full_fetches("4h") == 1
+        assert client.calls.count(("1h", 2)) == 2
+        assert client.calls.count(("4h", 2)) == 2
+
+    def test_cached_frames_track_the_forming_bar(self):
+        """Should recompute the last-row indicators from the live bar on a cache hit."""
+        client = self._StubClient()
+        first = collect_prompt_market_data("BTCUSDT", lambda: client, interval="15m")
+        client.live_close = 250.0
+        second = collect_prompt_market_data("BTCUSDT", lambda: client, interval="15m")
+
+        assert client.full_fetches("4h") == 1
+        assert second["trend"]["ema20"] > first["trend"]["ema20"]
+
+    def test_refetches_when_live_klines_skip_cached_bars(self):
+        """Should fetch the full history again when live klines no longer overlap the cache."""
+        client = self._StubClient()
+        collect_prompt_market_data("BTCUSDT", lambda: client, interval="15m")
+        for key, (expiry, cached_client, closed) in list(prompt_module._KLINE_CACHE.items()):
+            prompt_module._KLINE_CACHE[key] = (expiry, cached_client, closed[:-5])
+
+        collect_prompt_market_data("BTCUSDT", lambda: client, interval="15m")
+
+        assert client.full_fetches("1h") == 2
+        assert client.full_fetches("4h") == 2
+
+    def test_refetches_after_bar_closes(self):
+        """Should refetch higher timeframe klines once the cached bar has expired."""
+        client = self._StubClient()
+        collect_prompt_market_data("BTCUSDT", lambda: client, interval="15m")
+        for key, (_, cached_client, closed) in list(prompt_module._KLINE_CACHE.items()):
+            prompt_module._KLINE_CACHE[key] = (0.0, cached_client, closed)
+
+        collect_prompt_market_data("BTCUSDT", lambda: client, interval="15m")
+
+        assert client.full_fetches("1h") == 2
+        assert client.full_fetches("4h") == 2
+
+    def test_does_not_share_cache_across_clients(self):
+        """Should not serve klines cached from a different market data client."""
+        first, second = self._StubClient(), self._StubClient()
+        collect_prompt_market_data("BTCUSDT", lambda: first, interval="15m")
+        collect_prompt_market_data("BTCUSDT", lambda: second, interval="15m")
+
+        assert second.full_fetches("1h") == 1
+        assert second.full_fetches("4h") == 1
+
+
+class TestBuildPositionPayloads:
+    """Tests for build_position_payloads function."""
+
+    def test_derives_liquidation_and_notional(self):
+        """Should price positions from snapshots and fall back to entry price."""
+        positions = {
+            "BTC": {"side": "long", "quantity": 2.0, "entry_price": 100.0, "leverage": 4},
+            "ETH": {"side": "short", "quantity": 3.0, "entry_price": 50.0, "leverage": None},
+        }
+        payloads = prompt_module.build_position_payloads(
+            positions,
+            {"BTC": {"price": 110.0}},
+            lambda coin, price: price - positions[coin]["entry_price"],
+        )
+
+        btc, eth = payloads
+        assert (btc["current_price"], btc["unrealized_pnl"]) == (110.0, 10.0)
+        assert btc["liquidation_price"] == 75.0
+        assert btc["notional_usd"] == 220.0
+        assert (eth["current_price"], eth["unrealized_pnl"]) == (50.0, 0.0)
+        assert eth["liquidation_price"] == 100.0
+        assert eth["leverage"] is None
+
+
+class TestFormatPromptForDeepseek:
+    """Tests for format_prompt_for_deepseek function."""
+
+    def test_collects_snapshots_concurrently_in_universe_order(self):
+        """Should gather every symbol's snapshot and keep the universe order."""
+        from datetime import datetime
+        from unittest.mock import patch
+
+        universe = ["BTCUSDT", "ETHUSDT", "SOLUSDT", "XRPUSDT"]
+        client = object()
+        seen_clients = []
+
+        def fake_collect(symbol, get_client, interval):
+            seen_clients.append(get_client())
+            return {"coin": symbol[:-4], "price": 1.0}
+
+        with patch.object(prompt_module, "get_effective_symbol_universe", return_value=universe), \
+             patch.object(prompt_module, "collect_prompt_market_data", side_effect=fake_collect), \
+             patch.object(prompt_module, "build_trading_prompt", side_effect=lambda ctx: ctx):
+            context = prompt_module.format_prompt_for_deepseek(
+                get_market_data_client=lambda: client,
+                get_positions=lambda: {},
+                get_balance=lambda: 1000.0,
+                get_current_time=lambda: datetime(2024, 1, 1, 1, 0),
+                get_bot_start_time=lambda: datetime(2024, 1, 1, 0, 0),
+                increment_invocation_count=lambda: 1,
+                calculate_total_margin=lambda: 0.0,
+                calculate_unrealized_pnl=lambda coin, price: 0.0,
+            )
+
+        assert list(context["market_snapshots"]) == ["BTC", "ETH", "SOL", "XRP"]
+        assert all(c is client for c in seen_clients)
+        assert len(seen_clients) == len(universe)
+
+    def test_prices_each_position_once(self):
+        """Should derive equity from the position payloads' unrealized PnL."""
+        from datetime import datetime
+        from unittest.mock import patch
+
+        positions = {
+            "BTC": {"side": "long", "quantity": 1.0, "entry_price": 100.0},
+            "ETH": {"side": "short", "quantity": 2.0, "entry_price": 50.0},
+        }
+        priced = []
+
+        def fake_pnl(coin, price):
+            priced.append((coin, price))
+            return 10.0 if coin == "BTC" else -4.0
+
+        with patch.object(prompt_module, "get_effective_symbol_universe", return_value=["BTCUSDT"]), \
+             patch.object(prompt_module, "collect_prompt_market_data",
+                          return_value={"coin": "BTC", "price": 110.0}), \
+             patch.object(prompt_module, "build_trading_prompt", side_effect=lambda ctx: ctx):
+            context = prompt_module.format_prompt_for_deepseek(
+                get_market_data_client=lambda: object(),
+                get_positions=lambda: positions,
+                get_balance=lambda: 1000.0,
+                get_current_time=lambda: datetime(2024, 1, 1, 1, 0),
+                get_bot_start_time=lambda: datetime(2024, 1, 1, 0, 0),
+                increment_invocation_count=lambda: 1,
+                calculate_total_margin=lambda: 200.0,
+                calculate_unrealized_pnl=fake_pnl,
+            )
+
+        assert priced == [("BTC", 110.0), ("ETH", 50.0)]
+        assert context["account"]["total_equity"] == 1206.0
+        assert context["account"]["net_unrealized_total"] == 6.0
+
+
+class TestPromptFingerprint:
+    """Tests for prompt_fingerprint function."""
+
+    def test_ignores_clock_line(self):
+        """Should match prompts that differ only in their first line."""
+        body = "CURRENT MARKET STATE\nBTC price 50000"
+        assert prompt_fingerprint("minute 1, call 1\n" + body) == prompt_fingerprint(
+            "minute 2, call 2\n" + body
+        )
+
+    def test_changes_with_content(self):
+        """Should differ when the market or account content changes."""
+        assert prompt_fingerprint("header\nBTC price 50000") != prompt_fingerprint(
+            "header\nBTC price 50001"
+        )
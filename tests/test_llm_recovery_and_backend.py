@@ -1,7 +1,9 @@
 import json
 import importlib
 import os
+import threading
 import unittest
+from datetime import datetime, timezone
 from unittest import mock
 
 from config.runtime_overrides import set_runtime_override, reset_runtime_overrides
@@ -79,6 +81,10 @@ class CallDeepseekApiRecoveryTests(unittest.TestCase):
         class _DummyResponse:
             status_code = 200
 
+            @property
+            def content(self_inner):
+                return json.dumps(self_inner.json()).encode()
+
             def json(self_inner):
                 return {
                     "id": "resp-1",
@@ -91,7 +97,8 @@ class CallDeepseekApiRecoveryTests(unittest.TestCase):
                     ],
                 }
 
-        with mock.patch("bot.requests.post", return_value=_DummyResponse()):
+        with mock.patch("bot.get_llm_session") as mock_get_session:
+            mock_get_session.return_value.post.return_value = _DummyResponse()
             with mock.patch("bot._recover_partial_decisions", return_value=(recovered_decisions, recovered_missing)) as mock_recover:
                 with mock.patch("bot.notify_error") as mock_notify:
                     with mock.patch("bot.log_ai_message"):
@@ -116,6 +123,10 @@ class CallDeepseekApiRecoveryTests(unittest.TestCase):
         class _DummyResponse:
             status_code = 200
 
+            @property
+            def content(self_inner):
+                return json.dumps(self_inner.json()).encode()
+
             def json(self_inner):
                 return {
                     "id": "resp-1",
@@ -128,7 +139,9 @@ class CallDeepseekApiRecoveryTests(unittest.TestCase):
                     ],
                 }
 
-        with mock.patch("bot.requests.post", return_value=_DummyResponse()) as mock_post:
+        with mock.patch("bot.get_llm_session") as mock_get_session:
+            mock_post = mock_get_session.return_value.post
+            mock_post.return_value = _DummyResponse()
             with mock.patch("bot.notify_error") as mock_notify:
                 with mock.patch("bot._log_llm_decisions"):
                     with mock.patch("bot.log_ai_message"):
@@ -141,11 +154,43 @@ class CallDeepseekApiRecoveryTests(unittest.TestCase):
         assert decisions is not None
 
         # 验证请求 payload 中的 temperature 已使用 override 值（1.5）
-        payload = mock_post.call_args.kwargs["json"]
+        payload = json.loads(mock_post.call_args.kwargs["data"])
         self.assertIn("temperature", payload)
         self.assertEqual(payload["temperature"], 1.5)
 
 
+class AwaitLlmDecisionsTests(unittest.TestCase):
+    def test_checks_sltp_while_llm_call_is_in_flight(self) -> None:
+        """SL/TP runs on the main thread until the worker's answer arrives."""
+        sltp_ran = threading.Event()
+
+        def slow_llm(prompt):
+            sltp_ran.wait(timeout=5)
+            return {"ETH": {"signal": "hold"}}
+
+        with mock.patch.object(bot, "LLM_WAIT_SLTP_INTERVAL", 0.01), \
+             mock.patch.object(bot, "positions", {"ETH": {"side": "long"}}), \
+             mock.patch("bot.call_deepseek_api", side_effect=slow_llm), \
+             mock.patch("bot.check_stop_loss_take_profit", side_effect=sltp_ran.set) as sltp:
+            decisions = bot._await_llm_decisions("prompt-text")
+
+        self.assertEqual(decisions, {"ETH": {"signal": "hold"}})
+        self.assertGreaterEqual(sltp.call_count, 1)
+
+    def test_llm_call_runs_on_a_daemon_thread(self) -> None:
+        """Exit does not wait for an in-flight LLM request."""
+        threads = []
+
+        def llm(prompt):
+            threads.append(threading.current_thread())
+            return {}
+
+        with mock.patch("bot.call_deepseek_api", side_effect=llm):
+            bot._await_llm_decisions("prompt-text")
+
+        self.assertTrue(threads[0].daemon)
+
+
 class MarketDataBackendSelectionTests(unittest.TestCase):
     def setUp(self) -> None:
         # Snapshot current backend selection and cached client so tests stay isolated.
@@ -179,5 +224,25 @@ class MarketDataBackendSelectionTests(unittest.TestCase):
         self.assertIsInstance(client, bot.BackpackMarketDataClient)
 
 
+class RequestTradingDecisionsTests(unittest.TestCase):
+    def _request_at(self, minute: int, body: str):
+        now = datetime(2025, 1, 1, 12, minute, tzinfo=timezone.utc)
+        with mock.patch.object(bot, "get_current_time", return_value=now), \
+             mock.patch.object(bot, "get_effective_interval", return_value="15m"), \
+             mock.patch.object(bot, "format_prompt_for_deepseek", return_value=f"{now}\n{body}"), \
+             mock.patch.object(bot, "_await_llm_decisions", return_value={"ETH": {"signal": "hold"}}) as call:
+            decisions = bot.request_trading_decisions()
+        return decisions, call.call_count
+
+    def test_skips_unchanged_prompt_within_the_same_bar(self) -> None:
+        """An unchanged prompt is answered once per execution bar."""
+        with mock.patch.object(bot, "_last_prompt_key", None):
+            self.assertEqual(self._request_at(1, "BTC 50000"), ({"ETH": {"signal": "hold"}}, 1))
+            self.assertEqual(self._request_at(6, "BTC 50000"), (None, 0))
+            # A changed prompt or a new bar asks again
+            self.assertEqual(self._request_at(11, "BTC 50100")[1], 1)
+            self.assertEqual(self._request_at(16, "BTC 50100")[1], 1)
+
+
 if __name__ == "__main__":  # pragma: no cover
     unittest.main()
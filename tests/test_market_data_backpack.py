@@ -140,6 +140,24 @@ class BackpackMarketDataClientTests(unittest.TestCase):
         values = client.get_open_interest_history("BTCUSDT", limit=10)
         self.assertEqual(values, [])
 
+    def test_get_prices_maps_tickers_back_to_requested_symbols(self) -> None:
+        client = bot.BackpackMarketDataClient(base_url="https://api.backpack.exchange")
+        client._session = mock.Mock()
+
+        mock_resp = mock.Mock()
+        mock_resp.status_code = 200
+        mock_resp.json.return_value = [
+            {"symbol": "BTC_USDC_PERP", "lastPrice": "50000.5"},
+            {"symbol": "ETH_USDC_PERP", "lastPrice": "bad"},
+            {"symbol": "SOL_USDC_PERP", "lastPrice": "150"},
+        ]
+        client._session.get.return_value = mock_resp
+
+        prices = client.get_prices(["BTCUSDT", "ETHUSDT"])
+
+        self.assertEqual(prices, {"BTCUSDT": 50000.5})
+        self.assertEqual(client._session.get.call_count, 1)
+
 
 class FetchMarketDataTests(unittest.TestCase):
     def test_fetch_market_data_returns_none_when_client_unavailable(self) -> None:
@@ -0,0 +1,102 @@
+import unittest
+from unittest import mock
+
+import bot
+
+
+class FetchMarketDataCacheTests(unittest.TestCase):
+    def test_fetch_market_data_reuses_snapshot_within_iteration(self) -> None:
+        """Inside an iteration a repeat lookup is served from the cache."""
+        row = [1000, "1.0", "2.0", "0.5", "1.5", "10.0", 2000, "20.0", 5, None, None, None]
+        calls: list[str] = []
+
+        class _StubClient:
+            def get_klines(self, symbol, interval, limit):
+                calls.append(symbol)
+                return [list(row) for _ in range(30)]
+
+            def get_funding_rate_history(self, symbol, limit):
+                return [0.0]
+
+        with mock.patch("bot.get_market_data_client", return_value=_StubClient()), \
+             mock.patch.object(bot, "_market_data_cache", {}):
+            first = bot.fetch_market_data("BTCUSDT")
+            second = bot.fetch_market_data("BTCUSDT")
+            bot.fetch_market_data("ETHUSDT")
+
+        self.assertIs(first, second)
+        self.assertEqual(calls, ["BTCUSDT", "ETHUSDT"])
+
+
+class FetchCoinPricesTests(unittest.TestCase):
+    def test_batches_prices_and_falls_back_for_uncovered_coins(self) -> None:
+        """One ticker request prices most coins; the rest use snapshots."""
+        batch_calls: list[list[str]] = []
+
+        class _StubClient:
+            def get_prices(self, symbols):
+                batch_calls.append(list(symbols))
+                return {"BTCUSDT": 50000.0}
+
+        with mock.patch("bot.get_market_data_client", return_value=_StubClient()), \
+             mock.patch("bot.fetch_market_data", return_value={"price": 3000.0}) as fetch, \
+             mock.patch.dict(bot._ticker_price_cache, clear=True):
+            prices = bot.fetch_coin_prices(["ETH", "BTC"])
+            again = bot.fetch_coin_prices(["BTC"])
+
+        self.assertEqual(list(prices.items()), [("ETH", 3000.0), ("BTC", 50000.0)])
+        fetch.assert_called_once_with("ETHUSDT")
+        # The second lookup is served from the ticker cache
+        self.assertEqual(again, {"BTC": 50000.0})
+        self.assertEqual(batch_calls, [["ETHUSDT", "BTCUSDT"]])
+
+    def test_streamed_prices_skip_the_ticker_request(self) -> None:
+        """Mini-ticker pushes fill the ticker cache, so no REST request is made."""
+        class _StubClient:
+            def get_prices(self, symbols):
+                raise AssertionError("unexpected ticker request")
+
+        with mock.patch("bot.get_market_data_client", return_value=_StubClient()), \
+             mock.patch.dict(bot._ticker_price_cache, clear=True):
+            bot._on_price_stream_message(
+                {"stream": "btcusdt@miniTicker", "data": {"e": "24hrMiniTicker", "s": "BTCUSDT", "c": "50123.5"}}
+            )
+            bot._on_price_stream_message({"e": "error", "m": "connection lost"})
+            prices = bot.fetch_coin_prices(["BTC"])
+
+        self.assertEqual(prices, {"BTC": 50123.5})
+
+    def test_price_stream_is_opt_in_and_binance_only(self) -> None:
+        """The stream only starts with MARKET_DATA_WS_ENABLED on the Binance backend."""
+        with mock.patch.object(bot, "_price_stream", None), \
+             mock.patch.object(bot, "MARKET_DATA_WS_ENABLED", False), \
+             mock.patch.object(bot, "MARKET_DATA_BACKEND", "binance"):
+            self.assertFalse(bot.start_price_stream())
+        with mock.patch.object(bot, "_price_stream", None), \
+             mock.patch.object(bot, "MARKET_DATA_WS_ENABLED", True), \
+             mock.patch.object(bot, "MARKET_DATA_BACKEND", "backpack"):
+            self.assertFalse(bot.start_price_stream())
+
+    def test_price_stream_subscribes_to_mini_tickers_once(self) -> None:
+        """Starting the stream opens one multiplex socket over every symbol's mini ticker."""
+        manager = mock.Mock()
+        with mock.patch.object(bot, "_price_stream", None), \
+             mock.patch.object(bot, "MARKET_DATA_WS_ENABLED", True), \
+             mock.patch.object(bot, "MARKET_DATA_BACKEND", "binance"), \
+             mock.patch.object(bot, "COIN_TO_SYMBOL", {"ETH": "ETHUSDT", "BTC": "BTCUSDT"}), \
+             mock.patch("binance.ThreadedWebsocketManager", return_value=manager), \
+             mock.patch.object(bot.atexit, "register") as register:
+            self.assertTrue(bot.start_price_stream())
+            self.assertTrue(bot.start_price_stream())
+            self.assertIs(bot._price_stream, manager)
+
+        manager.start.assert_called_once_with()
+        manager.start_multiplex_socket.assert_called_once_with(
+            callback=bot._on_price_stream_message,
+            streams=["btcusdt@miniTicker", "ethusdt@miniTicker"],
+        )
+        register.assert_called_once_with(manager.stop)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,64 @@
+"""Tests for notifications/logging.py module."""
+import csv
+
+from notifications.logging import (
+    enqueue_ai_message,
+    flush_ai_message_log,
+    log_ai_message,
+)
+
+
+def _read_rows(path):
+    with open(path, newline="") as f:
+        return list(csv.reader(f))
+
+
+class TestLogAiMessage:
+    """Tests for log_ai_message and its queued variant."""
+
+    def test_writes_full_and_recent_logs(self, tmp_path):
+        """Should append to the full log and rebuild the capped recent log."""
+        messages_csv = tmp_path / "messages.csv"
+        recent_csv = tmp_path / "recent.csv"
+        for i in range(3):
+            log_ai_message(
+                messages_csv=messages_csv,
+                messages_recent_csv=recent_csv,
+                max_recent_messages=2,
+                now_iso=f"t{i}",
+                direction="sent",
+                role="user",
+                content=f"prompt {i}",
+                metadata={"i": i} if i else None,
+            )
+
+        assert [row[0] for row in _read_rows(messages_csv)] == ["t0", "t1", "t2"]
+        recent = _read_rows(recent_csv)
+        assert recent[0] == ["timestamp", "direction", "role", "content", "metadata"]
+        assert [row[3] for row in recent[1:]] == ["prompt 1", "prompt 2"]
+        assert recent[2][4] == '{"i": 2}'
+
+    def test_enqueued_messages_are_written_in_order_after_flush(self, tmp_path):
+        """Should persist queued messages in submission order once flushed."""
+        messages_csv = tmp_path / "messages.csv"
+        recent_csv = tmp_path / "recent.csv"
+        metadata = {"model": "m"}
+        for i in range(5):
+            enqueue_ai_message(
+                messages_csv=messages_csv,
+                messages_recent_csv=recent_csv,
+                max_recent_messages=10,
+                now_iso=f"t{i}",
+                direction="sent",
+                role="user",
+                content=f"prompt {i}",
+                metadata=metadata,
+            )
+        metadata["model"] = "changed"
+
+        flush_ai_message_log()
+
+        rows = _read_rows(messages_csv)
+        assert [row[3] for row in rows] == [f"prompt {i}" for i in range(5)]
+        assert all(row[4] == '{"model": "m"}' for row in rows)
+        assert len(_read_rows(recent_csv)) == 6
@@ -1,9 +1,14 @@
 """Tests for notifications/telegram.py module."""
 import logging
+import queue
 from unittest.mock import MagicMock, patch
 import pytest
 
+from notifications import telegram as telegram_module
 from notifications.telegram import (
+    enqueue_telegram_message,
+    flush_telegram_messages,
+    get_telegram_session,
     strip_ansi_codes,
     escape_markdown,
     send_telegram_message,
@@ -52,7 +57,7 @@ class TestEscapeMarkdown:
 class TestSendTelegramMessage:
     """Tests for send_telegram_message function."""
 
-    @patch("notifications.telegram.requests.post")
+    @patch("notifications.telegram._telegram_session.post")
     def test_sends_message(self, mock_post):
         """Should send message to Telegram API."""
         mock_post.return_value.status_code = 200
@@ -71,7 +76,7 @@ class TestSendTelegramMessage:
         assert call_args[1]["json"]["text"] == "Hello World"
         assert call_args[1]["json"]["chat_id"] == "123456"
 
-    @patch("notifications.telegram.requests.post")
+    @patch("notifications.telegram._telegram_session.post")
     def test_uses_custom_chat_id(self, mock_post):
         """Should use custom chat_id when provided."""
         mock_post.return_value.status_code = 200
@@ -103,7 +108,7 @@ class TestSendTelegramMessage:
             text="Hello",
         )
 
-    @patch("notifications.telegram.requests.post")
+    @patch("notifications.telegram._telegram_session.post")
     def test_includes_parse_mode(self, mock_post):
         """Should include parse_mode in request."""
         mock_post.return_value.status_code = 200
@@ -117,7 +122,7 @@ class TestSendTelegramMessage:
         
         assert mock_post.call_args[1]["json"]["parse_mode"] == "Markdown"
 
-    @patch("notifications.telegram.requests.post")
+    @patch("notifications.telegram._telegram_session.post")
     def test_fallback_on_parse_error(self, mock_post):
         """Should retry without parse_mode on parse error."""
         # First call fails with parse error
@@ -144,6 +149,62 @@ class TestSendTelegramMessage:
         assert "parse_mode" not in second_call[1]["json"]
 
 
+class TestGetTelegramSession:
+    """Tests for get_telegram_session function."""
+
+    def test_one_session_retries_connection_errors_only(self):
+        """Should share one pooled session that retries connects but not reads."""
+        session = get_telegram_session()
+
+        assert get_telegram_session() is session
+        adapter = session.get_adapter("https://api.telegram.org/botX/sendMessage")
+        assert adapter._pool_maxsize == telegram_module.TELEGRAM_SESSION_POOL_SIZE
+        assert adapter.max_retries.total == 2
+        assert adapter.max_retries.read == 0
+
+
+class TestEnqueueTelegramMessage:
+    """Tests for enqueue_telegram_message function."""
+
+    @patch("notifications.telegram._telegram_session.post")
+    def test_sends_in_order_after_flush(self, mock_post):
+        """Should deliver queued messages in order on the background thread."""
+        mock_post.return_value = MagicMock(status_code=200)
+        for i in range(3):
+            enqueue_telegram_message(bot_token="token", default_chat_id="chat", text=f"msg {i}")
+
+        flush_telegram_messages()
+
+        assert [c.kwargs["json"]["text"] for c in mock_post.call_args_list] == ["msg 0", "msg 1", "msg 2"]
+
+    @patch("notifications.telegram._telegram_session.post")
+    def test_skips_when_not_configured(self, mock_post):
+        """Should not queue anything without a token or chat."""
+        enqueue_telegram_message(bot_token="", default_chat_id="chat", text="x")
+        enqueue_telegram_message(bot_token="token", default_chat_id=" ", text="x")
+        flush_telegram_messages()
+
+        mock_post.assert_not_called()
+
+    def test_drops_oldest_when_full(self):
+        """Should evict the oldest pending message instead of blocking."""
+        pending = queue.Queue(maxsize=2)
+        with patch.object(telegram_module, "_telegram_queue", pending), \
+             patch.object(telegram_module, "_ensure_telegram_sender"):
+            for i in range(3):
+                enqueue_telegram_message(bot_token="token", default_chat_id="chat", text=f"msg {i}")
+
+        assert [pending.get_nowait()["text"] for _ in range(2)] == ["msg 1", "msg 2"]
+
+    def test_flush_gives_up_at_the_deadline(self):
+        """Should stop waiting once the timeout passes instead of blocking exit."""
+        pending = queue.Queue()
+        pending.put({"text": "stuck"})
+        with patch.object(telegram_module, "_telegram_queue", pending), \
+             patch.object(telegram_module, "_telegram_sender", object()):
+            assert flush_telegram_messages(timeout=0.05) is False
+
+
 class TestSendEntrySignalToTelegram:
     """Tests for send_entry_signal_to_telegram function."""
 
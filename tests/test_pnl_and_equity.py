@@ -17,6 +17,7 @@ class PnlAndEquityTests(unittest.TestCase):
         self._orig_positions = copy.deepcopy(bot.positions)
         self._orig_balance = bot.balance
         self._orig_equity_history = list(bot.equity_history)
+        bot._equity_cache = None
 
     def tearDown(self) -> None:
         """Restore original global state after each test."""
@@ -179,6 +180,57 @@ class PnlAndEquityTests(unittest.TestCase):
         # total = 1150 + 10 + 50 = 1210
         self.assertAlmostEqual(total_equity, 1210.0)
 
+    def test_register_equity_snapshot_caps_history_like_a_restart(self) -> None:
+        bot.equity_history = [float(i) for i in range(11)]
+
+        with mock.patch.object(bot, "EQUITY_HISTORY_MAX_POINTS", 10):
+            # Up to a quarter window of overflow is tolerated
+            bot.register_equity_snapshot(11.0)
+            self.assertEqual(len(bot.equity_history), 12)
+            bot.register_equity_snapshot(12.0)
+
+        self.assertEqual(bot.equity_history, [float(i) for i in range(3, 13)])
+
+    @mock.patch("bot.fetch_market_data")
+    def test_calculate_total_equity_reuses_recent_value_for_unchanged_book(self, mock_fetch) -> None:
+        bot.balance = 1000.0
+        bot.positions = {
+            "BTC": {"side": "long", "entry_price": 90.0, "quantity": 1.0, "margin": 100.0},
+        }
+        mock_fetch.return_value = {"price": 100.0}
+
+        first = bot.calculate_total_equity()
+        mock_fetch.return_value = {"price": 120.0}
+        second = bot.calculate_total_equity()
+        self.assertEqual(mock_fetch.call_count, 1)
+        self.assertAlmostEqual(second, first)
+
+        # A changed position reprices immediately
+        bot.positions["BTC"]["quantity"] = 2.0
+        self.assertAlmostEqual(bot.calculate_total_equity(), 1000.0 + 100.0 + 60.0)
+        self.assertEqual(mock_fetch.call_count, 2)
+
+        # So does an expired entry
+        with mock.patch.object(bot, "MARKET_DATA_CACHE_TTL", 0.0):
+            bot.calculate_total_equity()
+        self.assertEqual(mock_fetch.call_count, 3)
+
+    @mock.patch("bot.fetch_market_data")
+    def test_calculate_total_equity_reprices_on_a_new_iteration(self, mock_fetch) -> None:
+        bot.balance = 1000.0
+        bot.positions = {
+            "BTC": {"side": "long", "entry_price": 90.0, "quantity": 1.0, "margin": 100.0},
+        }
+        mock_fetch.return_value = {"price": 100.0}
+
+        with mock.patch.object(bot, "iteration_counter", 7):
+            self.assertAlmostEqual(bot.calculate_total_equity(), 1110.0)
+        # The backtest advances one bar per iteration, well within the TTL
+        mock_fetch.return_value = {"price": 120.0}
+        with mock.patch.object(bot, "iteration_counter", 8):
+            self.assertAlmostEqual(bot.calculate_total_equity(), 1130.0)
+        self.assertEqual(mock_fetch.call_count, 2)
+
     def test_calculate_sortino_ratio_requires_enough_data(self) -> None:
         self.assertIsNone(bot.calculate_sortino_ratio([], 60.0))
         self.assertIsNone(bot.calculate_sortino_ratio([100.0], 60.0))
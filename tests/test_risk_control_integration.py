@@ -1655,7 +1655,7 @@ class KillSwitchAndStopLossTakeProfitIntegrationTests(TestCase):
              patch.object(bot, "_log_portfolio_state", MagicMock()), \
              patch.object(bot, "send_telegram_message", MagicMock()), \
              patch.object(bot, "save_state", MagicMock()), \
-             patch.object(bot, "sleep_with_countdown", MagicMock()), \
+             patch.object(bot, "sleep_until_next_check", MagicMock()), \
              patch.object(bot, "fetch_market_data", MagicMock(return_value=fake_market_data)), \
              patch.object(bot, "execute_close") as mock_execute_close:
 
@@ -112,6 +112,25 @@ class StateManagementTests(unittest.TestCase):
             self.assertEqual(pos["sl_oid"], 20)
             self.assertEqual(pos["close_oid"], 30)
 
+    def test_loaded_positions_are_shared_with_core_state(self) -> None:
+        """load_state hands bot the core.state dict, and saving keeps its entries."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            state_path = Path(tmpdir) / "state.json"
+            state_path.write_text(
+                json.dumps({"balance": 100.0, "positions": {"BTC": {"side": "long", "quantity": 1.0}}}),
+                encoding="utf-8",
+            )
+
+            with mock.patch.object(core_state, "STATE_JSON", state_path):
+                bot.load_state()
+                self.assertIs(bot.positions, core_state.positions)
+                bot.save_state()
+
+            self.assertIs(bot.positions, core_state.positions)
+            self.assertIn("BTC", bot.positions)
+            data = json.loads(state_path.read_text(encoding="utf-8"))
+            self.assertIn("BTC", data["positions"])
+
     def test_save_state_persists_balance_positions_and_iteration(self) -> None:
         with tempfile.TemporaryDirectory() as tmpdir:
             state_path = Path(tmpdir) / "state.json"
@@ -142,6 +161,126 @@ class StateManagementTests(unittest.TestCase):
             # Verify risk_control field is included (Story 7.1.4)
             self.assertIn("risk_control", data)
 
+    def test_save_state_if_changed_skips_unchanged_state(self) -> None:
+        """Only balance/position changes, or a stale iteration count, trigger a write."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            state_path = Path(tmpdir) / "state.json"
+            bot.balance = 500.0
+            bot.positions = {}
+            bot.iteration_counter = 1
+
+            with mock.patch.object(core_state, "STATE_JSON", state_path), \
+                 mock.patch.object(core_state, "_save_state_to_json", wraps=core_state._save_state_to_json) as write:
+                bot.save_state()
+                bot.save_state_if_changed()
+                self.assertEqual(write.call_count, 1)
+
+                bot.iteration_counter = 2
+                bot.save_state_if_changed()
+                self.assertEqual(write.call_count, 1)
+
+                bot.balance = 450.0
+                bot.save_state_if_changed()
+                self.assertEqual(write.call_count, 2)
+
+                bot.iteration_counter = 3
+                with mock.patch.object(core_state, "STATE_SAVE_ITERATION_STRIDE", 1):
+                    bot.save_state_if_changed()
+                self.assertEqual(write.call_count, 3)
+
+            data = json.loads(state_path.read_text(encoding="utf-8"))
+            self.assertAlmostEqual(data["balance"], 450.0)
+            self.assertEqual(data["iteration"], 3)
+
+    def test_consecutive_iterations_skip_counter_only_save(self) -> None:
+        """An iteration that only advances the counter does not rewrite the state file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            state_path = Path(tmpdir) / "state.json"
+            bot.balance = 500.0
+            bot.positions = {}
+
+            with mock.patch.object(core_state, "STATE_JSON", state_path), \
+                 mock.patch.object(core_state, "_save_state_to_json", wraps=core_state._save_state_to_json) as write, \
+                 mock.patch.object(bot, "get_effective_tradebot_loop_enabled", return_value=True), \
+                 mock.patch.object(bot, "get_binance_client", return_value=object()), \
+                 mock.patch.object(bot, "RISK_CONTROL_ENABLED", False), \
+                 mock.patch.object(bot, "calculate_total_equity", return_value=500.0), \
+                 mock.patch.object(bot, "check_risk_limits", return_value=True), \
+                 mock.patch.object(bot, "check_stop_loss_take_profit"), \
+                 mock.patch.object(bot, "request_trading_decisions", return_value=None), \
+                 mock.patch.object(bot, "_display_portfolio_summary"), \
+                 mock.patch.object(bot, "_log_portfolio_state"), \
+                 mock.patch.object(bot, "sleep_until_next_check"):
+                bot.save_state()
+                bot.balance = 450.0
+                bot._run_iteration_steps()
+                self.assertEqual(write.call_count, 2)
+
+                bot._run_iteration_steps()
+                self.assertEqual(write.call_count, 2)
+
+                # The counter alone is written once it is a full stride behind
+                for _ in range(core_state.STATE_SAVE_ITERATION_STRIDE - 2):
+                    bot._run_iteration_steps()
+                self.assertEqual(write.call_count, 2)
+                bot._run_iteration_steps()
+                self.assertEqual(write.call_count, 3)
+
+
+class IterationProfilingTests(unittest.TestCase):
+    def test_profiles_every_nth_iteration_only(self) -> None:
+        """Every PROFILE_EVERY-th iteration is run under cProfile and dumped to PROFILE_DIR."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            profile_dir = Path(tmpdir) / "profiles"
+            steps = mock.Mock()
+            with mock.patch.object(bot, "PROFILE_EVERY", 2), \
+                 mock.patch.object(bot, "PROFILE_DIR", profile_dir), \
+                 mock.patch.object(bot, "_run_iteration_steps", steps), \
+                 mock.patch.object(bot, "get_iteration_counter", side_effect=[0, 1, 2]):
+                bot._run_iteration()
+                self.assertFalse(profile_dir.exists())
+                bot._run_iteration()
+                bot._run_iteration()
+
+            self.assertEqual(steps.call_count, 3)
+            self.assertEqual(
+                sorted(p.name for p in profile_dir.iterdir()),
+                ["iteration-2.prof"],
+            )
+
+
+class BackpackAccountSnapshotBackoffTests(unittest.TestCase):
+    def setUp(self) -> None:
+        bot._record_backpack_snapshot_result(True)
+
+    def tearDown(self) -> None:
+        bot._record_backpack_snapshot_result(True)
+
+    def test_failed_snapshot_backs_off_until_cooldown_expires(self) -> None:
+        client = mock.Mock()
+        client.get_account_snapshot.side_effect = RuntimeError("HTTP 503")
+        clock = [100.0]
+
+        with mock.patch.object(bot, "_get_backpack_account_client", return_value=client), \
+             mock.patch.object(bot.time, "monotonic", side_effect=lambda: clock[0]):
+            self.assertIsNone(bot._get_backpack_futures_snapshot())
+            # Within the 2 s cooldown no request is made
+            clock[0] = 101.0
+            self.assertIsNone(bot._get_backpack_futures_snapshot())
+            self.assertEqual(client.get_account_snapshot.call_count, 1)
+
+            # After it the exchange is tried again; a second failure doubles the wait
+            clock[0] = 102.5
+            self.assertIsNone(bot._get_backpack_futures_snapshot())
+            self.assertEqual(client.get_account_snapshot.call_count, 2)
+            self.assertAlmostEqual(bot._backpack_snapshot_retry_at, 106.5)
+
+            client.get_account_snapshot.side_effect = None
+            client.get_account_snapshot.return_value = {"balance": 1.0}
+            clock[0] = 107.0
+            self.assertEqual(bot._get_backpack_futures_snapshot(), {"balance": 1.0})
+            self.assertEqual(bot._backpack_snapshot_failures, 0)
+
 
 if __name__ == "__main__":  # pragma: no cover
     unittest.main()
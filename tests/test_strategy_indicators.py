@@ -1,17 +1,52 @@
 """Tests for strategy/indicators.py module."""
+from unittest.mock import patch
+
 import numpy as np
 import pandas as pd
 import pytest
 
 from strategy.indicators import (
+    _ema,
+    _ema_kernel,
     calculate_rsi_series,
     add_indicator_columns,
+    attach_columns,
     calculate_atr_series,
+    calculate_indicator_columns,
     calculate_indicators,
+    calculate_sma_series,
+    calculate_swing_levels,
     round_series,
 )
 
 
+class TestEma:
+    """Tests for _ema helper."""
+
+    def test_matches_pandas_ewm(self):
+        """Should match pandas ewm(adjust=False) on finite input."""
+        values = 100 + np.cumsum(np.random.default_rng(0).normal(size=120))
+        expected = pd.Series(values).ewm(span=20, adjust=False).mean().to_numpy()
+        np.testing.assert_allclose(_ema(values, 2.0 / 21.0), expected, rtol=1e-12)
+
+    def test_nan_input_matches_pandas(self):
+        """Should fall back to pandas semantics when input has NaN."""
+        values = np.array([1.0, 2.0, np.nan, 4.0, 5.0])
+        expected = pd.Series(values).ewm(alpha=0.5, adjust=False).mean().to_numpy()
+        np.testing.assert_allclose(_ema(values, 0.5), expected)
+
+    def test_empty_input(self):
+        """Should return an empty array for empty input."""
+        assert _ema(np.array([], dtype=np.float64), 0.5).size == 0
+
+    def test_kernel_matches_list_loop(self):
+        """Should give the same values from the indexed kernel as from _ema's loop."""
+        values = 100 + np.cumsum(np.random.default_rng(1).normal(size=200))
+        with patch("strategy.indicators.NUMBA_AVAILABLE", False):
+            expected = _ema(values, 0.1)
+        np.testing.assert_allclose(_ema_kernel(values, 0.1), expected, rtol=1e-12)
+
+
 class TestCalculateRsiSeries:
     """Tests for calculate_rsi_series function."""
 
@@ -102,6 +137,25 @@ class TestAddIndicatorColumns:
         ema20_cols = [c for c in result.columns if c == "ema20"]
         assert len(ema20_cols) == 1
 
+    def test_reenriching_overwrites_columns(self, sample_df):
+        """Should overwrite existing indicator columns instead of duplicating them."""
+        once = add_indicator_columns(sample_df)
+        twice = add_indicator_columns(once)
+        assert list(twice.columns) == list(once.columns)
+        pd.testing.assert_frame_equal(twice, once)
+
+    def test_matches_pandas_reference(self, sample_df):
+        """Should match the pandas ewm-based EMA/MACD definitions."""
+        result = add_indicator_columns(sample_df, ema_lengths=(12, 20), macd_params=(12, 26, 9))
+        close = sample_df["close"]
+        ema12 = close.ewm(span=12, adjust=False).mean()
+        macd = ema12 - close.ewm(span=26, adjust=False).mean()
+        np.testing.assert_allclose(result["ema12"], ema12, rtol=1e-12)
+        np.testing.assert_allclose(result["macd"], macd, rtol=1e-9)
+        np.testing.assert_allclose(
+            result["macd_signal"], macd.ewm(span=9, adjust=False).mean(), rtol=1e-9
+        )
+
     def test_default_parameters(self, sample_df):
         """Should work with default parameters."""
         result = add_indicator_columns(sample_df)
@@ -110,6 +164,29 @@ class TestAddIndicatorColumns:
         assert "macd" in result.columns
 
 
+class TestCalculateIndicatorColumns:
+    """Tests for calculate_indicator_columns and attach_columns."""
+
+    def test_returns_arrays_matching_add_indicator_columns(self):
+        """Should return the same values add_indicator_columns attaches."""
+        df = pd.DataFrame({"close": 100 + np.cumsum(np.linspace(-1, 1, 60))})
+        columns = calculate_indicator_columns(df, ema_lengths=(20, 50))
+
+        assert list(columns) == ["ema20", "ema50", "rsi14", "macd", "macd_signal"]
+        pd.testing.assert_frame_equal(
+            attach_columns(df, columns),
+            add_indicator_columns(df, ema_lengths=(20, 50)),
+        )
+
+    def test_attach_columns_appends_in_order(self):
+        """Should append new columns after the existing ones without mutating df."""
+        df = pd.DataFrame({"close": [1.0, 2.0]})
+        result = attach_columns(df, {"a": np.array([3.0, 4.0]), "b": [5.0, 6.0]})
+
+        assert list(result.columns) == ["close", "a", "b"]
+        assert list(df.columns) == ["close"]
+
+
 class TestCalculateAtrSeries:
     """Tests for calculate_atr_series function."""
 
@@ -158,6 +235,52 @@ class TestCalculateAtrSeries:
         assert atr_high > atr_low
 
 
+class TestCalculateSmaSeries:
+    """Tests for calculate_sma_series function."""
+
+    def test_matches_pandas_rolling_mean(self):
+        """Should match pandas rolling(window).mean()."""
+        values = pd.Series(np.random.default_rng(1).uniform(1e3, 1e6, size=100))
+        expected = values.rolling(window=20).mean()
+        pd.testing.assert_series_equal(calculate_sma_series(values, 20), expected, rtol=1e-12)
+
+    def test_short_input_is_all_nan(self):
+        """Should return NaN everywhere when there are fewer rows than the window."""
+        result = calculate_sma_series(pd.Series([1.0, 2.0]), 5)
+        assert result.isna().all()
+        assert len(result) == 2
+
+    def test_nan_input_matches_pandas(self):
+        """Should keep pandas NaN semantics for windows containing NaN."""
+        values = pd.Series([1.0, np.nan, 3.0, 4.0, 5.0, 6.0])
+        expected = values.rolling(window=3).mean()
+        pd.testing.assert_series_equal(calculate_sma_series(values, 3), expected)
+
+
+class TestCalculateSwingLevels:
+    """Tests for calculate_swing_levels function."""
+
+    @pytest.mark.parametrize("window", [4, 5])
+    def test_matches_centered_pandas_rolling(self, window):
+        """Should match rolling(window, center=True).max()/.min()."""
+        rng = np.random.default_rng(2)
+        df = pd.DataFrame({"high": rng.uniform(100, 110, 50), "low": rng.uniform(90, 100, 50)})
+        swing_high, swing_low = calculate_swing_levels(df, window)
+        pd.testing.assert_series_equal(
+            swing_high, df["high"].rolling(window=window, center=True).max(), check_names=False
+        )
+        pd.testing.assert_series_equal(
+            swing_low, df["low"].rolling(window=window, center=True).min(), check_names=False
+        )
+
+    def test_short_frame_is_all_nan(self):
+        """Should return NaN everywhere when the frame is shorter than the window."""
+        df = pd.DataFrame({"high": [1.0, 2.0], "low": [0.5, 1.5]})
+        swing_high, swing_low = calculate_swing_levels(df, 5)
+        assert swing_high.isna().all()
+        assert swing_low.isna().all()
+
+
 class TestCalculateIndicators:
     """Tests for calculate_indicators function."""
 
@@ -0,0 +1,47 @@
+"""Tests for utils/json_codec.py module."""
+import json
+from unittest.mock import patch
+
+import pytest
+
+from utils import json_codec
+from utils.json_codec import json_dumps, json_loads
+
+
+class TestJsonLoads:
+    """Tests for json_loads function."""
+
+    def test_decodes_bytes(self):
+        """Should decode a UTF-8 bytes payload."""
+        assert json_loads(b'{"a": [1, 2.5, "x"]}') == {"a": [1, 2.5, "x"]}
+
+    def test_decodes_str(self):
+        """Should decode a text payload."""
+        assert json_loads('{"coin": "BTC"}') == {"coin": "BTC"}
+
+    def test_invalid_payload_raises_json_decode_error(self):
+        """Should raise json.JSONDecodeError for malformed JSON."""
+        with pytest.raises(json.JSONDecodeError):
+            json_loads(b'{"a": ')
+
+    def test_falls_back_to_stdlib_without_orjson(self):
+        """Should decode with the standard library when orjson is unavailable."""
+        with patch.object(json_codec, "_orjson", None):
+            assert json_loads(b'{"a": 1}') == {"a": 1}
+
+
+class TestJsonDumps:
+    """Tests for json_dumps function."""
+
+    def test_round_trips_payload_as_bytes(self):
+        """Should encode to UTF-8 bytes that decode back to the same object."""
+        payload = {"model": "m", "temperature": 0.7, "messages": [{"role": "user", "content": "价格"}]}
+        encoded = json_dumps(payload)
+
+        assert isinstance(encoded, bytes)
+        assert json.loads(encoded) == payload
+
+    def test_falls_back_to_stdlib_without_orjson(self):
+        """Should encode compact UTF-8 with the standard library when orjson is unavailable."""
+        with patch.object(json_codec, "_orjson", None):
+            assert json_dumps({"a": [1, "é"]}) == '{"a":[1,"é"]}'.encode("utf-8")
@@ -1,8 +1,11 @@
 """Utility functions for the trading bot."""
 from utils.text import strip_ansi_codes, escape_markdown, ANSI_ESCAPE_RE
+from utils.json_codec import json_dumps, json_loads
 
 __all__ = [
     "strip_ansi_codes",
     "escape_markdown",
     "ANSI_ESCAPE_RE",
+    "json_dumps",
+    "json_loads",
 ]
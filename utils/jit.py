@@ -0,0 +1,33 @@
+"""Optional numba compilation for numeric kernels.
+
+``njit`` compiles a function in numba's nopython mode when numba is
+installed and returns it unchanged otherwise, so indicator kernels can be
+decorated unconditionally. Callers that have a faster pure-Python variant
+can check ``NUMBA_AVAILABLE`` to choose between them.
+"""
+from __future__ import annotations
+
+from typing import Callable, TypeVar
+
+try:
+    from numba import njit as _numba_njit
+except ImportError:  # pragma: no cover - numba is an optional speedup
+    _numba_njit = None
+
+F = TypeVar("F", bound=Callable)
+
+NUMBA_AVAILABLE = _numba_njit is not None
+
+
+def njit(func: F) -> F:
+    """Compile ``func`` with numba (cached on disk) if available.
+
+    Args:
+        func: Function using only numba-supported numpy/scalar operations.
+
+    Returns:
+        The compiled dispatcher, or ``func`` itself without numba.
+    """
+    if _numba_njit is None:
+        return func
+    return _numba_njit(cache=True)(func)
@@ -0,0 +1,50 @@
+"""JSON encoding/decoding helpers.
+
+This module routes JSON encoding and parsing through ``orjson`` when it is
+installed and falls back to the standard library otherwise, so hot paths can
+use a single call site regardless of the environment.
+"""
+from __future__ import annotations
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    _orjson = None
+
+
+def json_loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """Deserialize a JSON document from bytes or text.
+    
+    Args:
+        data: Raw JSON payload, e.g. ``response.content``.
+        
+    Returns:
+        The decoded Python object.
+        
+    Raises:
+        json.JSONDecodeError: If the payload is not valid JSON (orjson's
+            error type subclasses it).
+    """
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any) -> bytes:
+    """Serialize an object to compact UTF-8 JSON bytes.
+    
+    Suitable as a request body (``data=``) alongside an explicit
+    ``Content-Type: application/json`` header.
+    
+    Args:
+        obj: JSON-compatible object with string keys.
+        
+    Returns:
+        The encoded document.
+    """
+    if _orjson is not None:
+        return _orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")